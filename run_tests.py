@@ -17,7 +17,18 @@ def run_all_tests():
     test_modules = [
         'test_config_manager',
         'test_progress_tracker', 
-        'test_utilities'
+        'test_utilities',
+        'test_snapshot_fetch',
+        'test_inventory_cache',
+        'test_snapshot_model',
+        'test_snapshot_filters',
+        'test_vm_name_index',
+        'test_task_monitor',
+        'test_job_journal',
+        'test_auto_connect',
+        'test_connection_health',
+        'test_session_registry',
+        'test_creator_attribution'
     ]
     
     suite = unittest.TestSuite()
@@ -8,11 +8,194 @@ It includes a collapsible filter panel with various filter types for all snapsho
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QComboBox, QDateEdit, QPushButton,
                             QFrame, QGridLayout, QSizePolicy, QCheckBox, QSpinBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QDate, QTimer
 from PyQt6.QtGui import QIcon
 from datetime import datetime, timedelta
 import re
 
+# Quiet period after the last keystroke in a text filter before filters_changed fires
+FILTER_DEBOUNCE_MS = 250
+
+
+def get_snapshot_type(snapshot_data):
+    """
+    Get the snapshot type label shown in the Snapshot Type column.
+    
+    Args:
+        snapshot_data (dict): Snapshot data with 'has_children' and 'is_child'
+        
+    Returns:
+        str: Snapshot type label
+    """
+    has_children = snapshot_data.get('has_children', False)
+    is_child = snapshot_data.get('is_child', False)
+    
+    if has_children and is_child:
+        return "Part of Chain (Middle)"
+    elif has_children:
+        return "Has Child Snapshots (Delete Manually)"
+    elif is_child:
+        return "Child Snapshot"
+    return "Independent Snapshot"
+
+
+def parse_created(created_str):
+    """
+    Parse a snapshot 'created' timestamp.
+    
+    Args:
+        created_str (str): Timestamp formatted as 'YYYY-MM-DD HH:MM'
+        
+    Returns:
+        datetime: Parsed timestamp, or None if it can't be parsed
+    """
+    try:
+        return datetime.strptime(created_str, '%Y-%m-%d %H:%M')
+    except (ValueError, TypeError):
+        return None
+
+
+def created_timestamp(snapshot_data):
+    """
+    Get the creation time of a snapshot as Unix epoch seconds.
+    
+    Records carry 'created_ts'; records that only have a 'created' string
+    (older journal entries and caches) are parsed as local time.
+    
+    Args:
+        snapshot_data (dict): Snapshot data
+        
+    Returns:
+        int: Epoch seconds, or None if the creation time is unknown
+    """
+    created_ts = snapshot_data.get('created_ts')
+    if created_ts is None:
+        created_at = parse_created(snapshot_data.get('created', ''))
+        if created_at is not None:
+            created_ts = int(created_at.timestamp())
+    return created_ts
+
+
+def format_created(created_ts):
+    """
+    Format a creation time for display.
+    
+    Args:
+        created_ts (int): Epoch seconds, or None
+        
+    Returns:
+        str: Local time as 'YYYY-MM-DD HH:MM', empty if unknown
+    """
+    if created_ts is None:
+        return ''
+    return datetime.fromtimestamp(created_ts).strftime('%Y-%m-%d %H:%M')
+
+
+class SnapshotFilter:
+    """
+    Compiled snapshot filter.
+    
+    Holds the filter panel state read once, with search terms lower-cased and
+    the date range turned into epoch bounds, so testing a row is a few
+    plain comparisons. Rows are tested through a filter key built once per
+    snapshot with build_key().
+    """
+    __slots__ = ('vm_name', 'snapshot_search', 'vcenter', 'created_by', 'snapshot_type',
+                 'created_from', 'created_before', 'patching_only')
+
+    def __init__(self, vm_name='', snapshot_search='', vcenter='', created_by='', snapshot_type='',
+                 date_from=None, date_to=None, patching_only=False):
+        self.vm_name = vm_name.lower()
+        self.snapshot_search = snapshot_search.lower()
+        self.vcenter = vcenter
+        self.created_by = created_by
+        self.snapshot_type = snapshot_type
+        # Dates are inclusive; compare creation times against [from 00:00, day after 'to' 00:00)
+        # local time, as epoch seconds like the records carry
+        self.created_from = (datetime.combine(date_from, datetime.min.time()).timestamp()
+                             if date_from else None)
+        self.created_before = ((datetime.combine(date_to, datetime.min.time()) + timedelta(days=1)).timestamp()
+                               if date_to else None)
+        self.patching_only = patching_only
+
+    @staticmethod
+    def build_key(snapshot_data, created_ts=None):
+        """
+        Build the filter key of a snapshot.
+        
+        Args:
+            snapshot_data (dict): Snapshot data
+            created_ts (int): Creation time in epoch seconds, taken from
+                snapshot_data if not given
+                
+        Returns:
+            tuple: (vm name, snapshot name, description) lower-cased, vCenter,
+                creator, snapshot type and creation time
+        """
+        if created_ts is None:
+            created_ts = created_timestamp(snapshot_data)
+        return (
+            snapshot_data.get('vm_name', '').lower(),
+            snapshot_data.get('name', '').lower(),
+            snapshot_data.get('description', '').lower(),
+            snapshot_data.get('vcenter', ''),
+            snapshot_data.get('created_by', 'Unknown'),
+            get_snapshot_type(snapshot_data),
+            created_ts,
+        )
+
+    def matches_key(self, key):
+        """
+        Check if a snapshot filter key matches this filter.
+        
+        Args:
+            key (tuple): Filter key from build_key()
+            
+        Returns:
+            bool: True if the snapshot matches
+        """
+        vm_name, name, description, vcenter, created_by, snapshot_type, created_ts = key
+        
+        # Text filters (case-insensitive contains)
+        if self.vm_name and self.vm_name not in vm_name:
+            return False
+        
+        # Search term must match either snapshot name OR description
+        if self.snapshot_search and self.snapshot_search not in name and self.snapshot_search not in description:
+            return False
+        
+        # Dropdown filters (exact match)
+        if self.vcenter and self.vcenter != vcenter:
+            return False
+        if self.created_by and self.created_by != created_by:
+            return False
+        if self.snapshot_type and self.snapshot_type != snapshot_type:
+            return False
+        
+        # Date range filter; snapshots without a known date are not filtered by date
+        if created_ts is not None:
+            if self.created_from is not None and created_ts < self.created_from:
+                return False
+            if self.created_before is not None and created_ts >= self.created_before:
+                return False
+        
+        if self.patching_only and 'patch' not in name:
+            return False
+        
+        return True
+
+    def matches(self, snapshot_data):
+        """
+        Check if a snapshot matches this filter.
+        
+        Args:
+            snapshot_data (dict): Snapshot data to test
+            
+        Returns:
+            bool: True if the snapshot matches
+        """
+        return self.matches_key(self.build_key(snapshot_data))
+
 
 class SnapshotFilterPanel(QWidget):
     """
@@ -26,6 +209,14 @@ class SnapshotFilterPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_expanded = False
+        self._dropdown_values = None  # (vCenters, creators) last shown in the dropdowns
+        
+        # Typing restarts this timer so a burst of keystrokes triggers one filter pass
+        self.text_filter_timer = QTimer(self)
+        self.text_filter_timer.setSingleShot(True)
+        self.text_filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.text_filter_timer.timeout.connect(self.filters_changed.emit)
+        
         self.setup_ui()
         self.connect_signals()
         
@@ -156,9 +347,9 @@ class SnapshotFilterPanel(QWidget):
         
     def connect_signals(self):
         """Connect all filter controls to the signal"""
-        # Text filters
-        self.vm_name_filter.textChanged.connect(self.filters_changed.emit)
-        self.snapshot_search_filter.textChanged.connect(self.filters_changed.emit)
+        # Text filters are debounced
+        self.vm_name_filter.textChanged.connect(self.text_filter_timer.start)
+        self.snapshot_search_filter.textChanged.connect(self.text_filter_timer.start)
         
         # Dropdown filters
         self.vcenter_filter.currentTextChanged.connect(self.filters_changed.emit)
@@ -207,6 +398,10 @@ class SnapshotFilterPanel(QWidget):
         """
         Update dropdown filter options based on available snapshot data.
         
+        The dropdowns are only rebuilt when the set of values changed, and
+        their signals are blocked while rebuilding so a refresh doesn't trigger
+        a filter pass unless the selection actually changed.
+        
         Args:
             snapshots_data (dict): Dictionary of snapshot data keyed by snapshot ID
         """
@@ -218,6 +413,14 @@ class SnapshotFilterPanel(QWidget):
             vcenters.add(snapshot_data.get('vcenter', ''))
             creators.add(snapshot_data.get('created_by', 'Unknown'))
         
+        if (vcenters, creators) == self._dropdown_values:
+            return
+        self._dropdown_values = (vcenters, creators)
+        
+        selection_before = (self.vcenter_filter.currentText(), self.created_by_filter.currentText())
+        self.vcenter_filter.blockSignals(True)
+        self.created_by_filter.blockSignals(True)
+        
         # Update vCenter dropdown
         current_vcenter = self.vcenter_filter.currentText()
         self.vcenter_filter.clear()
@@ -244,6 +447,12 @@ class SnapshotFilterPanel(QWidget):
         index = self.created_by_filter.findText(current_creator)
         if index >= 0:
             self.created_by_filter.setCurrentIndex(index)
+        
+        self.vcenter_filter.blockSignals(False)
+        self.created_by_filter.blockSignals(False)
+        
+        if (self.vcenter_filter.currentText(), self.created_by_filter.currentText()) != selection_before:
+            self.filters_changed.emit()
     
     def get_active_filters(self):
         """
@@ -264,71 +473,41 @@ class SnapshotFilterPanel(QWidget):
             'date_to': self.date_to_filter.date().toPyDate()
         }
     
-    def matches_filters(self, snapshot_data):
+    def compile_filters(self, patching_only=False):
         """
-        Check if a snapshot matches all active filters.
+        Compile the current filter state into a predicate for many rows.
         
         Args:
-            snapshot_data (dict): Snapshot data to test
+            patching_only (bool): Only match snapshots with 'patch' in the name
             
         Returns:
-            bool: True if snapshot matches all filters
+            SnapshotFilter: Filter reading the widgets' state once
         """
         filters = self.get_active_filters()
+        return SnapshotFilter(
+            vm_name=filters['vm_name'],
+            snapshot_search=filters['snapshot_search'],
+            vcenter=filters['vcenter'],
+            created_by=filters['created_by'],
+            snapshot_type=filters['snapshot_type'],
+            date_from=filters['date_from'],
+            date_to=filters['date_to'],
+            patching_only=patching_only
+        )
+    
+    def matches_filters(self, snapshot_data):
+        """
+        Check if a snapshot matches all active filters.
         
-        # Text filters (case-insensitive contains)
-        if filters['vm_name'] and filters['vm_name'].lower() not in snapshot_data.get('vm_name', '').lower():
-            return False
-            
-        # Combined snapshot name/description search
-        if filters['snapshot_search']:
-            search_term = filters['snapshot_search'].lower()
-            snapshot_name = snapshot_data.get('name', '').lower()
-            description = snapshot_data.get('description', '').lower()
-            
-            # Search term must match either snapshot name OR description
-            if search_term not in snapshot_name and search_term not in description:
-                return False
+        To test many snapshots, compile the filters once with compile_filters().
         
-        # Dropdown filters (exact match)
-        if filters['vcenter'] and filters['vcenter'] != snapshot_data.get('vcenter', ''):
-            return False
-            
-        if filters['created_by'] and filters['created_by'] != snapshot_data.get('created_by', 'Unknown'):
-            return False
-        
-        # Snapshot type filter
-        if filters['snapshot_type']:
-            # Get the snapshot type from the data
-            has_children = snapshot_data.get('has_children', False)
-            is_child = snapshot_data.get('is_child', False)
+        Args:
+            snapshot_data (dict): Snapshot data to test
             
-            if has_children and is_child:
-                snapshot_type = "Part of Chain (Middle)"
-            elif has_children:
-                snapshot_type = "Has Child Snapshots (Delete Manually)"
-            elif is_child:
-                snapshot_type = "Child Snapshot"
-            else:
-                snapshot_type = "Independent Snapshot"
-                
-            if filters['snapshot_type'] != snapshot_type:
-                return False
-        
-        # Date range filter
-        try:
-            created_str = snapshot_data.get('created', '')
-            if created_str:
-                # Parse the created date (format: 'YYYY-MM-DD HH:MM')
-                created_date = datetime.strptime(created_str, '%Y-%m-%d %H:%M').date()
-                
-                if created_date < filters['date_from'] or created_date > filters['date_to']:
-                    return False
-        except (ValueError, TypeError):
-            # If date parsing fails, don't filter based on date
-            pass
-        
-        return True
+        Returns:
+            bool: True if snapshot matches all filters
+        """
+        return self.compile_filters().matches(snapshot_data)
     
     def reset_all_filters_to_defaults(self):
         """
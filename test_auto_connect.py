@@ -0,0 +1,133 @@
+import unittest
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+from vmware_snapshot_manager import AutoConnectWorker, connect_vcenter
+
+class TestAutoConnectWorker(unittest.TestCase):
+    def setUp(self):
+        """Set up saved servers whose passwords are all in the keyring."""
+        self.config_manager = MagicMock()
+        self.config_manager.get_password.side_effect = lambda hostname, username: f"{hostname}-secret"
+        self.connections = {}
+
+    def test_connections_are_reported_as_each_finishes(self):
+        """Test a fast server is reported while a slow one is still connecting."""
+        fast_reported = threading.Event()
+        fast_si, slow_si = MagicMock(), MagicMock()
+
+        def fake_connect(hostname, username, password, timeout):
+            if hostname == 'slow':
+                # Only returns once the fast connection has been emitted
+                self.assertTrue(fast_reported.wait(5))
+                return slow_si
+            return fast_si
+
+        worker = AutoConnectWorker({'slow': 'admin', 'fast': 'admin'}, self.config_manager, timeout=3)
+        reported = []
+
+        def on_connection(hostname, si, credentials):
+            reported.append((hostname, si, credentials['password']))
+            fast_reported.set()
+        worker.connection_made.connect(on_connection)
+
+        with patch('vmware_snapshot_manager.connect_vcenter', side_effect=fake_connect) as connect:
+            worker.run()
+
+        self.assertEqual(reported, [('fast', fast_si, 'fast-secret'), ('slow', slow_si, 'slow-secret')])
+        self.assertEqual({call[0][3] for call in connect.call_args_list}, {3})
+
+    def test_failed_server_reports_error_and_returns_none(self):
+        """Test a timeout is reported with the per-connection limit instead of raised."""
+        worker = AutoConnectWorker({'vc1': 'admin'}, self.config_manager, timeout=3)
+        errors = []
+        worker.error.connect(errors.append)
+
+        with patch('vmware_snapshot_manager.connect_vcenter', side_effect=socket.timeout()):
+            si = worker.connect('vc1', 'admin', 'secret')
+
+        self.assertIsNone(si)
+        self.assertEqual(errors, ["Connection to vc1 timed out after 3 seconds"])
+
+    def test_socket_default_timeout_is_untouched(self):
+        """Test auto-connect doesn't change the process-wide socket timeout."""
+        worker = AutoConnectWorker({'vc1': 'admin'}, self.config_manager)
+
+        with patch('vmware_snapshot_manager.connect_vcenter', return_value=MagicMock()):
+            worker.run()
+
+        self.assertIsNone(socket.getdefaulttimeout())
+
+    def test_saved_session_is_resumed_without_login(self):
+        """Test a still-valid saved session is used instead of logging in."""
+        self.config_manager.get_session.return_value = 'session-abc'
+        si = MagicMock()
+        si._stub.GetSessionId.return_value = 'session-abc'
+        worker = AutoConnectWorker({'vc1': 'admin'}, self.config_manager, timeout=3, reuse_sessions=True)
+        reported = []
+        worker.connection_made.connect(lambda hostname, si, credentials: reported.append((hostname, si)))
+
+        with patch('vmware_snapshot_manager.resume_vcenter_session', return_value=si) as resume, \
+             patch('vmware_snapshot_manager.connect_vcenter') as connect:
+            worker.run()
+
+        resume.assert_called_once_with('vc1', 'session-abc', 3)
+        connect.assert_not_called()
+        self.assertEqual(reported, [('vc1', si)])
+        self.config_manager.save_session.assert_not_called()
+
+    def test_expired_session_falls_back_to_login(self):
+        """Test an expired session leads to a full login whose session is saved."""
+        self.config_manager.get_session.return_value = 'session-old'
+        new_si = MagicMock()
+        new_si._stub.GetSessionId.return_value = 'session-new'
+        worker = AutoConnectWorker({'vc1': 'admin'}, self.config_manager, timeout=3, reuse_sessions=True)
+
+        with patch('vmware_snapshot_manager.resume_vcenter_session', return_value=None), \
+             patch('vmware_snapshot_manager.connect_vcenter', return_value=new_si) as connect:
+            worker.run()
+
+        connect.assert_called_once_with('vc1', 'admin', 'vc1-secret', 3)
+        self.config_manager.save_session.assert_called_once_with('vc1', 'admin', 'session-new')
+
+    def test_sessions_are_ignored_unless_enabled(self):
+        """Test saved sessions aren't read when session reuse is off."""
+        worker = AutoConnectWorker({'vc1': 'admin'}, self.config_manager)
+
+        with patch('vmware_snapshot_manager.resume_vcenter_session') as resume, \
+             patch('vmware_snapshot_manager.connect_vcenter', return_value=MagicMock()):
+            worker.run()
+
+        resume.assert_not_called()
+        self.config_manager.get_session.assert_not_called()
+
+class TestConnectVCenter(unittest.TestCase):
+    def test_unreachable_host_fails_within_timeout(self):
+        """Test a host that doesn't answer gives up after the connect timeout, before version discovery."""
+        with patch('socket.create_connection', side_effect=socket.timeout()) as create_connection, \
+             patch('pyVim.connect.HTTPSConnection') as discovery:
+            with self.assertRaises(socket.timeout):
+                connect_vcenter('vc1.example.com:8443', 'admin', 'secret', timeout=3)
+
+        create_connection.assert_called_once_with(('vc1.example.com', 8443), timeout=3)
+        discovery.assert_not_called()
+
+    def test_reachable_host_goes_through_smart_connect(self):
+        """Test the reachability check lets SmartConnect's own discovery run against the host."""
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+        port = listener.getsockname()[1]
+        discovery = MagicMock()
+        discovery.return_value.getresponse.return_value.status = 404
+
+        with patch('pyVim.connect.HTTPSConnection', discovery):
+            with self.assertRaisesRegex(Exception, 'not a VIM server'):
+                connect_vcenter(f'127.0.0.1:{port}', 'admin', 'secret', timeout=3)
+
+        self.assertEqual(discovery.call_args[0][0], '127.0.0.1')
+        self.assertEqual(discovery.call_args[1]['port'], port)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -122,6 +122,27 @@ class TestConfigManager(unittest.TestCase):
         
         self.assertIsNone(password)
     
+    @patch('vmware_snapshot_manager.keyring')
+    def test_session_is_stored_apart_from_password(self, mock_keyring):
+        """Test a session ID gets its own keyring entry next to the password."""
+        result = self.config_manager.save_session('vcenter1.com', 'admin', 'session-abc')
+        
+        self.assertTrue(result)
+        mock_keyring.set_password.assert_called_once_with(
+            'vmware_snapshot_manager', 
+            'vcenter1.com:admin:session', 
+            'session-abc'
+        )
+    
+    @patch('vmware_snapshot_manager.keyring')
+    def test_clear_session_without_saved_session(self, mock_keyring):
+        """Test clearing a session that was never saved doesn't touch the keyring."""
+        mock_keyring.get_password.return_value = None
+        
+        self.config_manager.clear_session('vcenter1.com', 'admin')
+        
+        mock_keyring.delete_password.assert_not_called()
+    
     @patch('builtins.open')
     def test_save_servers_file_permission_error(self, mock_open):
         """Test saving servers with file permission error."""
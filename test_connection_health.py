@@ -0,0 +1,123 @@
+import unittest
+import time
+import threading
+from unittest.mock import MagicMock, patch
+from vmware_snapshot_manager import ConnectionHealthMonitor
+
+class TestConnectionHealthMonitor(unittest.TestCase):
+    def setUp(self):
+        """Set up a monitor tracking one healthy connection with credentials."""
+        self.monitor = ConnectionHealthMonitor(interval=120, backoff_min=10, backoff_max=60, timeout=5,
+                                               clone=lambda si, timeout: si)
+        self.si = MagicMock()
+        self.monitor.track('vc1', self.si, {'username': 'admin', 'password': 'secret'})
+        self.changes = []
+        self.monitor.health_changed.connect(lambda hostname, state: self.changes.append((hostname, state)))
+
+    def delay(self, hostname):
+        return self.monitor.hosts[hostname]['next_check'] - time.monotonic()
+
+    def test_healthy_check_is_a_keepalive(self):
+        """Test a working session is pinged and rescheduled without a state change."""
+        self.monitor.check_host('vc1')
+
+        self.si.RetrieveContent.assert_called_once()
+        self.assertEqual(self.monitor.health('vc1'), 'ok')
+        self.assertEqual(self.changes, [])
+        self.assertAlmostEqual(self.delay('vc1'), 120, delta=1)
+
+    def test_lost_connection_is_reconnected(self):
+        """Test a failed check logs back in and hands out the new session."""
+        self.si.RetrieveContent.side_effect = OSError("connection reset")
+        new_si = MagicMock()
+        reconnected = []
+        self.monitor.reconnected.connect(lambda hostname, si: reconnected.append((hostname, si)))
+
+        with patch('vmware_snapshot_manager.connect_vcenter', return_value=new_si) as connect:
+            self.monitor.check_host('vc1')
+
+        connect.assert_called_once_with('vc1', 'admin', 'secret', 5)
+        self.assertEqual(reconnected, [('vc1', new_si)])
+        self.assertEqual(self.changes, [('vc1', 'reconnecting'), ('vc1', 'ok')])
+        self.assertIs(self.monitor.hosts['vc1']['si'], new_si)
+
+    def test_expired_session_is_reconnected(self):
+        """Test a session the server no longer knows is logged back in though calls still answer."""
+        self.si.RetrieveContent.return_value.sessionManager.currentSession = None
+        new_si = MagicMock()
+
+        with patch('vmware_snapshot_manager.connect_vcenter', return_value=new_si) as connect:
+            self.monitor.check_host('vc1')
+
+        connect.assert_called_once_with('vc1', 'admin', 'secret', 5)
+        self.assertIs(self.monitor.hosts['vc1']['si'], new_si)
+        self.assertEqual(self.changes, [('vc1', 'reconnecting'), ('vc1', 'ok')])
+
+    def test_failed_reconnects_back_off_exponentially(self):
+        """Test each failed attempt doubles the delay up to the maximum."""
+        self.si.RetrieveContent.side_effect = OSError("unreachable")
+        delays = []
+
+        with patch('vmware_snapshot_manager.connect_vcenter', side_effect=OSError("unreachable")):
+            for _ in range(5):
+                self.monitor.check_host('vc1')
+                delays.append(round(self.delay('vc1')))
+
+        self.assertEqual(delays, [10, 20, 40, 60, 60])
+        self.assertEqual(self.monitor.health('vc1'), 'down')
+        self.si.RetrieveContent.assert_called_once()
+
+    def test_connection_without_credentials_is_dropped(self):
+        """Test a lost connection that can't be restored is reported and forgotten."""
+        self.monitor.track('vc2', MagicMock(**{'RetrieveContent.side_effect': OSError("gone")}))
+        lost = []
+        self.monitor.connection_lost.connect(lost.append)
+
+        self.monitor.check_host('vc2')
+
+        self.assertEqual(lost, ['vc2'])
+        self.assertEqual(self.monitor.health('vc2'), 'unknown')
+
+    def test_health_reads_only_the_cache(self):
+        """Test asking for health never calls the server."""
+        self.assertEqual(self.monitor.health('vc1'), 'ok')
+
+        self.si.RetrieveContent.assert_not_called()
+
+    def test_hung_host_blocks_neither_other_hosts_nor_stop(self):
+        """Test a check stuck on one vCenter doesn't hold up the others or stopping the monitor."""
+        release = threading.Event()
+        self.si.RetrieveContent.side_effect = lambda: release.wait(10) and MagicMock()
+        checked = threading.Event()
+        other = MagicMock()
+        other.RetrieveContent.side_effect = lambda: checked.set() or MagicMock()
+        self.monitor.track('vc2', other)
+        self.monitor.check_now()
+
+        self.monitor.start()
+        self.assertTrue(checked.wait(5))
+        self.monitor.stop()
+
+        self.assertTrue(self.monitor.wait(2000))
+        self.assertIn('vc1', self.monitor.in_flight)
+
+        # Let the stuck check finish as healthy before the next test patches anything
+        release.set()
+        deadline = time.monotonic() + 5
+        while self.monitor.in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.monitor.in_flight, set())
+
+    def test_probe_uses_the_check_timeout(self):
+        """Test the keepalive goes through a connection built with the check timeout."""
+        clone = MagicMock()
+        monitor = ConnectionHealthMonitor(timeout=7, clone=clone)
+        monitor.track('vc1', self.si)
+
+        monitor.check_host('vc1')
+
+        clone.assert_called_once_with(self.si, timeout=7)
+        clone.return_value.RetrieveContent.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import tempfile
+import os
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from pyVmomi import vim
+from vmware_snapshot_manager import (InventoryCache, CreatorAttributionWorker, SessionRegistry,
+                                     match_creators, read_snapshot_task_events, EVENT_WINDOW,
+                                     ATTRIBUTION_MAX_AGE)
+
+NOW = 1700000000.0
+
+def make_task_event(vm_moref, event_time, user, description_id='VirtualMachine.createSnapshot'):
+    """Build a TaskEvent like the ones an EventHistoryCollector returns"""
+    return vim.event.TaskEvent(
+        key=1, chainId=1, userName=user,
+        createdTime=datetime.fromtimestamp(event_time, timezone.utc),
+        vm=vim.event.VmEventArgument(name=vm_moref, vm=vim.VirtualMachine(vm_moref)),
+        info=vim.TaskInfo(descriptionId=description_id, key='task-1', task=vim.Task('task-1'),
+                          state='success', cancelled=False, cancelable=False,
+                          reason=vim.TaskReasonUser(userName=user), queueTime=datetime.now(timezone.utc),
+                          eventChainId=1)
+    )
+
+class TestReadSnapshotTaskEvents(unittest.TestCase):
+    def test_reads_pages_and_keeps_snapshot_creations(self):
+        """Test every page is read and only create-snapshot tasks are kept."""
+        si = MagicMock()
+        si.RetrieveContent.return_value.rootFolder = vim.Folder('group-d1')
+        collector = si.RetrieveContent.return_value.eventManager.CreateCollectorForEvents.return_value
+        collector.ReadNextEvents.side_effect = [
+            [make_task_event('vm-1', NOW - 60, 'VSPHERE.LOCAL\\alice'),
+             make_task_event('vm-1', NOW - 50, 'VSPHERE.LOCAL\\bob', 'VirtualMachine.powerOn')],
+            [make_task_event('vm-2', NOW - 40, 'VSPHERE.LOCAL\\carol')],
+            [],
+        ]
+
+        events = read_snapshot_task_events(si, NOW - 3600, NOW, page_size=2)
+
+        self.assertEqual(events, [('vm-1', NOW - 60, 'VSPHERE.LOCAL\\alice'),
+                                  ('vm-2', NOW - 40, 'VSPHERE.LOCAL\\carol')])
+        collector.RewindCollector.assert_called_once()
+        self.assertEqual(collector.ReadNextEvents.call_args[1], {'maxCount': 2})
+        collector.DestroyCollector.assert_called_once()
+
+class TestMatchCreators(unittest.TestCase):
+    def test_snapshot_is_credited_to_latest_task_before_it(self):
+        """Test the nearest earlier task on the same VM wins and far-off tasks don't count."""
+        events = [('vm-1', NOW - 7200, 'old'), ('vm-1', NOW - 30, 'alice'), ('vm-2', NOW - 10, 'bob')]
+        records = [('vc1:snapshot-1', 'vm-1', NOW), ('vc1:snapshot-2', 'vm-1', NOW - 3600),
+                   ('vc1:snapshot-3', 'vm-3', NOW)]
+
+        self.assertEqual(match_creators(records, events), [('vc1:snapshot-1', 'alice')])
+
+class TestCreatorAttributionWorker(unittest.TestCase):
+    def setUp(self):
+        """Set up a cache backed by a temporary database and a fake vCenter."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = InventoryCache(os.path.join(self.temp_dir.name, 'inventory.db'))
+        self.si = MagicMock()
+        self.si.CurrentTime.return_value = datetime.fromtimestamp(NOW, timezone.utc)
+        self.sessions = SessionRegistry({'vc1': self.si}, clone=lambda si: si)
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.temp_dir.cleanup()
+
+    def test_later_pass_reads_only_new_history(self):
+        """Test a second pass reuses cached events and only reads what happened since."""
+        records = [('vc1:snapshot-1', 'vm-1', NOW - 2 * EVENT_WINDOW)]
+        worker = CreatorAttributionWorker(self.sessions, {'vc1': records}, self.cache)
+
+        with patch('vmware_snapshot_manager.read_snapshot_task_events',
+                   side_effect=lambda si, begin, end: [('vm-1', NOW - 2 * EVENT_WINDOW - 20, 'alice')]
+                   if begin <= NOW - 2 * EVENT_WINDOW - 20 <= end else []) as read:
+            first = worker.attribute_vcenter('vc1', records)
+            first_windows = read.call_count
+            self.si.CurrentTime.return_value = datetime.fromtimestamp(NOW + 600, timezone.utc)
+            second = worker.attribute_vcenter('vc1', records)
+
+        self.assertEqual(first, [('vc1:snapshot-1', 'alice')])
+        self.assertEqual(second, first)
+        self.assertEqual(first_windows, 3)
+        self.assertEqual(read.call_args_list[-1][0][1:], (NOW, NOW + 600))
+        self.assertEqual(read.call_count, first_windows + 1)
+
+    def test_older_snapshot_extends_history_backwards(self):
+        """Test history older than what was read is walked back from the scanned span."""
+        self.cache.save_creator_events('vc1', [], NOW - 100, NOW)
+        records = [('vc1:snapshot-1', 'vm-1', NOW - 1000)]
+        worker = CreatorAttributionWorker(self.sessions, {'vc1': records}, self.cache)
+
+        with patch('vmware_snapshot_manager.read_snapshot_task_events', return_value=[]) as read:
+            worker.attribute_vcenter('vc1', records)
+
+        # Nothing new since the scanned span ends now
+        self.assertEqual([call[0][1:] for call in read.call_args_list], [(NOW - 1900, NOW - 100)])
+        self.assertEqual(self.cache.creator_scan_range('vc1'), (NOW - 1900, NOW))
+
+    def test_stop_ends_the_scan_between_windows(self):
+        """Test a stopped worker reads no further windows and keeps the ones already read."""
+        records = [('vc1:snapshot-1', 'vm-1', NOW - 5 * EVENT_WINDOW)]
+        worker = CreatorAttributionWorker(self.sessions, {'vc1': records}, self.cache)
+
+        def read_window(si, begin, end):
+            worker.stop()
+            return []
+
+        with patch('vmware_snapshot_manager.read_snapshot_task_events', side_effect=read_window) as read:
+            worker.attribute_vcenter('vc1', records)
+
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(self.cache.creator_scan_range('vc1')[1] - self.cache.creator_scan_range('vc1')[0],
+                         EVENT_WINDOW)
+
+    def test_events_past_the_maximum_age_are_pruned(self):
+        """Test saving a window drops cached events too old to be matched again."""
+        keep_from = NOW - ATTRIBUTION_MAX_AGE
+        self.cache.save_creator_events('vc1', [('vm-1', keep_from - 10, 'old'), ('vm-2', keep_from + 10, 'kept')],
+                                       keep_from - 100, keep_from + 100)
+
+        self.cache.save_creator_events('vc1', [('vm-3', NOW - 10, 'new')], keep_from + 100, NOW, keep_from)
+
+        self.assertEqual(sorted(user for _, _, user in self.cache.load_creator_events('vc1')), ['kept', 'new'])
+        self.assertEqual(self.cache.creator_scan_range('vc1'), (keep_from, NOW))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import tempfile
+import os
+import sqlite3
+from datetime import datetime
+from vmware_snapshot_manager import InventoryCache
+
+class TestInventoryCache(unittest.TestCase):
+    def setUp(self):
+        """Set up a cache backed by a temporary database file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = InventoryCache(os.path.join(self.temp_dir.name, 'inventory.db'))
+        self.record = {
+            'vm_name': 'web01',
+            'vm_moref': 'vm-42',
+            'vcenter': 'vc1.example.com',
+            'name': 'Monthly OS Patching',
+            'snapshot_moref': 'snapshot-7',
+            'created': '2024-01-15 10:30',
+            'created_by': 'admin',
+            'description': 'Monthly OS Patching (Created by: admin)',
+            'has_children': False,
+            'is_child': True,
+            'snapshot': object(),  # live objects are never persisted
+        }
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.temp_dir.cleanup()
+
+    def test_load_empty_cache(self):
+        """Test loading before anything was saved returns no records."""
+        self.assertEqual(self.cache.load(), {})
+
+    def test_save_and_load_marks_records_stale(self):
+        """Test saved records come back as stale with their fetch time."""
+        self.cache.save_vcenter('vc1.example.com', {'id1': self.record}, fetched_at=1700000000.0)
+
+        loaded = self.cache.load()
+
+        self.assertEqual(list(loaded), ['id1'])
+        record = loaded['id1']
+        self.assertEqual(record['vm_name'], 'web01')
+        self.assertEqual(record['snapshot_moref'], 'snapshot-7')
+        self.assertIs(record['is_child'], True)
+        self.assertIs(record['has_children'], False)
+        self.assertTrue(record['stale'])
+        self.assertEqual(record['fetched_at'], 1700000000.0)
+        self.assertNotIn('snapshot', record)
+
+    def test_save_replaces_only_that_vcenter(self):
+        """Test a new fetch replaces one vCenter's rows and keeps the others."""
+        other = dict(self.record, vcenter='vc2.example.com')
+        self.cache.save_vcenter('vc1.example.com', {'id1': self.record, 'id2': self.record})
+        self.cache.save_vcenter('vc2.example.com', {'id3': other})
+
+        self.cache.save_vcenter('vc1.example.com', {'id2': self.record})
+
+        self.assertEqual(sorted(self.cache.load()), ['id2', 'id3'])
+
+    def test_add_and_remove_snapshot(self):
+        """Test single record updates after create and delete."""
+        self.cache.add_snapshot('vc1.example.com', 'id1', self.record)
+        self.assertIn('id1', self.cache.load())
+
+        self.cache.remove_snapshot('vc1.example.com', 'id1')
+        self.assertEqual(self.cache.load(), {})
+
+    def test_creation_time_is_stored_as_epoch(self):
+        """Test records come back with their epoch creation time and display text."""
+        created_ts = int(datetime(2024, 1, 15, 10, 30).timestamp())
+        record = dict(self.record, created_ts=created_ts)
+        del record['created']
+        self.cache.save_vcenter('vc1.example.com', {'id1': record})
+
+        loaded = self.cache.load()['id1']
+
+        self.assertEqual(loaded['created_ts'], created_ts)
+        self.assertEqual(loaded['created'], '2024-01-15 10:30')
+
+    def test_cache_without_epoch_column_is_migrated(self):
+        """Test a cache written before created_ts existed still loads with epoch times."""
+        conn = sqlite3.connect(self.cache.db_file)
+        with conn:
+            conn.execute(
+                "CREATE TABLE snapshots (vcenter TEXT NOT NULL, snapshot_id TEXT NOT NULL, "
+                "vm_name TEXT, vm_moref TEXT, name TEXT, snapshot_moref TEXT, "
+                "created TEXT, created_by TEXT, description TEXT, "
+                "has_children INTEGER, is_child INTEGER, PRIMARY KEY (vcenter, snapshot_id))"
+            )
+            conn.execute("INSERT INTO snapshots VALUES ('vc1.example.com', 'id1', 'web01', 'vm-42', 'patch', "
+                         "'snapshot-7', '2024-01-15 10:30', 'admin', '', 0, 0)")
+        conn.close()
+
+        loaded = self.cache.load()['id1']
+
+        self.assertEqual(loaded['created_ts'], int(datetime(2024, 1, 15, 10, 30).timestamp()))
+        self.cache.add_snapshot('vc1.example.com', 'id2', self.record)
+        self.assertEqual(sorted(self.cache.load()), ['id1', 'id2'])
+
+    def test_unwritable_location_is_handled(self):
+        """Test an unusable database path degrades to an empty cache."""
+        cache = InventoryCache(os.path.join(self.temp_dir.name, 'missing', 'inventory.db'))
+
+        cache.save_vcenter('vc1.example.com', {'id1': self.record})
+
+        self.assertEqual(cache.load(), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from pyVmomi import vim
+from vmware_snapshot_manager import JobJournal, SnapshotDeleteWorker, SnapshotCreateWorker
+from test_task_monitor import (make_connection, make_sessions, make_update_set, make_task_update, make_server_list,
+                               start_task)
+from test_snapshot_fetch import make_snapshot_tree
+
+class TestJobJournal(unittest.TestCase):
+    def setUp(self):
+        """Set up a journal backed by a temporary file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal_file = os.path.join(self.temp_dir.name, 'jobs.jsonl')
+        self.journal = JobJournal(self.journal_file)
+        self.items = [
+            ('vc1_web01_patch', {'vcenter': 'vc1', 'vm_moref': 'vm-1', 'snapshot_moref': 'snapshot-1'}),
+            ('vc1_web02_patch', {'vcenter': 'vc1', 'vm_moref': 'vm-2', 'snapshot_moref': 'snapshot-2'}),
+            ('vc1_web03_patch', {'vcenter': 'vc1', 'vm_moref': 'vm-3', 'snapshot_moref': 'snapshot-3'}),
+        ]
+
+    def tearDown(self):
+        """Remove the temporary journal."""
+        self.temp_dir.cleanup()
+
+    def test_replays_open_items_with_task_morefs(self):
+        """Test a job cut short lists its running and queued items, not finished ones."""
+        job_id = self.journal.start_job('delete', self.items)
+        self.journal.update(job_id, 'vc1_web01_patch', 'running', task_moref='task-1')
+        self.journal.update(job_id, 'vc1_web02_patch', 'running', task_moref='task-2')
+        self.journal.update(job_id, 'vc1_web02_patch', 'success')
+
+        jobs = JobJournal(self.journal_file).unfinished()
+
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0]['kind'], 'delete')
+        items = jobs[0]['items']
+        self.assertEqual(sorted(items), ['vc1_web01_patch', 'vc1_web03_patch'])
+        self.assertEqual(items['vc1_web01_patch']['task_moref'], 'task-1')
+        self.assertEqual(items['vc1_web01_patch']['snapshot_moref'], 'snapshot-1')
+        self.assertEqual(items['vc1_web03_patch']['state'], 'queued')
+
+    def test_job_is_finished_only_when_every_item_is(self):
+        """Test finish_job keeps a job with open items resumable."""
+        job_id = self.journal.start_job('delete', self.items[:1])
+
+        self.assertFalse(self.journal.finish_job(job_id))
+        self.journal.update(job_id, 'vc1_web01_patch', 'error')
+        self.assertTrue(self.journal.finish_job(job_id))
+
+        self.assertEqual(self.journal.unfinished(), [])
+
+    def test_truncated_last_line_is_ignored(self):
+        """Test a write cut short by a crash doesn't hide the rest of the journal."""
+        job_id = self.journal.start_job('create', self.items[:1], description='patching')
+        with open(self.journal_file, 'a') as f:
+            f.write('{"job": "' + job_id + '", "event": "item", "ke')
+
+        jobs = self.journal.unfinished()
+
+        self.assertEqual(jobs[0]['description'], 'patching')
+
+    def test_compact_drops_finished_jobs(self):
+        """Test compaction keeps only the entries of unfinished jobs."""
+        done = self.journal.start_job('delete', self.items[:1])
+        self.journal.update(done, 'vc1_web01_patch', 'success')
+        self.journal.finish_job(done)
+        open_job = self.journal.start_job('delete', self.items[1:])
+
+        self.journal.compact()
+
+        with open(self.journal_file) as f:
+            self.assertNotIn(done, f.read())
+        self.assertEqual([job['job'] for job in self.journal.unfinished()], [open_job])
+
+class TestResumeDelete(unittest.TestCase):
+    def setUp(self):
+        """Set up a journal backed by a temporary file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = JobJournal(os.path.join(self.temp_dir.name, 'jobs.jsonl'))
+
+    def tearDown(self):
+        """Remove the temporary journal."""
+        self.temp_dir.cleanup()
+
+    def test_reattaches_running_task_and_starts_queued_items(self):
+        """Test a resumed delete watches the journaled task and deletes what never started."""
+        fields = {'vcenter': 'vc1', 'vm_name': 'web01', 'name': 'patch'}
+        job_id = self.journal.start_job('delete', [
+            ('vc1_web01_patch', dict(fields, vm_moref='vm-1', snapshot_moref='snapshot-1')),
+            ('vc1_web02_patch', dict(fields, vm_moref='vm-2', snapshot_moref='snapshot-2')),
+        ])
+        self.journal.update(job_id, 'vc1_web01_patch', 'running', task_moref='task-1')
+        job = self.journal.unfinished()[0]
+        self.journal.resume_job(job)
+
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success')),
+            make_update_set('2', make_task_update('task-2', 'enter', info_state='success')),
+        ]
+        worker = SnapshotDeleteWorker(list(job['items'].items()), make_sessions(si), per_datastore_limit=None,
+                                      max_per_vcenter=1, journal=self.journal, job_id=job_id)
+        deleted = []
+        worker.item_complete.connect(deleted.append)
+
+        with patch.object(vim.vm.Snapshot, 'RemoveSnapshot_Task', return_value=vim.Task('task-2')) as remove:
+            worker.delete_on_vcenter('vc1', list(job['items'].items()))
+
+        self.assertEqual(remove.call_count, 1)
+        added = [[task._moId for task in call[1]['add']] for call in view.ModifyListView.call_args_list]
+        self.assertEqual(added, [['task-1'], ['task-2']])
+        self.assertEqual(deleted, ['vc1_web01_patch', 'vc1_web02_patch'])
+        self.assertTrue(self.journal.finish_job(job_id))
+
+    def test_purged_task_counts_as_done_when_snapshot_is_gone(self):
+        """Test a reattached delete whose task vCenter purged is judged by the VM's snapshots."""
+        fields = {'vcenter': 'vc1', 'vm_name': 'web01', 'name': 'patch'}
+        job_id = self.journal.start_job('delete', [
+            ('vc1_web01_patch', dict(fields, vm_moref='vm-1', snapshot_moref='snapshot-1')),
+            ('vc1_web02_patch', dict(fields, vm_moref='vm-2', snapshot_moref='snapshot-2')),
+        ])
+        self.journal.update(job_id, 'vc1_web01_patch', 'running', task_moref='task-1')
+        self.journal.update(job_id, 'vc1_web02_patch', 'running', task_moref='task-2')
+        job = self.journal.unfinished()[0]
+        self.journal.resume_job(job)
+
+        si, view, collector = make_connection()
+        view.ModifyListView.return_value = [vim.Task('task-1'), vim.Task('task-2')]
+        snapshots = {
+            'vm-1': {'snapshot': vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('older')])},
+            'vm-2': {'snapshot': vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('2')])},
+        }
+        worker = SnapshotDeleteWorker(list(job['items'].items()), make_sessions(si), per_datastore_limit=None,
+                                      journal=self.journal, job_id=job_id)
+        deleted, errors = [], []
+        worker.item_complete.connect(deleted.append)
+        worker.error.connect(errors.append)
+
+        with patch('vmware_snapshot_manager.retrieve_object_properties',
+                   side_effect=lambda si, vms, obj_type, properties: {vm._moId: snapshots[vm._moId] for vm in vms}):
+            worker.delete_on_vcenter('vc1', list(job['items'].items()))
+
+        self.assertEqual(deleted, ['vc1_web01_patch'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn('no longer exists', errors[0])
+        states = {entry['key']: entry['state'] for entry in self.journal._read() if entry['event'] == 'item'}
+        self.assertEqual(states, {'vc1_web01_patch': 'success', 'vc1_web02_patch': 'error'})
+
+class TestCreateJournal(unittest.TestCase):
+    def setUp(self):
+        """Set up a journal backed by a temporary file and creates returning task-<VM number>."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = JobJournal(os.path.join(self.temp_dir.name, 'jobs.jsonl'))
+        patcher = patch.object(vim.VirtualMachine, 'CreateSnapshot_Task', start_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary journal."""
+        self.temp_dir.cleanup()
+
+    def test_items_are_keyed_by_vm(self):
+        """Test repeated server names get one journal item and one create per VM."""
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-2', 'enter', info_state='success')),
+        ]
+        vm1, vm2 = (vm for vm, _ in make_server_list(2))
+        worker = SnapshotCreateWorker(make_sessions(si), ['web01', 'WEB01', 'web02'], 'patching',
+                                      vcenter_username='admin', journal=self.journal)
+        resolved = {'vc1': [(vm1, 'web01'), (vm1, 'WEB01'), (vm2, 'web02')]}
+
+        with patch.object(worker.vm_index, 'resolve', return_value=(resolved, [])), \
+             patch('vmware_snapshot_manager.retrieve_object_properties', return_value={}):
+            worker.run()
+
+        self.assertEqual(worker.succeeded, 2)
+        self.assertEqual(worker.failed, ["Skipped duplicate server: WEB01"])
+        self.assertEqual(self.journal.unfinished(), [])
+
+    def test_resume_tells_items_with_one_server_name_apart(self):
+        """Test a resumed create reattaches and starts the right VM when names repeat."""
+        job_id = self.journal.start_job('create', [
+            ('vc1:vm-1', {'vcenter': 'vc1', 'vm_moref': 'vm-1', 'server': 'web01', 'snapshot_moref': None}),
+            ('vc1:vm-2', {'vcenter': 'vc1', 'vm_moref': 'vm-2', 'server': 'web01', 'snapshot_moref': None}),
+        ], description='patching', memory=False, username='admin')
+        self.journal.update(job_id, 'vc1:vm-1', 'running', task_moref='task-1')
+        job = self.journal.unfinished()[0]
+        self.journal.resume_job(job)
+
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-2', 'enter', info_state='success')),
+        ]
+        worker = SnapshotCreateWorker(make_sessions(si), ['web01', 'web01'], 'patching', vcenter_username='admin',
+                                      journal=self.journal, job=job)
+
+        with patch.object(vim.VirtualMachine, 'CreateSnapshot_Task', side_effect=start_task, autospec=True) as create, \
+             patch('vmware_snapshot_manager.retrieve_object_properties', return_value={}):
+            worker.create_on_vcenter('vc1', worker.resume_servers()['vc1'])
+
+        # vm-1's task is watched again, only vm-2 is created
+        self.assertEqual([call[0][0]._moId for call in create.call_args_list], ['vm-2'])
+        added = [task._moId for call in view.ModifyListView.call_args_list for task in call[1]['add']]
+        self.assertEqual(added, ['task-1', 'task-2'])
+        self.assertTrue(self.journal.finish_job(job_id))
+
+if __name__ == '__main__':
+    unittest.main()
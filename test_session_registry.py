@@ -0,0 +1,108 @@
+import unittest
+import threading
+from unittest.mock import MagicMock, patch
+from pyVmomi import vim
+from pyVmomi.SoapAdapter import SoapStubAdapter
+from vmware_snapshot_manager import SessionRegistry, clone_service_instance, connect_vcenter, CONNECT_TIMEOUT
+
+class TestSessionRegistry(unittest.TestCase):
+    def setUp(self):
+        """Set up a registry whose clones are numbered so leases can be told apart."""
+        self.clones = []
+
+        def clone(si):
+            copy = MagicMock(name=f'clone-{len(self.clones)}')
+            copy.source = si
+            self.clones.append(copy)
+            return copy
+        self.primary = MagicMock()
+        self.sessions = SessionRegistry({'vc1': self.primary}, pool_size=2, clone=clone)
+
+    def test_concurrent_leases_get_their_own_connection(self):
+        """Test two leases held at once never share a connection, nor use the registered one."""
+        with self.sessions.lease('vc1') as first, self.sessions.lease('vc1') as second:
+            self.assertIsNot(first, second)
+            self.assertIsNot(first, self.primary)
+            self.assertIs(first.source, self.primary)
+
+    def test_returned_lease_is_reused(self):
+        """Test a returned connection is handed out again instead of cloning a new one."""
+        with self.sessions.lease('vc1') as first:
+            pass
+        with self.sessions.lease('vc1') as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.clones), 1)
+
+    def test_replaced_connection_drops_old_clones(self):
+        """Test leases after a reconnect are cloned from the new session."""
+        new_primary = MagicMock()
+        with self.sessions.lease('vc1'):
+            self.sessions['vc1'] = new_primary
+
+        with self.sessions.lease('vc1') as si:
+            self.assertIs(si.source, new_primary)
+
+    def test_lease_of_unknown_vcenter_raises(self):
+        """Test leasing a vCenter that isn't connected fails clearly."""
+        with self.assertRaisesRegex(RuntimeError, "Not connected to vc2"):
+            with self.sessions.lease('vc2'):
+                pass
+
+    def test_threads_lease_without_sharing(self):
+        """Test connections leased on parallel threads are never in use twice."""
+        in_use = set()
+        shared = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(4)
+
+        def work():
+            barrier.wait()
+            for _ in range(50):
+                with self.sessions.lease('vc1') as si:
+                    with lock:
+                        if id(si) in in_use:
+                            shared.append(si)
+                        in_use.add(id(si))
+                    with lock:
+                        in_use.discard(id(si))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(shared, [])
+        self.assertLessEqual(len(self.sessions._idle['vc1']), 2)
+
+    def test_clone_has_own_stub_on_same_session(self):
+        """Test a clone talks to the same vCenter with the same session cookie."""
+        stub = SoapStubAdapter(host='vc1.example.com', version='vim.version.version9',
+                               httpConnectionTimeout=15, sessionId='session-abc')
+        si = vim.ServiceInstance('ServiceInstance', stub)
+
+        clone = clone_service_instance(si)
+
+        self.assertIsNot(clone._stub, stub)
+        self.assertEqual(clone._stub.host, 'vc1.example.com:443')
+        self.assertEqual(clone._stub.GetSessionId(), 'session-abc')
+        self.assertEqual(clone._stub.version, stub.version)
+        self.assertNotIn('timeout', clone._stub.schemeArgs)  # the connect timeout isn't carried over
+
+    def test_login_timeout_is_released_after_connect(self):
+        """Test calls after login don't keep the connect timeout."""
+        stub = SoapStubAdapter(host='vc1.example.com', version='vim.version.version9', httpConnectionTimeout=15)
+        si = vim.ServiceInstance('ServiceInstance', stub)
+
+        with patch('vmware_snapshot_manager.check_reachable'), \
+             patch('vmware_snapshot_manager.SmartConnect', return_value=si) as smart_connect:
+            connected = connect_vcenter('vc1.example.com', 'admin', 'secret')
+
+        self.assertEqual(smart_connect.call_args[1]['httpConnectionTimeout'], CONNECT_TIMEOUT)
+        self.assertIs(connected, si)
+        self.assertNotIn('timeout', stub.schemeArgs)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,381 @@
+import unittest
+import sys
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from pyVmomi import vim
+from vmware_snapshot_manager import (SnapshotFetchWorker, LiveUpdateWorker, SnapshotBatcher, SessionRegistry,
+                                     retrieve_properties, walk_snapshot_tree, SnapshotRecord)
+
+def make_object_content(moid, **props):
+    """Build a fake PropertyCollector ObjectContent"""
+    obj_content = MagicMock()
+    obj_content.obj = vim.VirtualMachine(moid)
+    obj_content.propSet = []
+    for name, val in props.items():
+        prop = MagicMock()
+        prop.name = name
+        prop.val = val
+        obj_content.propSet.append(prop)
+    return obj_content
+
+def make_result(objects, token=None):
+    """Build a fake RetrieveResult page"""
+    result = MagicMock()
+    result.objects = objects
+    result.token = token
+    return result
+
+def make_snapshot_tree(name, children=None, description=''):
+    """Build a snapshot tree data object like the one in VirtualMachine.snapshot"""
+    tree = vim.vm.SnapshotTree(
+        name=name,
+        description=description,
+        createTime=datetime(2024, 1, 15, 10, 30),
+        id=1,
+        state='poweredOn',
+        quiesced=False,
+        childSnapshotList=children or []
+    )
+    tree.snapshot = vim.vm.Snapshot(f"snapshot-{name}")
+    return tree
+
+class TestRetrieveProperties(unittest.TestCase):
+    def setUp(self):
+        """Set up a fake ServiceInstance with a property collector."""
+        self.si = MagicMock()
+        self.content = self.si.RetrieveContent.return_value
+        self.container = MagicMock(spec=vim.view.ContainerView)
+        self.content.viewManager.CreateContainerView.return_value = self.container
+        self.collector = self.content.propertyCollector
+
+    def test_pages_through_all_results(self):
+        """Test that every page is followed using the continuation token."""
+        self.collector.RetrievePropertiesEx.return_value = make_result(
+            [make_object_content('vm-1', name='web01')], token='page-2'
+        )
+        self.collector.ContinueRetrievePropertiesEx.return_value = make_result(
+            [make_object_content('vm-2', name='web02')]
+        )
+
+        results = list(retrieve_properties(self.si, vim.VirtualMachine, ['name']))
+
+        self.assertEqual([props['name'] for _, props in results], ['web01', 'web02'])
+        self.assertEqual(results[0][0]._moId, 'vm-1')
+        self.collector.ContinueRetrievePropertiesEx.assert_called_once_with(token='page-2')
+        self.collector.CancelRetrievePropertiesEx.assert_not_called()
+        self.container.Destroy.assert_called_once()
+
+    def test_requests_only_listed_properties(self):
+        """Test the filter spec asks for the given paths with a page size."""
+        self.collector.RetrievePropertiesEx.return_value = make_result([])
+
+        list(retrieve_properties(self.si, vim.VirtualMachine, ['name', 'snapshot'], max_objects=250))
+
+        _, kwargs = self.collector.RetrievePropertiesEx.call_args
+        property_spec = kwargs['specSet'][0].propSet[0]
+        self.assertEqual(list(property_spec.pathSet), ['name', 'snapshot'])
+        self.assertFalse(property_spec.all)
+        self.assertEqual(kwargs['options'].maxObjects, 250)
+
+    def test_early_stop_cancels_retrieval(self):
+        """Test that abandoning iteration releases the server-side token."""
+        self.collector.RetrievePropertiesEx.return_value = make_result(
+            [make_object_content('vm-1', name='web01')], token='page-2'
+        )
+
+        generator = retrieve_properties(self.si, vim.VirtualMachine, ['name'])
+        next(generator)
+        generator.close()
+
+        self.collector.CancelRetrievePropertiesEx.assert_called_once_with(token='page-2')
+        self.container.Destroy.assert_called_once()
+
+    def test_missing_properties_are_omitted(self):
+        """Test objects without a value for a property yield no key for it."""
+        self.collector.RetrievePropertiesEx.return_value = make_result(
+            [make_object_content('vm-1', name='web01')]
+        )
+
+        _, props = next(retrieve_properties(self.si, vim.VirtualMachine, ['name', 'snapshot']))
+
+        self.assertNotIn('snapshot', props)
+
+class TestBuildSnapshotRecords(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.worker = SnapshotFetchWorker({})
+        self.vm = vim.VirtualMachine('vm-42')
+
+    def test_flattens_snapshot_tree(self):
+        """Test every snapshot in the tree becomes one record."""
+        child = make_snapshot_tree('child')
+        root = make_snapshot_tree('root', children=[child], description='Created by: admin')
+        snapshot_info = vim.vm.SnapshotInfo(rootSnapshotList=[root])
+
+        records = self.worker.build_snapshot_records('vc1', self.vm, 'web01', snapshot_info)
+
+        self.assertEqual([r['name'] for r in records], ['root', 'child'])
+        self.assertEqual(records[0]['vm_name'], 'web01')
+        self.assertEqual(records[0]['vcenter'], 'vc1')
+        self.assertEqual(records[0]['created_by'], 'admin')
+        self.assertTrue(records[0]['has_children'])
+        self.assertFalse(records[1]['has_children'])
+        self.assertEqual(records[0]['vm_moref'], self.vm._moId)
+        self.assertNotIn('snapshot', records[0])  # no live objects are kept
+        self.assertIsInstance(records[0]['created_ts'], int)
+        self.assertEqual(records[0]['created_ts'], int(datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc).timestamp()))
+
+class TestSnapshotRecord(unittest.TestCase):
+    def test_same_named_snapshots_are_kept_apart(self):
+        """Test two snapshots with one name on a VM get different IDs."""
+        first = make_snapshot_tree('patch')
+        second = make_snapshot_tree('patch')
+        second.snapshot = vim.vm.Snapshot('snapshot-patch-2')
+        worker = SnapshotFetchWorker({})
+
+        records = worker.build_snapshot_records('vc1', vim.VirtualMachine('vm-1'), 'web01',
+                                                vim.vm.SnapshotInfo(rootSnapshotList=[first, second]))
+
+        self.assertEqual([r.snapshot_id for r in records], ['vc1:snapshot-patch', 'vc1:snapshot-patch-2'])
+
+    def test_record_is_slotted_and_read_like_a_mapping(self):
+        """Test records carry no per-instance dict and answer dict-style reads."""
+        record = SnapshotRecord(vcenter='vc1', vm_name='web01', snapshot_moref='snapshot-1')
+
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record['vm_name'], 'web01')
+        self.assertEqual(record.get('created_by'), 'Unknown')
+        self.assertEqual(record.get('fetched_at', 0), 0)
+        self.assertTrue(record.replace(stale=True)['stale'])
+        self.assertFalse(record['stale'])
+        with self.assertRaises(KeyError):
+            record['vm']
+
+class TestWalkSnapshotTree(unittest.TestCase):
+    def test_chain_metadata(self):
+        """Test each snapshot is yielded once, parents first, with its place in the chain."""
+        leaf = make_snapshot_tree('leaf')
+        middle = make_snapshot_tree('middle', children=[leaf])
+        sibling = make_snapshot_tree('sibling')
+        root = make_snapshot_tree('root', children=[middle, sibling])
+        other = make_snapshot_tree('other')
+
+        nodes = list(walk_snapshot_tree([root, other]))
+
+        self.assertEqual(
+            [(n.snapshot.name, n.parent_id, n.depth, n.child_count, n.chain_root, n.chain_position) for n in nodes],
+            [('root', None, 0, 2, 'snapshot-root', 1),
+             ('middle', 'snapshot-root', 1, 1, 'snapshot-root', 2),
+             ('leaf', 'snapshot-middle', 2, 0, 'snapshot-root', 3),
+             ('sibling', 'snapshot-root', 1, 0, 'snapshot-root', 2),
+             ('other', None, 0, 0, 'snapshot-other', 1)]
+        )
+
+    def test_deep_chain_does_not_recurse(self):
+        """Test a chain deeper than the recursion limit is walked."""
+        node = make_snapshot_tree('0')
+        for index in range(1, sys.getrecursionlimit() + 100):
+            node = make_snapshot_tree(str(index), children=[node])
+
+        depths = [n.depth for n in walk_snapshot_tree([node])]
+
+        self.assertEqual(depths, list(range(sys.getrecursionlimit() + 100)))
+
+    def test_records_flag_children(self):
+        """Test child snapshots are marked as such in their records."""
+        root = make_snapshot_tree('root', children=[make_snapshot_tree('child')])
+        worker = SnapshotFetchWorker({})
+
+        records = worker.build_snapshot_records('vc1', vim.VirtualMachine('vm-1'), 'web01',
+                                                vim.vm.SnapshotInfo(rootSnapshotList=[root]))
+
+        self.assertEqual([(r['is_child'], r['has_children']) for r in records], [(False, True), (True, False)])
+        self.assertEqual(records[1]['parent_moref'], 'snapshot-root')
+        self.assertEqual(records[1]['chain_position'], 2)
+
+class TestStreamingFetch(unittest.TestCase):
+    def test_streams_each_page(self):
+        """Test records of each retrieval page are streamed as they are built."""
+        worker = SnapshotFetchWorker({}, page_size=2)
+        worker.batcher = SnapshotBatcher(worker.snapshots_found, max_size=1)
+        batches, progress = [], []
+        worker.snapshots_found.connect(batches.append)
+        worker.vcenter_progress.connect(lambda host, count: progress.append(count))
+
+        snapshot_info = vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('patch')])
+        pages = [
+            [(vim.VirtualMachine('vm-1'), {'name': 'web01', 'snapshot': snapshot_info}),
+             (vim.VirtualMachine('vm-2'), {'name': 'web02'})],
+            [(vim.VirtualMachine('vm-3'), {'name': 'web03', 'snapshot': snapshot_info})],
+        ]
+
+        with patch('vmware_snapshot_manager.retrieve_property_pages', return_value=iter(pages)) as mock_pages:
+            count = worker.fetch_vcenter('vc1', MagicMock())
+
+        self.assertEqual(mock_pages.call_args[0][3], 2)
+        self.assertEqual(count, 2)
+        self.assertEqual([[r['vm_name'] for r in batch] for batch in batches], [['web01'], ['web03']])
+        self.assertEqual(progress, [1, 2])
+
+class TestSnapshotBatcher(unittest.TestCase):
+    def setUp(self):
+        """Set up a batcher emitting into a list."""
+        self.signal = MagicMock()
+        self.batches = []
+        self.signal.emit.side_effect = self.batches.append
+
+    def test_emits_on_size_threshold(self):
+        """Test a batch is emitted once enough records are queued."""
+        batcher = SnapshotBatcher(self.signal, max_size=3, max_delay=60)
+
+        batcher.add([1, 2])
+        self.assertEqual(self.batches, [])
+        batcher.add([3, 4])
+
+        self.assertEqual(self.batches, [[1, 2, 3, 4]])
+
+    def test_emits_on_time_threshold(self):
+        """Test queued records are emitted once the delay has passed."""
+        batcher = SnapshotBatcher(self.signal, max_size=100, max_delay=0)
+
+        batcher.add([1])
+
+        self.assertEqual(self.batches, [[1]])
+
+    def test_flush_emits_remaining_records(self):
+        """Test flush delivers a partial batch and skips empty ones."""
+        batcher = SnapshotBatcher(self.signal, max_size=100, max_delay=60)
+
+        batcher.add([1, 2])
+        batcher.flush()
+        batcher.flush()
+
+        self.assertEqual(self.batches, [[1, 2]])
+
+class TestParallelFetch(unittest.TestCase):
+    def test_failing_vcenter_does_not_abort_others(self):
+        """Test each vCenter reports its own result or error."""
+        worker = SnapshotFetchWorker(SessionRegistry({'vc1': MagicMock(), 'vc2': MagicMock(), 'vc3': MagicMock()},
+                                                     clone=lambda si: si))
+        finished, errors, done = [], [], []
+        worker.vcenter_finished.connect(lambda host, count: finished.append((host, count)))
+        worker.vcenter_error.connect(lambda host, msg: errors.append((host, msg)))
+        worker.finished.connect(lambda: done.append(True))
+
+        def fake_fetch(hostname, si):
+            if hostname == 'vc2':
+                raise RuntimeError("connection reset")
+            return 3
+
+        with patch.object(worker, 'fetch_vcenter', side_effect=fake_fetch):
+            worker.run()
+
+        self.assertEqual(sorted(finished), [('vc1', 3), ('vc3', 3)])
+        self.assertEqual(errors, [('vc2', 'connection reset')])
+        self.assertEqual(done, [True])
+
+    def test_every_vcenter_is_fetched_at_once(self):
+        """Test no vCenter queues behind others by default."""
+        hostnames = [f"vc{i}" for i in range(9)]
+        worker = SnapshotFetchWorker(SessionRegistry({hostname: MagicMock() for hostname in hostnames},
+                                                     clone=lambda si: si))
+        all_started = threading.Barrier(len(hostnames), timeout=5)
+        finished = []
+        worker.vcenter_finished.connect(lambda host, count: finished.append(host))
+
+        def fake_fetch(hostname, si):
+            all_started.wait()  # Only passes once every vCenter is being fetched
+            return 0
+
+        with patch.object(worker, 'fetch_vcenter', side_effect=fake_fetch):
+            worker.run()
+
+        self.assertEqual(sorted(finished), hostnames)
+
+def make_object_update(moid, kind, **changes):
+    """Build a fake WaitForUpdatesEx ObjectUpdate"""
+    object_update = MagicMock()
+    object_update.obj = vim.VirtualMachine(moid)
+    object_update.kind = kind
+    object_update.changeSet = []
+    for name, val in changes.items():
+        change = MagicMock()
+        change.name = name
+        change.op = 'assign'
+        change.val = val
+        object_update.changeSet.append(change)
+    return object_update
+
+class TestLiveUpdates(unittest.TestCase):
+    def setUp(self):
+        """Set up a live worker that records emitted changes."""
+        self.worker = LiveUpdateWorker('vc1', MagicMock())
+        self.changes = []
+        self.worker.vm_snapshots_changed.connect(
+            lambda host, moid, records: self.changes.append((host, moid, [r['name'] for r in records]))
+        )
+        self.vm_names = {}
+
+    def test_initial_update_only_records_names(self):
+        """Test the initial state is not re-emitted."""
+        snapshot_info = vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('patch')])
+        update = make_object_update('vm-1', 'enter', name='web01', snapshot=snapshot_info)
+
+        self.worker.apply_object_update(update, self.vm_names, emit=False)
+
+        self.assertEqual(self.changes, [])
+        self.assertEqual(self.vm_names, {'vm-1': 'web01'})
+
+    def test_snapshot_change_emits_vm_records(self):
+        """Test a snapshot change reports the VM's current snapshots."""
+        self.vm_names['vm-1'] = 'web01'
+        snapshot_info = vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('patch')])
+
+        self.worker.apply_object_update(make_object_update('vm-1', 'modify', snapshot=snapshot_info), self.vm_names)
+
+        self.assertEqual(self.changes, [('vc1', 'vm-1', ['patch'])])
+
+    def test_removed_snapshots_and_vms_emit_empty(self):
+        """Test removing the last snapshot or the VM clears its rows."""
+        self.worker.apply_object_update(make_object_update('vm-1', 'modify', snapshot=None), self.vm_names)
+        self.worker.apply_object_update(make_object_update('vm-2', 'leave'), self.vm_names)
+
+        self.assertEqual(self.changes, [('vc1', 'vm-1', []), ('vc1', 'vm-2', [])])
+
+    def test_rename_only_is_ignored(self):
+        """Test changes that don't touch snapshots are not reported."""
+        self.worker.apply_object_update(make_object_update('vm-1', 'modify', name='web01-new'), self.vm_names)
+
+        self.assertEqual(self.changes, [])
+        self.assertEqual(self.vm_names['vm-1'], 'web01-new')
+
+    def test_truncated_initial_state_is_not_emitted(self):
+        """Test every part of an initial state split across update sets is treated as initial."""
+        snapshot_info = vim.vm.SnapshotInfo(rootSnapshotList=[make_snapshot_tree('patch')])
+
+        def make_update_set(object_update, truncated):
+            update_set = MagicMock()
+            update_set.truncated = truncated
+            update_set.filterSet = [MagicMock(objectSet=[object_update])]
+            return update_set
+
+        def stop_waiting(**kwargs):
+            self.worker.stop()
+            return None
+
+        collector = self.worker.si.RetrieveContent().propertyCollector.CreatePropertyCollector()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set(make_object_update('vm-1', 'enter', name='web01', snapshot=snapshot_info), True),
+            make_update_set(make_object_update('vm-2', 'enter', name='web02', snapshot=snapshot_info), False),
+            make_update_set(make_object_update('vm-2', 'modify', snapshot=None), False),
+            stop_waiting,
+        ]
+
+        with patch('vmware_snapshot_manager.build_container_filter_spec'):
+            self.worker.run()
+
+        self.assertEqual(self.changes, [('vc1', 'vm-2', [])])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+from snapshot_filters import SnapshotFilter, parse_created, format_created
+
+def make_record(**extra):
+    """Build a snapshot record like the fetch worker produces"""
+    record = {
+        'vm_name': 'WEB01',
+        'vcenter': 'vc1',
+        'name': 'Monthly Patching',
+        'created': '2024-01-15 10:30',
+        'created_by': 'admin',
+        'description': 'Before KB5034441',
+        'has_children': False,
+        'is_child': False,
+    }
+    record.update(extra)
+    return record
+
+class TestSnapshotFilter(unittest.TestCase):
+    def test_empty_filter_matches_everything(self):
+        """Test a filter with no criteria accepts any snapshot."""
+        self.assertTrue(SnapshotFilter().matches(make_record()))
+
+    def test_text_filters_are_case_insensitive(self):
+        """Test VM name and search terms match regardless of case."""
+        self.assertTrue(SnapshotFilter(vm_name='web').matches(make_record()))
+        self.assertTrue(SnapshotFilter(snapshot_search='kb5034441').matches(make_record()))
+        self.assertFalse(SnapshotFilter(snapshot_search='rollback').matches(make_record()))
+
+    def test_dropdown_filters_are_exact(self):
+        """Test vCenter, creator and type filters need an exact match."""
+        self.assertFalse(SnapshotFilter(vcenter='vc2').matches(make_record()))
+        self.assertFalse(SnapshotFilter(created_by='adm').matches(make_record()))
+        self.assertTrue(SnapshotFilter(snapshot_type='Child Snapshot').matches(make_record(is_child=True)))
+
+    def test_date_range_is_inclusive(self):
+        """Test snapshots created on either boundary day are included."""
+        same_day = SnapshotFilter(date_from=date(2024, 1, 15), date_to=date(2024, 1, 15))
+        later = SnapshotFilter(date_from=date(2024, 1, 16))
+
+        self.assertTrue(same_day.matches(make_record(created='2024-01-15 23:59')))
+        self.assertFalse(later.matches(make_record()))
+
+    def test_unparseable_date_is_not_filtered(self):
+        """Test snapshots with a bad date are kept by the date range."""
+        snapshot_filter = SnapshotFilter(date_from=date(2024, 1, 16))
+
+        self.assertTrue(snapshot_filter.matches(make_record(created='unknown')))
+        self.assertIsNone(parse_created('unknown'))
+
+    def test_patching_only(self):
+        """Test the patching filter checks the snapshot name."""
+        snapshot_filter = SnapshotFilter(patching_only=True)
+
+        self.assertTrue(snapshot_filter.matches(make_record()))
+        self.assertFalse(snapshot_filter.matches(make_record(name='pre-upgrade')))
+
+    def test_key_reuses_given_timestamp(self):
+        """Test a precomputed creation time is used as is."""
+        key = SnapshotFilter.build_key(make_record(), int(datetime(2023, 5, 1).timestamp()))
+
+        self.assertEqual(key[:3], ('web01', 'monthly patching', 'before kb5034441'))
+        self.assertFalse(SnapshotFilter(date_from=date(2024, 1, 1)).matches_key(key))
+
+    def test_epoch_records_are_filtered_without_parsing(self):
+        """Test records carrying created_ts are date-filtered on the number alone."""
+        record = make_record(created_ts=int(datetime(2024, 1, 15, 23, 59).timestamp()))
+        del record['created']
+
+        with patch('snapshot_filters.parse_created') as parse:
+            self.assertTrue(SnapshotFilter(date_from=date(2024, 1, 15), date_to=date(2024, 1, 15)).matches(record))
+            self.assertFalse(SnapshotFilter(date_from=date(2024, 1, 16)).matches(record))
+
+        parse.assert_not_called()
+        self.assertEqual(format_created(record['created_ts']), '2024-01-15 23:59')
+
+if __name__ == '__main__':
+    unittest.main()
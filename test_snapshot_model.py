@@ -0,0 +1,239 @@
+import unittest
+from datetime import datetime, date
+from unittest.mock import patch
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QAbstractItemModelTester
+from snapshot_filters import SnapshotFilter
+from vmware_snapshot_manager import SnapshotStore, SnapshotTableModel, SnapshotProxyModel, SnapshotFilterWorker
+
+def make_record(vm_name, name='patch', created='2024-01-15 10:30', **extra):
+    """Build a snapshot record like the fetch worker produces"""
+    record = {
+        'vm_name': vm_name,
+        'vcenter': 'vc1',
+        'name': name,
+        'created': created,
+        'created_by': 'admin',
+        'description': '',
+        'has_children': False,
+        'is_child': False,
+    }
+    record.update(extra)
+    return record
+
+def make_items(*records):
+    """Pair records with the IDs the window would give them"""
+    return [(f"{r['vcenter']}_{r['vm_name']}_{r['name']}", r) for r in records]
+
+class TestSnapshotStore(unittest.TestCase):
+    def test_remove_rows_reindexes_following_rows(self):
+        """Test removing a range keeps the ID index in step with the columns."""
+        store = SnapshotStore()
+        for vm_name in ['a', 'b', 'c', 'd']:
+            store.append(vm_name, make_record(vm_name))
+
+        store.remove_rows(1, 2)
+
+        self.assertEqual(store.columns['vm_name'], ['a', 'd'])
+        self.assertEqual(store.row_of, {'a': 0, 'd': 1})
+
+    def test_remove_ids_handles_scattered_rows(self):
+        """Test removing any set of IDs in one pass."""
+        store = SnapshotStore()
+        for vm_name in ['a', 'b', 'c', 'd']:
+            store.append(vm_name, make_record(vm_name))
+
+        store.remove_ids({'a', 'c'})
+
+        self.assertEqual(store.columns['id'], ['b', 'd'])
+        self.assertEqual(store.row_of, {'b': 0, 'd': 1})
+
+class TestSnapshotTableModel(unittest.TestCase):
+    def setUp(self):
+        """Set up a model with two snapshots."""
+        self.model = SnapshotTableModel()
+        self.model.upsert(make_items(make_record('web01'), make_record('web02', has_children=True)))
+
+    def test_upsert_refreshes_existing_rows(self):
+        """Test a record with a known ID updates its row instead of adding one."""
+        self.model.upsert(make_items(make_record('web01', description='refreshed'), make_record('web03')))
+
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.index(0, 6).data(), 'refreshed')
+        self.assertEqual(self.model.index(2, 1).data(), 'web03')
+
+    def test_chain_and_stale_rows_are_not_checkable(self):
+        """Test only independent live snapshots get a checkbox."""
+        self.model.upsert(make_items(make_record('web03', stale=True)))
+
+        self.assertEqual(self.model.index(0, 0).data(Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Unchecked)
+        self.assertIsNone(self.model.index(1, 0).data(Qt.ItemDataRole.CheckStateRole))
+        self.assertIsNone(self.model.index(2, 0).data(Qt.ItemDataRole.CheckStateRole))
+        self.assertFalse(self.model.setData(self.model.index(1, 0), Qt.CheckState.Checked,
+                                            Qt.ItemDataRole.CheckStateRole))
+
+    def test_checked_ids_and_count(self):
+        """Test checking a row is tracked and reset when the row is refreshed."""
+        counts = []
+        self.model.checked_count_changed.connect(counts.append)
+
+        self.model.setData(self.model.index(0, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+        self.assertEqual(self.model.checked_ids(), ['vc1_web01_patch'])
+
+        self.model.upsert(make_items(make_record('web01')))
+
+        self.assertEqual(self.model.checked_ids(), [])
+        self.assertEqual(counts, [1, 0])
+
+    def test_row_state_uses_age_policy(self):
+        """Test chain rows stay grey and old rows follow the threshold."""
+        self.model.set_age_policy(3, "calendar days", lambda created_dates, day_type: [10] * len(created_dates))
+
+        self.assertEqual(self.model.index(0, 1).data(SnapshotTableModel.ROW_STATE_ROLE), 'old')
+        self.assertEqual(self.model.index(1, 1).data(SnapshotTableModel.ROW_STATE_ROLE), 'chain')
+
+        self.model.set_age_policy(30, "calendar days", self.model.age_function)
+
+        self.assertIsNone(self.model.index(0, 1).data(SnapshotTableModel.ROW_STATE_ROLE))
+
+    def test_created_is_kept_as_epoch_and_formatted_for_display(self):
+        """Test epoch records are stored, aged and shown without parsing dates."""
+        created_ts = int(datetime(2024, 3, 1, 8, 5).timestamp())
+        aged = []
+
+        def age_function(created_timestamps, day_type):
+            aged.extend(created_timestamps)
+            return [1] * len(created_timestamps)
+        self.model.set_age_policy(3, "calendar days", age_function)
+
+        with patch('snapshot_filters.parse_created') as parse:
+            self.model.upsert([('vc1:snapshot-9', {'vm_name': 'web09', 'vcenter': 'vc1', 'name': 'patch',
+                                                   'created_ts': created_ts})])
+
+        parse.assert_not_called()
+        self.assertEqual(aged[-1], created_ts)
+        self.assertEqual(self.model.index(2, 4).data(), '2024-03-01 08:05')
+
+    def test_ages_are_recomputed_on_a_new_day(self):
+        """Test unchanged age settings still refresh ages once the date has moved on."""
+        calls = []
+
+        def age_function(created_timestamps, day_type):
+            calls.append(day_type)
+            return [1] * len(created_timestamps)
+        self.model.set_age_policy(3, "calendar days", age_function)
+        self.model.set_age_policy(3, "calendar days", age_function)
+        self.assertEqual(len(calls), 1)
+
+        self.model.ages_date = date(2000, 1, 1)
+        self.model.set_age_policy(3, "calendar days", age_function)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.model.ages_date, date.today())
+
+    def test_model_passes_model_tester(self):
+        """Test the model keeps the QAbstractItemModel contract through inserts, updates and removals."""
+        tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+        self.model.upsert(make_items(make_record('web01', description='refreshed'), make_record('web03')))
+        self.model.remove_ids(['vc1_web02_patch'])
+
+        self.assertEqual(self.model.flags(self.model.index(-1, -1)), Qt.ItemFlag.NoItemFlags)
+        self.assertEqual(self.model.rowCount(), 2)
+        del tester
+
+class TestSnapshotProxyModel(unittest.TestCase):
+    def setUp(self):
+        """Set up a proxy sorted by VM name over an unsorted model."""
+        self.model = SnapshotTableModel()
+        self.model.upsert(make_items(make_record('web03'), make_record('web01'), make_record('db01')))
+        self.proxy = SnapshotProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.proxy.sort(1, Qt.SortOrder.AscendingOrder)
+
+    def visible_names(self):
+        return [self.proxy.index(row, 1).data() for row in range(self.proxy.rowCount())]
+
+    def test_sorts_and_filters(self):
+        """Test rows are sorted by the column keys and filtered by the predicate."""
+        self.assertEqual(self.visible_names(), ['db01', 'web01', 'web03'])
+
+        self.proxy.set_filter(lambda row: self.model.record(row)['vm_name'].startswith('web'))
+        self.proxy.sort(1, Qt.SortOrder.DescendingOrder)
+
+        self.assertEqual(self.visible_names(), ['web03', 'web01'])
+
+    def test_inserted_rows_are_filtered_and_sorted_into_place(self):
+        """Test new model rows appear in sort order only if accepted."""
+        self.proxy.set_filter(lambda row: self.model.record(row)['vm_name'].startswith('web'))
+
+        self.model.upsert(make_items(make_record('web02'), make_record('db02')))
+
+        self.assertEqual(self.visible_names(), ['web01', 'web02', 'web03'])
+
+    def test_removed_rows_disappear(self):
+        """Test removing model rows keeps the mapping consistent."""
+        self.model.remove_ids(['vc1_web03_patch', 'vc1_db01_patch'])
+
+        self.assertEqual(self.visible_names(), ['web01'])
+        self.assertEqual(self.proxy.mapToSource(self.proxy.index(0, 1)).row(), 0)
+
+    def test_created_column_sorts_numerically(self):
+        """Test the Created column sorts on epoch seconds, not on the displayed text."""
+        model = SnapshotTableModel()
+        proxy = SnapshotProxyModel()
+        proxy.setSourceModel(model)
+        model.upsert([(name, {'vm_name': name, 'vcenter': 'vc1', 'name': 'patch', 'created_ts': created_ts})
+                      for name, created_ts in [('new', 1700000000), ('old', 999999999), ('mid', 1000000000)]])
+
+        proxy.sort(4, Qt.SortOrder.AscendingOrder)
+
+        self.assertEqual([proxy.index(row, 1).data() for row in range(proxy.rowCount())], ['old', 'mid', 'new'])
+
+    def test_changed_rows_are_refiltered(self):
+        """Test a refreshed row is hidden or shown again as its data changes."""
+        self.proxy.set_filter(lambda row: not self.model.record(row).get('stale'))
+
+        self.model.upsert(make_items(make_record('web01', stale=True)))
+        self.assertEqual(self.visible_names(), ['db01', 'web03'])
+
+        self.model.upsert(make_items(make_record('web01')))
+        self.assertEqual(self.visible_names(), ['db01', 'web01', 'web03'])
+
+    def test_apply_visibility_changes_only_the_delta(self):
+        """Test a bitmap hides and shows rows without resetting the proxy."""
+        resets = []
+        self.proxy.modelReset.connect(lambda: resets.append(True))
+
+        self.proxy.apply_visibility(bytearray([1, 0, 1]))
+        self.assertEqual(self.visible_names(), ['db01', 'web03'])
+
+        self.proxy.apply_visibility(bytearray([0, 1, 1]))
+        self.assertEqual(self.visible_names(), ['db01', 'web01'])
+        self.assertEqual(resets, [])
+
+class TestSnapshotFilterWorker(unittest.TestCase):
+    def test_builds_row_bitmap(self):
+        """Test the worker evaluates the filter over the copied keys."""
+        model = SnapshotTableModel()
+        model.upsert(make_items(make_record('web01'), make_record('db01'), make_record('web02')))
+        worker = SnapshotFilterWorker(SnapshotFilter(vm_name='WEB'), model.filter_keys(), model.layout_revision)
+        results = []
+        worker.filtered.connect(results.append)
+
+        worker.run()
+
+        self.assertEqual(results, [bytearray([1, 0, 1])])
+
+    def test_changed_rows_since_copy(self):
+        """Test rows refreshed after the keys were copied are reported."""
+        model = SnapshotTableModel()
+        model.upsert(make_items(make_record('web01'), make_record('db01')))
+        filter_keys = model.filter_keys()
+
+        model.upsert(make_items(make_record('db01', description='refreshed')))
+
+        self.assertEqual(model.changed_rows(filter_keys), [1])
+
+if __name__ == '__main__':
+    unittest.main()
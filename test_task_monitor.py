@@ -0,0 +1,308 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from pyVmomi import vim
+from test_snapshot_fetch import make_snapshot_tree
+from vmware_snapshot_manager import (TaskMonitor, AdaptiveWindow, SnapshotDeleteWorker, SnapshotCreateWorker,
+                                     SessionRegistry)
+
+def make_task_update(moid, kind='modify', **changes):
+    """Build a fake WaitForUpdatesEx ObjectUpdate for a task ('info_state' -> 'info.state')"""
+    object_update = MagicMock()
+    object_update.obj = vim.Task(moid)
+    object_update.kind = kind
+    object_update.changeSet = []
+    for name, val in changes.items():
+        change = MagicMock()
+        change.name = name.replace('_', '.')
+        change.op = 'assign'
+        change.val = val
+        object_update.changeSet.append(change)
+    return object_update
+
+def make_update_set(version, *object_updates):
+    """Build a fake WaitForUpdatesEx UpdateSet with one filter"""
+    filter_update = MagicMock()
+    filter_update.objectSet = list(object_updates)
+    update_set = MagicMock()
+    update_set.version = version
+    update_set.filterSet = [filter_update]
+    return update_set
+
+def make_error(msg):
+    """Build a fault like the one in a failed task's info.error"""
+    error = MagicMock()
+    error.msg = msg
+    return error
+
+def make_connection():
+    """Build a fake ServiceInstance whose task view and collector can be inspected"""
+    si = MagicMock()
+    content = si.RetrieveContent.return_value
+    view = MagicMock(spec=vim.view.ListView)
+    content.viewManager.CreateListView.return_value = view
+    return si, view, content.propertyCollector.CreatePropertyCollector.return_value
+
+class TestTaskMonitor(unittest.TestCase):
+    def setUp(self):
+        """Set up a monitor on a fake connection."""
+        self.si = MagicMock()
+        content = self.si.RetrieveContent.return_value
+        self.view = MagicMock(spec=vim.view.ListView)
+        content.viewManager.CreateListView.return_value = self.view
+        self.collector = content.propertyCollector.CreatePropertyCollector.return_value
+        self.monitor = TaskMonitor(self.si)
+        self.completed = []
+
+    def on_complete(self, task, state, result, error):
+        self.completed.append((task._moId, state, result, error))
+
+    def test_tasks_share_one_filter_and_wait(self):
+        """Test all tasks are registered with one view update and watched by one filter."""
+        for moid in ['task-1', 'task-2']:
+            self.monitor.watch(vim.Task(moid), self.on_complete)
+        self.collector.WaitForUpdatesEx.return_value = None
+
+        self.monitor.wait()
+
+        self.collector.CreateFilter.assert_called_once()
+        self.view.ModifyListView.assert_called_once()
+        _, kwargs = self.view.ModifyListView.call_args
+        self.assertEqual([task._moId for task in kwargs['add']], ['task-1', 'task-2'])
+        spec = self.collector.CreateFilter.call_args[0][0]
+        self.assertIn('info.state', spec.propSet[0].pathSet)
+
+    def test_dispatches_completion_and_progress(self):
+        """Test callbacks fire as updates arrive and run() returns once all tasks finish."""
+        progress = []
+        self.monitor.watch(vim.Task('task-1'), self.on_complete, lambda task, pct: progress.append(pct))
+        self.monitor.watch(vim.Task('task-2'), self.on_complete)
+        self.collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='running', info_progress=40),
+                            make_task_update('task-2', 'enter', info_state='queued')),
+            None,
+            make_update_set('2', make_task_update('task-1', info_state='success', info_result='snapshot-9'),
+                            make_task_update('task-2', info_state='error', info_error=make_error('Locked'))),
+        ]
+
+        self.monitor.run()
+
+        self.assertEqual(progress, [40])
+        self.assertEqual(self.completed, [('task-1', 'success', 'snapshot-9', None),
+                                          ('task-2', 'error', None, 'Locked')])
+        self.assertEqual(self.collector.WaitForUpdatesEx.call_args[1]['version'], '1')
+        self.assertEqual(self.monitor.tasks, {})
+
+    def test_finished_tasks_leave_the_view(self):
+        """Test a finished task is removed from the view with the next wait."""
+        self.monitor.watch(vim.Task('task-1'), self.on_complete)
+        self.collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success')),
+            None,
+        ]
+        self.monitor.wait()
+
+        self.monitor.wait()
+
+        _, kwargs = self.view.ModifyListView.call_args
+        self.assertEqual([task._moId for task in kwargs['remove']], ['task-1'])
+
+    def test_close_destroys_server_objects(self):
+        """Test the private collector and view are released."""
+        self.monitor.open()
+
+        self.monitor.close()
+
+        self.collector.Destroy.assert_called_once()
+        self.view.Destroy.assert_called_once()
+
+def make_sessions(si):
+    """Build a registry for one fake vCenter whose leases hand out the fake connection itself"""
+    return SessionRegistry({'vc1': si}, clone=lambda si: si)
+
+def start_task(obj, **kwargs):
+    """Stand-in for *_Task methods: snapshot-2 / vm-2 return task-2"""
+    return vim.Task('task-' + obj._moId.split('-')[-1])
+
+def make_delete_items(count):
+    """Build selected (snapshot ID, record) pairs whose deletions return task-1, task-2, ..."""
+    items = []
+    for index in range(1, count + 1):
+        items.append((f'vc1_web0{index}_patch', {'vm_name': f'web0{index}', 'vcenter': 'vc1', 'name': f'patch{index}',
+                                                 'vm_moref': f'vm-{index}', 'snapshot_moref': f'snapshot-{index}'}))
+    return items
+
+class TestSnapshotDeleteWorker(unittest.TestCase):
+    def setUp(self):
+        """Set up a fake vCenter whose VMs all live on one datastore."""
+        self.si, self.view, self.collector = make_connection()
+        patcher = patch('vmware_snapshot_manager.retrieve_object_properties',
+                        side_effect=lambda si, vms, obj_type, properties: {
+                            vm._moId: {'datastore': [vim.Datastore('datastore-1')]} for vm in vms})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(vim.vm.Snapshot, 'RemoveSnapshot_Task', start_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reports_each_deletion_result(self):
+        """Test successful deletions are removed and failures reported."""
+        self.collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-2', 'enter', info_state='error', info_error=make_error('Locked'))),
+        ]
+        items = make_delete_items(2)
+        worker = SnapshotDeleteWorker(items, make_sessions(self.si), per_datastore_limit=None)
+        deleted, errors = [], []
+        worker.item_complete.connect(deleted.append)
+        worker.error.connect(errors.append)
+
+        worker.delete_on_vcenter('vc1', items)
+
+        self.assertEqual(deleted, ['vc1_web01_patch'])
+        self.assertEqual(errors, ['Failed to delete patch2: Locked'])
+        self.collector.Destroy.assert_called_once()
+
+    def test_datastore_limit_queues_deletions(self):
+        """Test deletions on a busy datastore wait in the queue and progress shows the counts."""
+        self.collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success')),
+            make_update_set('2', make_task_update('task-2', 'enter', info_state='success')),
+            make_update_set('3', make_task_update('task-3', 'enter', info_state='success')),
+        ]
+        items = make_delete_items(3)
+        worker = SnapshotDeleteWorker(items, make_sessions(self.si), per_datastore_limit=1)
+        messages = []
+        worker.progress.connect(lambda completed, total, msg: messages.append(msg))
+
+        worker.delete_on_vcenter('vc1', items)
+
+        added = [[task._moId for task in call[1]['add']] for call in self.view.ModifyListView.call_args_list]
+        self.assertEqual(added, [['task-1'], ['task-2'], ['task-3']])
+        self.assertIn('Deleting: 2 queued, 1 running, 0 done (0%) (0/3)', messages)
+        self.assertEqual((worker.queued, worker.running, worker.completed), (0, 0, 3))
+
+def make_server_list(count):
+    """Build resolved (VM, server name) pairs; create_on_vcenter rebinds them to its lease"""
+    return [(vim.VirtualMachine(f'vm-{index}'), f'web0{index}') for index in range(1, count + 1)]
+
+class TestAdaptiveWindow(unittest.TestCase):
+    def test_grows_after_a_window_of_healthy_tasks(self):
+        """Test the window widens by one once a full window completes quickly."""
+        window = AdaptiveWindow(initial=2, maximum=3)
+
+        for _ in range(2):
+            window.record(1.0)
+        self.assertEqual(window.size, 3)
+
+        for _ in range(3):
+            window.record(1.0)
+        self.assertEqual(window.size, 3)
+
+    def test_shrinks_on_failure_or_slow_task(self):
+        """Test failures and latency spikes halve the window down to the minimum."""
+        window = AdaptiveWindow(initial=8, latency_factor=3.0)
+        window.record(1.0)
+
+        window.record(5.0)
+        self.assertEqual(window.size, 4)
+        window.record(1.0, success=False)
+        self.assertEqual(window.size, 2)
+        window.record(1.0, success=False)
+        window.record(1.0, success=False)
+        self.assertEqual(window.size, 1)
+
+class TestSnapshotCreateWorker(unittest.TestCase):
+    def setUp(self):
+        """Make every VM's create return the task numbered like the VM."""
+        patcher = patch.object(vim.VirtualMachine, 'CreateSnapshot_Task', start_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_submits_next_vm_as_soon_as_a_slot_frees(self):
+        """Test a finished create is replaced right away instead of waiting for the batch."""
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-2', 'enter', info_state='running')),
+            make_update_set('2', make_task_update('task-2', info_state='success'),
+                            make_task_update('task-3', 'enter', info_state='success')),
+        ]
+        server_list = make_server_list(3)
+        worker = SnapshotCreateWorker(make_sessions(si), ['web01', 'web02', 'web03'], 'patching',
+                                      vcenter_username='admin', window_size=2, max_window_size=2)
+
+        with patch('vmware_snapshot_manager.retrieve_object_properties', return_value={}) as lookup:
+            worker.create_on_vcenter('vc1', server_list)
+
+        added = [[task._moId for task in call[1]['add']] for call in view.ModifyListView.call_args_list]
+        self.assertEqual(added, [['task-1', 'task-2'], ['task-3']])
+        self.assertEqual(worker.completed, 3)
+        self.assertEqual(worker.failed, [])
+        # One snapshot lookup per completion wave
+        self.assertEqual([[vm._moId for vm in call[0][1]] for call in lookup.call_args_list],
+                         [['vm-1'], ['vm-2', 'vm-3']])
+
+    def test_failed_creates_count_as_finished(self):
+        """Test progress reaches the total when some creates fail, with failures reported apart."""
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-2', 'enter', info_state='error', info_error=make_error('disk full'))),
+        ]
+        worker = SnapshotCreateWorker(make_sessions(si), ['web01', 'web02', 'web03'], 'patching',
+                                      vcenter_username='admin')
+        worker.vm_index = MagicMock(**{'resolve.return_value': ({'vc1': make_server_list(2)}, ['web03'])})
+        progress = []
+        worker.progress.connect(lambda completed, total, message: progress.append((completed, total, message)))
+
+        with patch('vmware_snapshot_manager.retrieve_object_properties', return_value={}):
+            worker.run()
+
+        self.assertEqual((worker.completed, worker.succeeded), (3, 1))
+        self.assertEqual(progress[-1][:2], (3, 3))
+        self.assertIn("1 created, 2 failed", progress[-1][2])
+
+    def test_per_host_limit_holds_back_vms_on_a_busy_host(self):
+        """Test only one create runs per host when a per-host limit of one is set."""
+        si, view, collector = make_connection()
+        collector.WaitForUpdatesEx.side_effect = [
+            make_update_set('1', make_task_update('task-1', 'enter', info_state='success'),
+                            make_task_update('task-3', 'enter', info_state='success')),
+            make_update_set('2', make_task_update('task-2', 'enter', info_state='success')),
+        ]
+        server_list = make_server_list(3)
+        worker = SnapshotCreateWorker(make_sessions(si), ['web01', 'web02', 'web03'], 'patching',
+                                      vcenter_username='admin', per_host_limit=1)
+        hosts = {'vm-1': 'host-1', 'vm-2': 'host-1', 'vm-3': 'host-2'}
+
+        placement = {moid: {'runtime.host': vim.HostSystem(host)} for moid, host in hosts.items()}
+
+        with patch('vmware_snapshot_manager.retrieve_object_properties', return_value=placement):
+            worker.create_on_vcenter('vc1', server_list)
+
+        added = [[task._moId for task in call[1]['add']] for call in view.ModifyListView.call_args_list]
+        self.assertEqual(added, [['task-1', 'task-3'], ['task-2']])
+
+    def test_record_is_built_from_task_result(self):
+        """Test the new snapshot is found by the MoRef the task returned, not by name."""
+        worker = SnapshotCreateWorker(SessionRegistry(), ['web01'], 'patching', vcenter_username='admin')
+        records = []
+        worker.snapshot_created.connect(records.append)
+        older = make_snapshot_tree('Monthly OS Patching', description='Created by: alice')
+        newer = make_snapshot_tree('Monthly OS Patching', description='Created by: admin')
+        newer.snapshot = vim.vm.Snapshot('snapshot-new')
+        older.childSnapshotList = [newer]
+        vm = vim.VirtualMachine('vm-1')
+        properties = {'vm-1': {'name': 'WEB01', 'snapshot': vim.vm.SnapshotInfo(rootSnapshotList=[older])}}
+
+        with patch('vmware_snapshot_manager.retrieve_object_properties', return_value=properties):
+            worker.report_created(MagicMock(), 'vc1', [(vm, 'web01', vim.vm.Snapshot('snapshot-new'))])
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['snapshot_moref'], 'snapshot-new')
+        self.assertEqual(records[0]['vm_name'], 'WEB01')
+        self.assertEqual(records[0]['created_by'], 'admin')
+        self.assertEqual(records[0]['vm_moref'], 'vm-1')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,29 @@
 import unittest
-from vmware_snapshot_manager import SnapshotFetchWorker
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+from vmware_snapshot_manager import SnapshotFetchWorker, BusinessDayCalendar, calendar_days_since, extract_creator
+
+def count_business_days(start_date, end_date, holidays=()):
+    """Reference count stepping one day at a time"""
+    current = start_date
+    business_days = 0
+    while current <= end_date:
+        if current.weekday() < 5 and current.date() not in holidays:
+            business_days += 1
+        current += timedelta(days=1)
+    return business_days
+
+def search_creator(description):
+    """Reference extraction running one search per pattern"""
+    if not description:
+        return 'Unknown'
+    for pattern in (r'Created by:\s*(\w+)', r'\(Created by:\s*(\w+)\)', r'User:\s*(\w+)', r'By:\s*(\w+)'):
+        match = re.search(pattern, description, re.IGNORECASE)
+        if match:
+            return match.group(1)
+    return 'Unknown'
 
 class TestUtilityFunctions(unittest.TestCase):
     def setUp(self):
@@ -72,6 +96,53 @@ class TestUtilityFunctions(unittest.TestCase):
         result = self.worker.extract_creator_from_description(description)
         self.assertEqual(result, "admin")
     
+    def test_extract_creator_pattern_priority(self):
+        """Test an earlier pattern wins even when a later one appears first in the text."""
+        test_cases = [
+            "User: guest, then Created by: admin",
+            "By: bob\nUser: alice",
+            "Patch window\n(Created by: svc_patch) User: ops",
+        ]
+        
+        for description in test_cases:
+            with self.subTest(description=description):
+                self.assertEqual(extract_creator(description), search_creator(description))
+    
+    def test_extract_creator_is_memoized(self):
+        """Test repeated descriptions are answered from the memo."""
+        description = "Monthly OS Patching (Created by: memo_user)"
+        extract_creator(description)
+        hits = extract_creator.cache_info().hits
+        
+        for _ in range(100):
+            extract_creator(description)
+        
+        self.assertEqual(extract_creator.cache_info().hits, hits + 100)
+    
+    def test_extract_creator_benchmark(self):
+        """Micro-benchmark: repetitive patching descriptions against one search per pattern.
+        
+        Timings are only reported; the assertion is on the results, so a loaded
+        machine can't fail the suite.
+        """
+        descriptions = [f"Monthly OS Patching (Created by: user{i % 20})" for i in range(20000)]
+        
+        def best_of(func, runs=3):
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                for description in descriptions:
+                    func(description)
+                times.append(time.perf_counter() - start)
+            return min(times)
+        
+        reference = best_of(search_creator)
+        memoized = best_of(extract_creator)
+        
+        self.assertEqual([extract_creator(d) for d in descriptions], [search_creator(d) for d in descriptions])
+        print(f"\n  extract_creator: {memoized * 1000:.1f} ms, one search per pattern: {reference * 1000:.1f} ms",
+              file=sys.stderr)
+    
     def test_extract_creator_whitespace_handling(self):
         """Test handling of whitespace around usernames."""
         test_cases = [
@@ -85,5 +156,50 @@ class TestUtilityFunctions(unittest.TestCase):
                 result = self.worker.extract_creator_from_description(description)
                 self.assertEqual(result, expected)
 
+class TestBusinessDayCalendar(unittest.TestCase):
+    def test_matches_day_by_day_count(self):
+        """Test the ordinal arithmetic agrees with stepping through each day."""
+        calendar = BusinessDayCalendar()
+        end_date = datetime(2024, 3, 13, 9, 15)  # Wednesday morning
+        for days_back in range(0, 40):
+            for hour in (8, 10):
+                start_date = datetime(2024, 3, 13, hour, 0) - timedelta(days=days_back)
+                with self.subTest(start=start_date):
+                    self.assertEqual(calendar.business_days(start_date, end_date),
+                                     count_business_days(start_date, end_date))
+
+    def test_holidays_are_excluded(self):
+        """Test weekday holidays are not counted and weekend ones change nothing."""
+        holidays = {date(2024, 12, 25), date(2024, 12, 28)}  # Wednesday, Saturday
+        calendar = BusinessDayCalendar(holidays)
+        start_date = datetime(2024, 12, 20, 12, 0)
+        end_date = datetime(2025, 1, 3, 12, 0)
+
+        self.assertEqual(calendar.business_days(start_date, end_date), 10)
+        self.assertEqual(calendar.business_days(start_date, end_date),
+                         count_business_days(start_date, end_date, holidays))
+
+    def test_end_before_start(self):
+        """Test a start in the future counts no days."""
+        calendar = BusinessDayCalendar()
+
+        self.assertEqual(calendar.business_days(datetime(2024, 1, 2), datetime(2024, 1, 1)), 0)
+
+    def test_batch_matches_single_calls(self):
+        """Test the batch pass gives the same ages as single calls."""
+        calendar = BusinessDayCalendar([date(2024, 3, 11)])
+        end_date = datetime(2024, 3, 13, 9, 15)
+        start_dates = [end_date - timedelta(hours=hours) for hours in range(0, 24 * 30, 7)]
+        start_dates += [None, end_date + timedelta(hours=1)]
+
+        expected = [calendar.business_days(start_date, end_date) for start_date in start_dates[:-2]] + [None, 0]
+        self.assertEqual(calendar.business_days_since(start_dates, end_date), expected)
+
+    def test_calendar_days_since(self):
+        """Test whole calendar days are counted and unknown dates kept as None."""
+        end_date = datetime(2024, 3, 13, 9, 15)
+
+        self.assertEqual(calendar_days_since([datetime(2024, 3, 10, 10, 0), None], end_date), [2, None])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
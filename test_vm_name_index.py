@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from pyVmomi import vim
+from vmware_snapshot_manager import VMNameIndex
+
+def make_inventory(*names):
+    """Build bulk 'name' retrieval results for a vCenter"""
+    return [(vim.VirtualMachine(f"vm-{name}"), {'name': name}) for name in names]
+
+class TestVMNameIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up two fake vCenters with their VM inventories."""
+        self.connections = {'vc1': MagicMock(), 'vc2': MagicMock()}
+        self.inventories = {
+            id(self.connections['vc1']): make_inventory('WEB01', 'web02'),
+            id(self.connections['vc2']): make_inventory('db01', 'web01'),
+        }
+        patcher = patch('vmware_snapshot_manager.retrieve_properties',
+                        side_effect=lambda si, obj_type, properties: iter(self.inventories[id(si)]))
+        self.retrieve = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resolves_list_with_one_retrieval_per_vcenter(self):
+        """Test every name is matched case-insensitively from a single scan per vCenter."""
+        index = VMNameIndex()
+
+        found, missing = index.resolve(self.connections, ['web01', 'db01', 'WEB02', 'app01'])
+
+        self.assertEqual(self.retrieve.call_count, 2)
+        self.assertEqual([(vm._moId, name) for vm, name in found['vc1']], [('vm-WEB01', 'web01'), ('vm-web02', 'WEB02')])
+        self.assertEqual([(vm._moId, name) for vm, name in found['vc2']], [('vm-db01', 'db01')])
+        self.assertEqual(missing, ['app01'])
+
+    def test_cached_index_is_reused_within_ttl(self):
+        """Test a second resolve doesn't scan the inventory again."""
+        index = VMNameIndex(ttl=300)
+        index.resolve(self.connections, ['web01'])
+
+        index.resolve(self.connections, ['db01'])
+
+        self.assertEqual(self.retrieve.call_count, 2)
+
+    def test_expired_index_is_rebuilt(self):
+        """Test an index older than the TTL is rebuilt."""
+        index = VMNameIndex(ttl=0)
+        index.get('vc1', self.connections['vc1'])
+
+        _, fresh = index.get('vc1', self.connections['vc1'])
+
+        self.assertTrue(fresh)
+        self.assertEqual(self.retrieve.call_count, 2)
+
+    def test_missing_name_rebuilds_cached_index_once(self):
+        """Test a VM created after the index was built is still found."""
+        index = VMNameIndex()
+        index.get('vc1', self.connections['vc1'])
+        self.inventories[id(self.connections['vc1'])] = make_inventory('web01', 'new01')
+
+        found, missing = index.resolve({'vc1': self.connections['vc1']}, ['new01', 'gone01'])
+
+        self.assertEqual([name for _, name in found['vc1']], ['new01'])
+        self.assertEqual(missing, ['gone01'])
+        self.assertEqual(self.retrieve.call_count, 2)
+
+    def test_invalidate_drops_index(self):
+        """Test invalidating a vCenter forces a new scan."""
+        index = VMNameIndex()
+        index.get('vc1', self.connections['vc1'])
+
+        index.invalidate('vc1')
+        _, fresh = index.get('vc1', self.connections['vc1'])
+
+        self.assertTrue(fresh)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,51 +1,614 @@
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QPushButton, 
-                            QLabel, QVBoxLayout, QHBoxLayout, QTreeWidget, 
-                            QTreeWidgetItem, QDialog, QLineEdit, QGridLayout,
+                            QLabel, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
+                            QAbstractItemView, QStyledItemDelegate, QDialog, QLineEdit, QGridLayout,
                             QCheckBox, QMessageBox, QComboBox, QFrame,
-                            QTreeWidgetItemIterator, QMenu, QTextEdit, QProgressBar)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer, QMimeData
-from pyVim.connect import SmartConnect, Disconnect
+                            QMenu, QTextEdit, QProgressBar)
+from PyQt6.QtCore import (Qt, pyqtSignal, QThread, QTimer, QMimeData, QAbstractTableModel,
+                          QAbstractProxyModel, QModelIndex)
+from pyVim.connect import SmartConnect, Disconnect, parse_hostport
 from pyVmomi import vim, vmodl
+from pyVmomi.SoapAdapter import SoapStubAdapter
 import ssl
 import socket
 import os
 import json
 import logging
 from logging.handlers import RotatingFileHandler
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, date, timezone
 import urllib3
 import time
-from PyQt6.QtGui import QColor, QBrush, QIcon
+from PyQt6.QtGui import QColor, QBrush, QIcon, QFont, QPalette
 import keyring
 from PyQt6.QtCore import QSettings
 import getpass
 import re
-from snapshot_filters import SnapshotFilterPanel
+import bisect
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, ExitStack
+from functools import partial, lru_cache
+from collections import namedtuple
+from snapshot_filters import (SnapshotFilterPanel, SnapshotFilter, get_snapshot_type,
+                              created_timestamp, format_created)
 from version import __version__
 
 # Built by Christian Salas
 
-def format_vmware_time(vmware_datetime):
+def vmware_timestamp(vmware_datetime):
     """
-    Convert VMware's UTC datetime to local timezone and format as string.
+    Convert a VMware datetime to Unix epoch seconds.
     
     Args:
-        vmware_datetime: VMware createTime datetime object (assumed to be UTC)
+        vmware_datetime: VMware datetime (treated as UTC if it has no timezone)
         
     Returns:
-        str: Formatted datetime string in local timezone ('YYYY-MM-DD HH:MM')
+        float: Seconds since the epoch
     """
-    # VMware createTime appears to be in UTC, convert to local timezone
     if vmware_datetime.tzinfo is None:
-        # Treat as UTC if no timezone info
         vmware_datetime = vmware_datetime.replace(tzinfo=timezone.utc)
+    return vmware_datetime.timestamp()
+
+# VM properties needed to build snapshot records. The 'snapshot' property carries
+# the whole snapshot tree as data objects, so no further round trips are needed.
+SNAPSHOT_VM_PROPERTIES = ['name', 'snapshot']
+
+# Default number of VMs requested per RetrievePropertiesEx page (maxObjects)
+FETCH_PAGE_SIZE = 250
+
+# One node of a VM's snapshot tree with its position in the tree. IDs are
+# snapshot MoRef IDs; chain_position is 1 for the chain root.
+SnapshotNode = namedtuple(
+    'SnapshotNode', ['snapshot', 'parent_id', 'depth', 'child_count', 'chain_root', 'chain_position']
+)
+
+def walk_snapshot_tree(root_snapshots):
+    """
+    Walk a snapshot tree once, depth first, without recursion.
+    
+    Works directly on the bulk-retrieved VirtualMachine.snapshot property
+    (rootSnapshotList), so no server round trips are made. Snapshots are
+    yielded parents first, children in vSphere's order.
+    
+    Args:
+        root_snapshots (list): vim.vm.SnapshotTree nodes, e.g. rootSnapshotList
+        
+    Yields:
+        SnapshotNode for every snapshot in the tree
+    """
+    # (node, parent ID, depth, chain root ID); reversed so the first root pops first
+    stack = [(snapshot, None, 0, None) for snapshot in reversed(root_snapshots or [])]
+    while stack:
+        snapshot, parent_id, depth, chain_root = stack.pop()
+        snapshot_id = snapshot.snapshot._moId
+        chain_root = chain_root or snapshot_id
+        children = snapshot.childSnapshotList or []
+        yield SnapshotNode(snapshot, parent_id, depth, len(children), chain_root, depth + 1)
+        for child in reversed(children):
+            stack.append((child, snapshot_id, depth + 1, chain_root))
+
+def build_container_filter_spec(container, obj_type, properties, view_type=vim.view.ContainerView):
+    """
+    Build a PropertyCollector filter spec covering every object in a view.
+
+    Args:
+        container: vim.view.ContainerView (or other view) to traverse
+        obj_type: Managed object type to collect
+        properties (list): Property paths to collect for each object
+        view_type: Type of the view, e.g. vim.view.ListView for an explicit object list
+
+    Returns:
+        vmodl.query.PropertyCollector.FilterSpec
+    """
+    traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+        name='traverseEntities',
+        path='view',
+        skip=False,
+        type=view_type
+    )
+    object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+        obj=container, skip=True, selectSet=[traversal_spec]
+    )
+    property_spec = vmodl.query.PropertyCollector.PropertySpec(
+        type=obj_type, pathSet=properties, all=False
+    )
+    return vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[object_spec], propSet=[property_spec]
+    )
+
+def retrieve_property_pages(si, obj_type, properties, max_objects=FETCH_PAGE_SIZE):
+    """
+    Retrieve properties for every managed object of a type, one page at a time.
+
+    Uses a ContainerView traversal with PropertyCollector.RetrievePropertiesEx and
+    ContinueRetrievePropertiesEx so the whole inventory comes back in a few paged
+    calls instead of one SOAP round trip per property access. Only one page is
+    held at a time, so memory stays flat regardless of inventory size.
+
+    Args:
+        si: Connected vCenter ServiceInstance
+        obj_type: Managed object type to collect (e.g. vim.VirtualMachine)
+        properties (list): Property paths to retrieve for each object
+        max_objects (int): Maximum number of objects returned per page
+
+    Yields:
+        list: (managed object, dict of property path -> value) tuples for one page
+    """
+    content = si.RetrieveContent()
+    container = content.viewManager.CreateContainerView(
+        content.rootFolder, [obj_type], True
+    )
+    collector = content.propertyCollector
+    token = None
+
+    try:
+        filter_spec = build_container_filter_spec(container, obj_type, properties)
+        options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=max_objects)
+
+        result = collector.RetrievePropertiesEx(specSet=[filter_spec], options=options)
+        while result:
+            token = result.token
+            yield [
+                (obj_content.obj, {prop.name: prop.val for prop in obj_content.propSet or []})
+                for obj_content in result.objects
+            ]
+
+            if not token:
+                break
+            result = collector.ContinueRetrievePropertiesEx(token=token)
+            token = None
+    finally:
+        # Release server-side paging state if the caller stopped early
+        if token:
+            try:
+                collector.CancelRetrievePropertiesEx(token=token)
+            except Exception:
+                pass
+        container.Destroy()
+
+def retrieve_properties(si, obj_type, properties, max_objects=FETCH_PAGE_SIZE):
+    """
+    Retrieve properties for every managed object of a type in bulk.
+
+    Args:
+        si: Connected vCenter ServiceInstance
+        obj_type: Managed object type to collect (e.g. vim.VirtualMachine)
+        properties (list): Property paths to retrieve for each object
+        max_objects (int): Maximum number of objects returned per page
+
+    Yields:
+        tuple: (managed object, dict of property path -> value)
+    """
+    for page in retrieve_property_pages(si, obj_type, properties, max_objects):
+        yield from page
+
+def retrieve_object_properties(si, objects, obj_type, properties):
+    """
+    Retrieve properties for a known list of managed objects in one call.
+
+    Args:
+        si: Connected vCenter ServiceInstance
+        objects (list): Managed objects of obj_type
+        obj_type: Managed object type of the objects
+        properties (list): Property paths to retrieve for each object
+
+    Returns:
+        dict: MoRef ID -> dict of property path -> value
+    """
+    if not objects:
+        return {}
     
-    # Convert to local timezone
-    local_time = vmware_datetime.astimezone()
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=obj, skip=False) for obj in objects],
+        propSet=[vmodl.query.PropertyCollector.PropertySpec(type=obj_type, pathSet=properties, all=False)]
+    )
+    collector = si.RetrieveContent().propertyCollector
+    results = {}
     
-    # Format as string
-    return local_time.strftime('%Y-%m-%d %H:%M')
+    result = collector.RetrievePropertiesEx(specSet=[filter_spec],
+                                            options=vmodl.query.PropertyCollector.RetrieveOptions())
+    while result:
+        for obj_content in result.objects:
+            results[obj_content.obj._moId] = {prop.name: prop.val for prop in obj_content.propSet or []}
+        if not result.token:
+            break
+        result = collector.ContinueRetrievePropertiesEx(token=result.token)
+    return results
+
+# Seconds before connecting and logging in to a vCenter gives up
+CONNECT_TIMEOUT = 15
+
+# Socket timeout of calls made once logged in (None: no limit). Large property
+# pages, event reads and task waits can take far longer than a login.
+REQUEST_TIMEOUT = None
+
+# Saved vCenters connected to at the same time during auto-connect
+AUTO_CONNECT_WORKERS = 8
+
+def connect_vcenter(hostname, username, password, timeout=CONNECT_TIMEOUT):
+    """
+    Log in to a vCenter with certificate checks disabled.
+
+    The timeout is passed to SmartConnect for this connection only, instead
+    of changing the process-wide socket default under other threads, and
+    only covers the login; later calls use REQUEST_TIMEOUT. SmartConnect's
+    API version discovery opens its own connection without a timeout, so
+    the host is checked for reachability first.
+
+    Args:
+        hostname (str): vCenter hostname
+        username (str): Login user
+        password (str): Login password
+        timeout (float): Connect and login timeout in seconds
+
+    Returns:
+        vim.ServiceInstance or None
+    """
+    check_reachable(hostname, timeout)
+    si = SmartConnect(
+        host=hostname,
+        user=username,
+        pwd=password,
+        sslContext=unverified_ssl_context(),
+        disableSslCertValidation=True,
+        httpConnectionTimeout=timeout
+    )
+    return release_connect_timeout(si) if si else si
+
+def resume_vcenter_session(hostname, session_id, timeout=CONNECT_TIMEOUT):
+    """
+    Reattach to an existing vCenter session instead of logging in again.
+
+    Args:
+        hostname (str): vCenter hostname
+        session_id (str): vmware_soap_session cookie value of the earlier session
+        timeout (float): Connect timeout in seconds
+
+    Returns:
+        vim.ServiceInstance, or None if the session has expired
+    """
+    check_reachable(hostname, timeout)
+    si = SmartConnect(
+        host=hostname,
+        sessionId=session_id,
+        sslContext=unverified_ssl_context(),
+        disableSslCertValidation=True,
+        httpConnectionTimeout=timeout
+    )
+    
+    # One cheap call: currentSession is unset once the session is gone
+    if si.RetrieveContent().sessionManager.currentSession is None:
+        return None
+    return release_connect_timeout(si)
+
+def release_connect_timeout(si, timeout=REQUEST_TIMEOUT):
+    """
+    Switch a logged-in connection from the connect timeout to the request timeout.
+    
+    pyVmomi applies its httpConnectionTimeout to every call on the stub, so
+    leaving the connect timeout in place would cut off slow property pages,
+    event reads and task waits.
+    
+    Args:
+        si: Logged-in vim.ServiceInstance
+        timeout (float): Request timeout in seconds, None for no limit
+        
+    Returns:
+        vim.ServiceInstance: si
+    """
+    stub = si._stub
+    if timeout is None:
+        stub.schemeArgs.pop('timeout', None)
+    else:
+        stub.schemeArgs['timeout'] = timeout
+    # Pooled sockets keep the timeout they were opened with
+    stub.DropConnections()
+    return si
+
+def check_reachable(hostname, timeout):
+    """
+    Open and close a TCP connection to a vCenter's HTTPS port.
+    
+    Bounds the first connect to an unreachable host by the connect timeout
+    instead of the OS default of minutes.
+    
+    Args:
+        hostname (str): vCenter hostname, optionally with ':port'
+        timeout (float): Connect timeout in seconds
+        
+    Raises:
+        OSError: The host can't be reached (socket.timeout if it doesn't answer)
+    """
+    host, port = parse_hostport(hostname, 443)
+    socket.create_connection((host, port), timeout=timeout).close()
+
+def unverified_ssl_context():
+    """SSL context for vCenters with self-signed certificates"""
+    # Create SSL context that ignores verification
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    
+    # Disable SSL verification warnings
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return context
+
+def clone_service_instance(si, timeout=REQUEST_TIMEOUT):
+    """
+    Create a ServiceInstance with its own SOAP stub on an existing session.
+    
+    pyVmomi stubs must not be shared between threads. The clone talks to the
+    same vCenter with the same session cookie, so no extra login is made.
+    
+    Args:
+        si: Logged-in vim.ServiceInstance
+        timeout (float): Socket timeout of the clone's calls, None for no limit
+        
+    Returns:
+        vim.ServiceInstance
+    """
+    stub = si._stub
+    clone = SoapStubAdapter(
+        url=f"https://{stub.host}{stub.path}",
+        version=stub.version,
+        sslContext=stub.schemeArgs.get('context'),
+        httpConnectionTimeout=timeout,
+        sessionId=stub.GetSessionId()
+    )
+    return vim.ServiceInstance('ServiceInstance', clone)
+
+# Idle per-thread connections kept for reuse per vCenter
+SESSION_POOL_SIZE = 4
+
+class SessionRegistry:
+    """
+    Thread-safe registry of vCenter connections.
+    
+    The GUI thread registers one logged-in ServiceInstance per vCenter. Worker
+    threads never make calls through it; they lease a clone with its own stub
+    on the same session, taken from a small idle pool per vCenter. That lets
+    fetch, create and delete run at the same time without sharing a stub.
+    
+    The registered connection itself is only used by the health monitor.
+    Replacing it (e.g. after a reconnect) drops the idle clones of the old
+    session; clones still leased are discarded when they are returned.
+    """
+    def __init__(self, connections=None, pool_size=SESSION_POOL_SIZE, clone=clone_service_instance):
+        self.pool_size = pool_size
+        self.clone = clone  # Builds a thread's own ServiceInstance from the registered one
+        self._connections = dict(connections or {})  # hostname -> registered ServiceInstance
+        self._idle = {}  # hostname -> [idle ServiceInstance clones]
+        self._generations = {}  # hostname -> bumped whenever the connection is replaced
+        self._lock = threading.Lock()
+
+    def __setitem__(self, hostname, si):
+        with self._lock:
+            self._connections[hostname] = si
+            self._generations[hostname] = self._generations.get(hostname, 0) + 1
+            self._idle.pop(hostname, None)
+
+    def __getitem__(self, hostname):
+        with self._lock:
+            return self._connections[hostname]
+
+    def __contains__(self, hostname):
+        with self._lock:
+            return hostname in self._connections
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._connections)
+
+    def get(self, hostname, default=None):
+        with self._lock:
+            return self._connections.get(hostname, default)
+
+    def keys(self):
+        with self._lock:
+            return list(self._connections)
+
+    def items(self):
+        """Snapshot of (hostname, ServiceInstance) pairs; safe to iterate while the registry changes"""
+        with self._lock:
+            return list(self._connections.items())
+
+    def pop(self, hostname, default=None):
+        with self._lock:
+            self._idle.pop(hostname, None)
+            self._generations[hostname] = self._generations.get(hostname, 0) + 1
+            return self._connections.pop(hostname, default)
+
+    def clear(self):
+        with self._lock:
+            for hostname in self._connections:
+                self._generations[hostname] = self._generations.get(hostname, 0) + 1
+            self._connections.clear()
+            self._idle.clear()
+
+    def open_session(self, hostname):
+        """
+        Get a ServiceInstance with its own stub that is never pooled.
+        
+        Meant for long-lived workers such as live update subscriptions.
+        
+        Raises:
+            RuntimeError: If the vCenter isn't connected
+        """
+        si = self.get(hostname)
+        if si is None:
+            raise RuntimeError(f"Not connected to {hostname}")
+        return self.clone(si)
+
+    @contextmanager
+    def lease(self, hostname):
+        """
+        Lease a ServiceInstance for use on the calling thread.
+        
+        Args:
+            hostname (str): vCenter hostname
+            
+        Yields:
+            vim.ServiceInstance that no other thread uses until it is returned
+            
+        Raises:
+            RuntimeError: If the vCenter isn't connected
+        """
+        with self._lock:
+            if hostname not in self._connections:
+                raise RuntimeError(f"Not connected to {hostname}")
+            generation = self._generations.get(hostname, 0)
+            idle = self._idle.get(hostname)
+            si = idle.pop() if idle else None
+            registered = self._connections[hostname]
+        
+        if si is None:
+            si = self.clone(registered)
+        try:
+            yield si
+        finally:
+            with self._lock:
+                # Clones of a replaced connection belong to an old session
+                if self._generations.get(hostname, 0) == generation:
+                    idle = self._idle.setdefault(hostname, [])
+                    if len(idle) < self.pool_size:
+                        idle.append(si)
+
+    @contextmanager
+    def lease_all(self):
+        """
+        Lease one ServiceInstance per connected vCenter.
+        
+        Yields:
+            dict: hostname -> leased ServiceInstance
+        """
+        with ExitStack() as stack:
+            yield {hostname: stack.enter_context(self.lease(hostname)) for hostname in self.keys()}
+
+class BusinessDayCalendar:
+    """
+    Constant-time business day counting with an optional holiday calendar.
+    
+    Business days are counted through ordinals: the number of business days
+    before a date, from weekday arithmetic minus the weekday holidays before
+    it. Ordinals are cached per date, so ages for many snapshots created on
+    the same days cost a dictionary lookup each.
+    """
+    def __init__(self, holidays=()):
+        """
+        Args:
+            holidays (iterable): date objects that are not business days
+        """
+        # Weekend holidays don't change the count, so only weekday ones are kept
+        self.holiday_ordinals = sorted({day.toordinal() for day in holidays if day.weekday() < 5})
+        self._ordinal_cache = {}
+
+    def business_day_ordinal(self, ordinal):
+        """
+        Count the business days before a date.
+        
+        Args:
+            ordinal (int): date.toordinal() of the date
+            
+        Returns:
+            int: Business days from 0001-01-01 up to, not including, the date
+        """
+        cached = self._ordinal_cache.get(ordinal)
+        if cached is None:
+            # Ordinal 1 (0001-01-01) is a Monday: full weeks give 5 days, the rest up to 5
+            weeks, extra_days = divmod(ordinal - 1, 7)
+            cached = weeks * 5 + min(extra_days, 5) - bisect.bisect_left(self.holiday_ordinals, ordinal)
+            self._ordinal_cache[ordinal] = cached
+        return cached
+
+    def business_days(self, start_date, end_date):
+        """
+        Count the business days a snapshot has existed, including its first day.
+        
+        Matches counting each day from start_date in steps of one day while the
+        step is not after end_date.
+        
+        Args:
+            start_date (datetime): Start of the period
+            end_date (datetime): End of the period
+            
+        Returns:
+            int: Number of business days, 0 if end_date is before start_date
+        """
+        if end_date < start_date:
+            return 0
+        first = start_date.toordinal()
+        last = first + (end_date - start_date).days
+        return self.business_day_ordinal(last + 1) - self.business_day_ordinal(first)
+
+    def business_days_since(self, start_dates, end_date):
+        """
+        Count business days for many start dates against one end date.
+        
+        Args:
+            start_dates (list): datetime objects, or None for unknown dates
+            end_date (datetime): End of the period, usually now
+            
+        Returns:
+            list: Business day counts, None where the start date is None
+        """
+        end_ordinal = end_date.toordinal()
+        end_time = end_date.time()
+        end_count = self.business_day_ordinal(end_ordinal + 1)
+        ordinal_of = self.business_day_ordinal
+        
+        ages = []
+        for start_date in start_dates:
+            if start_date is None:
+                ages.append(None)
+            elif start_date > end_date:
+                ages.append(0)
+            elif start_date.time() <= end_time:
+                # The last counted day is end_date's day
+                ages.append(end_count - ordinal_of(start_date.toordinal()))
+            else:
+                # The last step lands after end_date's time, so stop a day earlier
+                ages.append(ordinal_of(end_ordinal) - ordinal_of(start_date.toordinal()))
+        return ages
+
+def calendar_days_since(start_dates, end_date):
+    """
+    Count whole calendar days for many start dates against one end date.
+    
+    Args:
+        start_dates (list): datetime objects, or None for unknown dates
+        end_date (datetime): End of the period, usually now
+        
+    Returns:
+        list: Calendar day counts, None where the start date is None
+    """
+    return [None if start_date is None else (end_date - start_date).days for start_date in start_dates]
+
+def load_holidays():
+    """
+    Load the holiday calendar used for business day ages.
+    
+    Holidays are read from the "BusinessDayHolidays" setting as a list of
+    'YYYY-MM-DD' dates; invalid entries are skipped.
+    
+    Returns:
+        list: date objects
+    """
+    settings = QSettings()
+    values = settings.value("BusinessDayHolidays", [])
+    if isinstance(values, str):
+        values = [values]
+    
+    holidays = []
+    for value in values or []:
+        try:
+            holidays.append(datetime.strptime(value.strip(), '%Y-%m-%d').date())
+        except (ValueError, AttributeError):
+            logging.getLogger('pySnap').warning(f"Ignoring invalid holiday date: {value!r}")
+    return holidays
 
 class ProgressTracker:
     """Standardized progress tracking for all operations"""
@@ -58,72 +621,265 @@ class ProgressTracker:
             message = f"{operation} ({current}/{total})"
         signal.emit(current, total, message)
 
-class SnapshotFetchWorker(QThread):
+class SnapshotBatcher:
+    """
+    Coalesces snapshot records into batches for delivery to the UI thread.
+    
+    Records can be added from several threads; a batch is emitted once it
+    reaches max_size records or max_delay seconds have passed since the last
+    emission, whichever comes first.
+    """
+    def __init__(self, signal, max_size=500, max_delay=0.25):
+        self.signal = signal
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._records = []
+        self._last_emit = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, records):
+        """Queue records and emit a batch if a threshold was reached"""
+        with self._lock:
+            self._records.extend(records)
+            if (len(self._records) >= self.max_size or
+                    time.monotonic() - self._last_emit >= self.max_delay):
+                self._emit()
+
+    def flush(self):
+        """Emit any queued records right away"""
+        with self._lock:
+            self._emit()
+
+    def _emit(self):
+        # Called with the lock held so batches keep their order across threads
+        if self._records:
+            batch, self._records = self._records, []
+            self.signal.emit(batch)
+        self._last_emit = time.monotonic()
+
+def make_snapshot_id(vcenter, snapshot_moref):
+    """Build the unique ID of a snapshot from its vCenter and MoRef ID"""
+    return f"{vcenter}:{snapshot_moref}"
+
+class SnapshotRecord:
+    """
+    Compact snapshot row keyed by (vCenter, snapshot MoRef ID).
+    
+    Only primitive fields and MoRef IDs are kept, so a row never pins pyVmomi
+    objects, their stubs or cached property data. Live references are rebuilt
+    from the MoRef IDs when a deletion needs them.
+    
+    Fields are read like a mapping (record['name'], record.get('stale')), the
+    same way plain dict records from the journal and tests are read. The
+    creation time is kept as epoch seconds in 'created_ts'; 'created' is
+    formatted from it on access, for display only.
+    """
+    __slots__ = ('vcenter', 'vm_name', 'vm_moref', 'name', 'snapshot_moref', 'created_ts',
+                 'created_by', 'description', 'has_children', 'is_child', 'parent_moref', 'depth',
+                 'child_count', 'chain_root', 'chain_position', 'stale', 'fetched_at')
+    DEFAULTS = {'created_by': 'Unknown', 'description': '', 'has_children': False, 'is_child': False,
+                'depth': 0, 'child_count': 0, 'chain_position': 1, 'stale': False}
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.pop(field, self.DEFAULTS.get(field)))
+        if fields:
+            raise TypeError(f"Unknown snapshot record fields: {', '.join(fields)}")
+
+    @property
+    def snapshot_id(self):
+        return make_snapshot_id(self.vcenter, self.snapshot_moref)
+
+    @property
+    def created(self):
+        """Creation time formatted for display"""
+        return format_created(self.created_ts)
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed"""
+        fields = {field: getattr(self, field) for field in self.__slots__}
+        fields.update(changes)
+        return SnapshotRecord(**fields)
+
+    def __getitem__(self, field):
+        if field not in self.__slots__ and field != 'created':
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        value = getattr(self, field, None) if field in self.__slots__ or field == 'created' else None
+        return default if value is None else value
+
+    def __contains__(self, field):
+        return field in self.__slots__ or field == 'created'
+
+    def __eq__(self, other):
+        if not isinstance(other, SnapshotRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"SnapshotRecord({self.vcenter!r}, {self.vm_name!r}, {self.name!r}, {self.snapshot_moref!r})"
+
+# Creator markers in priority order. Each alternative scans the whole
+# description, so an earlier marker wins even if a later one appears first,
+# as with separate searches. "(Created by: x)" is covered by "Created by:".
+CREATOR_PATTERN = re.compile(
+    r'(?:.*?Created by:\s*(\w+)|.*?User:\s*(\w+)|.*?By:\s*(\w+))',
+    re.IGNORECASE | re.DOTALL
+)
+
+@lru_cache(maxsize=4096)
+def extract_creator(description):
+    """
+    Extract creator information from a snapshot description.
+    
+    VMware snapshots don't have a built-in createdBy property, so we look for
+    creator information in the description field. Results are memoized by
+    description text; bulk patching leaves the same description on
+    thousands of VMs.
+    
+    Args:
+        description (str): The snapshot description
+        
+    Returns:
+        str: The username who created the snapshot, or 'Unknown'
+    """
+    if not description:
+        return 'Unknown'
+    
+    match = CREATOR_PATTERN.match(description)
+    if match:
+        return match.group(match.lastindex)
+    return 'Unknown'
+
+class SnapshotRecordBuilder:
+    """Builds snapshot records from bulk-retrieved VirtualMachine.snapshot properties"""
+
+    def build_snapshot_records(self, hostname, vm, vm_name, snapshot_info):
+        """
+        Build snapshot records from a bulk-retrieved 'snapshot' property.
+        
+        The snapshot tree is made of data objects already returned by the
+        PropertyCollector, so no further server round trips are made here.
+        
+        Args:
+            hostname (str): vCenter the VM belongs to
+            vm: VirtualMachine managed object reference
+            vm_name (str): VM name from the bulk retrieval
+            snapshot_info: vim.vm.SnapshotInfo for the VM
+            
+        Returns:
+            list: SnapshotRecord rows
+        """
+        return [
+            self.build_snapshot_record(hostname, vm, vm_name, node)
+            for node in walk_snapshot_tree(snapshot_info.rootSnapshotList)
+        ]
+
+    def build_snapshot_record(self, hostname, vm, vm_name, node):
+        """
+        Build the record for one node of a VM's snapshot tree.
+        
+        Args:
+            hostname (str): vCenter the VM belongs to
+            vm: VirtualMachine managed object reference
+            vm_name (str): VM name
+            node (SnapshotNode): Tree node from walk_snapshot_tree
+            
+        Returns:
+            SnapshotRecord
+        """
+        snapshot = node.snapshot
+        
+        # Get creator information from snapshot description
+        # VMware snapshots don't have a built-in createdBy property
+        created_by = self.extract_creator_from_description(snapshot.description)
+        
+        return SnapshotRecord(
+            vm_name=vm_name,
+            vm_moref=vm._moId,
+            vcenter=hostname,
+            name=snapshot.name,
+            snapshot_moref=snapshot.snapshot._moId,
+            created_ts=int(vmware_timestamp(snapshot.createTime)),
+            created_by=created_by,
+            description=snapshot.description or '',
+            has_children=node.child_count > 0,
+            is_child=node.parent_id is not None,
+            parent_moref=node.parent_id,
+            depth=node.depth,
+            child_count=node.child_count,
+            chain_root=node.chain_root,
+            chain_position=node.chain_position
+        )
+
+    def extract_creator_from_description(self, description):
+        """
+        Extract creator information from snapshot description.
+        
+        Args:
+            description (str): The snapshot description
+            
+        Returns:
+            str: The username who created the snapshot, or 'Unknown'
+        """
+        return extract_creator(description)
+
+class SnapshotFetchWorker(QThread, SnapshotRecordBuilder):
     """Worker thread for fetching snapshots"""
     finished = pyqtSignal()
     progress = pyqtSignal(int, int, str)  # completed, total, message
-    snapshot_found = pyqtSignal(dict)
+    snapshots_found = pyqtSignal(list)  # batch of snapshot records
     error = pyqtSignal(str)
+    vcenter_progress = pyqtSignal(str, int)  # hostname, VMs with snapshots processed
+    vcenter_finished = pyqtSignal(str, int)  # hostname, snapshots found
+    vcenter_error = pyqtSignal(str, str)  # hostname, error message
 
-    def __init__(self, vcenter_connections):
+    def __init__(self, sessions, max_workers=None, page_size=FETCH_PAGE_SIZE):
         super().__init__()
-        self.vcenter_connections = vcenter_connections
+        self.sessions = sessions  # SessionRegistry of connected vCenters
+        self.max_workers = max_workers  # vCenters fetched concurrently (None = all, 1 = sequential)
+        self.page_size = page_size  # VMs per RetrievePropertiesEx page (maxObjects)
+        self.batcher = SnapshotBatcher(self.snapshots_found)
 
     def run(self):
         try:
-            total_vcenters = len(self.vcenter_connections)
+            hostnames = self.sessions.keys()
+            total_vcenters = len(hostnames)
             completed_vcenters = 0
             
-            for hostname, si in self.vcenter_connections.items():
-                ProgressTracker.emit_progress(
-                    self.progress, completed_vcenters, total_vcenters,
-                    "Connecting", f"{hostname}"
-                )
-                
-                content = si.RetrieveContent()
-                container = content.viewManager.CreateContainerView(
-                    content.rootFolder, [vim.VirtualMachine], True
-                )
-                
-                # Count VMs with snapshots for more detailed progress
-                snapshot_vms = 0
-                processed_vms = 0
-                
-                # First count VMs with snapshots
-                for vm in container.view:
-                    if vm.snapshot:
-                        snapshot_vms += 1
-                
-                if snapshot_vms > 0:
-                    # Now process VMs with progress updates
-                    for vm in container.view:
-                        if vm.snapshot:
-                            processed_vms += 1
-                            ProgressTracker.emit_progress(
-                                self.progress, processed_vms, snapshot_vms,
-                                "Processing", f"{vm.name}"
-                            )
-                            
-                            for snapshot in self.get_snapshots(vm.snapshot.rootSnapshotList):
-                                # Get creator information from snapshot description
-                                # VMware snapshots don't have a built-in createdBy property
-                                created_by = self.extract_creator_from_description(snapshot.description)
-                                
-                                self.snapshot_found.emit({
-                                    'vm_name': vm.name,
-                                    'vcenter': hostname,
-                                    'name': snapshot.name,
-                                    'created': format_vmware_time(snapshot.createTime),
-                                    'created_by': created_by,
-                                    'description': snapshot.description or '',
-                                    'snapshot': snapshot,
-                                    'vm': vm,
-                                    'has_children': bool(snapshot.childSnapshotList),
-                                    'is_child': hasattr(snapshot, 'parent') and snapshot.parent is not None
-                                })
+            ProgressTracker.emit_progress(
+                self.progress, completed_vcenters, total_vcenters,
+                "Fetching", f"{total_vcenters} vCenters"
+            )
+            
+            # Each vCenter gets its own pool worker so one slow site doesn't hold
+            # up the others. Every pool thread leases its own connection, so no
+            # stub is shared with other threads or running operations.
+            pool_size = total_vcenters if self.max_workers is None else min(self.max_workers, total_vcenters)
+            with ThreadPoolExecutor(max_workers=max(1, pool_size)) as executor:
+                futures = {
+                    executor.submit(self.fetch_leased, hostname): hostname
+                    for hostname in hostnames
+                }
                 
-                container.Destroy()
-                completed_vcenters += 1
+                for future in as_completed(futures):
+                    hostname = futures[future]
+                    completed_vcenters += 1
+                    try:
+                        snapshot_count = future.result()
+                        self.vcenter_finished.emit(hostname, snapshot_count)
+                        details = f"{hostname} ({snapshot_count} snapshots)"
+                    except Exception as e:
+                        # A failing vCenter is reported on its own and doesn't abort the others
+                        self.vcenter_error.emit(hostname, str(e))
+                        details = f"{hostname} failed"
+                    
+                    ProgressTracker.emit_progress(
+                        self.progress, completed_vcenters, total_vcenters,
+                        "Fetched", details
+                    )
             
             # Final progress update
             ProgressTracker.emit_progress(
@@ -134,69 +890,488 @@ class SnapshotFetchWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
-    def get_snapshots(self, snapshots):
-        result = []
-        for snapshot in snapshots:
-            result.append(snapshot)
-            result.extend(self.get_snapshots(snapshot.childSnapshotList))
-        return result
+    def fetch_leased(self, hostname):
+        """Fetch one vCenter on a connection leased for the calling pool thread"""
+        with self.sessions.lease(hostname) as si:
+            return self.fetch_vcenter(hostname, si)
+
+    def fetch_vcenter(self, hostname, si):
+        """
+        Fetch all snapshots from a single vCenter.
+        
+        Runs on a pool thread. Each retrieval page is turned into records and
+        handed to the shared batcher, so the first rows show up within the
+        batcher's delay and nothing is accumulated here.
+        
+        Args:
+            hostname (str): vCenter hostname
+            si: Connected ServiceInstance for that vCenter
+            
+        Returns:
+            int: Number of snapshots found
+        """
+        processed_vms = 0
+        snapshot_count = 0
+        
+        # Pull name and snapshot tree for every VM in paged bulk calls
+        for page in retrieve_property_pages(si, vim.VirtualMachine, SNAPSHOT_VM_PROPERTIES, self.page_size):
+            batch = []
+            for vm, props in page:
+                snapshot_info = props.get('snapshot')
+                if not snapshot_info:
+                    continue
+                
+                vm_name = props.get('name', vm._moId)
+                batch.extend(self.build_snapshot_records(hostname, vm, vm_name, snapshot_info))
+                processed_vms += 1
+            
+            if batch:
+                self.batcher.add(batch)
+                snapshot_count += len(batch)
+            self.vcenter_progress.emit(hostname, processed_vms)
+        
+        # Deliver this vCenter's remaining rows before it is reported finished
+        self.batcher.flush()
+        return snapshot_count
+
+class LiveUpdateWorker(QThread, SnapshotRecordBuilder):
+    """
+    Worker thread that keeps one vCenter's snapshot rows current.
     
-    def extract_creator_from_description(self, description):
+    Holds a PropertyCollector filter on VirtualMachine.snapshot and blocks on
+    WaitForUpdatesEx, so only VMs whose snapshots actually changed are
+    reported instead of re-walking the whole inventory.
+    """
+    vm_snapshots_changed = pyqtSignal(str, str, list)  # hostname, VM MoRef ID, current records
+    error = pyqtSignal(str, str)  # hostname, error message
+
+    def __init__(self, hostname, si, max_wait_seconds=10):
+        super().__init__()
+        self.hostname = hostname
+        self.si = si
+        self.max_wait_seconds = max_wait_seconds  # How often the stop flag is checked
+        self.collector = None
+        self._stop_requested = False
+
+    def stop(self):
+        """Ask the worker to stop; it exits after the current wait returns"""
+        self._stop_requested = True
+        collector = self.collector
+        if collector is not None:
+            try:
+                # Wake the blocked WaitForUpdatesEx call right away
+                collector.CancelWaitForUpdates()
+            except Exception:
+                pass
+
+    def run(self):
+        view = None
+        try:
+            content = self.si.RetrieveContent()
+            view = content.viewManager.CreateContainerView(
+                content.rootFolder, [vim.VirtualMachine], True
+            )
+            
+            # Use a private collector so waiting here never interferes with
+            # bulk retrievals made through the shared one
+            self.collector = content.propertyCollector.CreatePropertyCollector()
+            self.collector.CreateFilter(
+                build_container_filter_spec(view, vim.VirtualMachine, SNAPSHOT_VM_PROPERTIES),
+                partialUpdates=False
+            )
+            options = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=self.max_wait_seconds)
+            
+            version = ''
+            vm_names = {}  # VM MoRef ID -> name, needed because updates only carry changed properties
+            initial = True
+            
+            while not self._stop_requested:
+                update_set = self.collector.WaitForUpdatesEx(version=version, options=options)
+                if update_set is None:
+                    continue  # Timed out without changes
+                
+                version = update_set.version
+                for filter_update in update_set.filterSet or []:
+                    for object_update in filter_update.objectSet or []:
+                        # The initial update sets describe the current state, which
+                        # the last fetch already shows; only record VM names from them
+                        self.apply_object_update(object_update, vm_names, emit=not initial)
+                if not update_set.truncated:
+                    initial = False  # A large inventory's initial state spans several sets
+        except vmodl.fault.RequestCanceled:
+            pass  # stop() cancelled the wait
+        except Exception as e:
+            if not self._stop_requested:
+                self.error.emit(self.hostname, str(e))
+        finally:
+            for obj in (self.collector, view):
+                if obj is not None:
+                    try:
+                        obj.Destroy()
+                    except Exception:
+                        pass
+            self.collector = None
+
+    def apply_object_update(self, object_update, vm_names, emit=True):
         """
-        Extract creator information from snapshot description.
-        VMware snapshots don't have a built-in 'createdBy' property,
-        so we need to parse it from the description field.
-        """
-        if not description:
-            return 'Unknown'
-        
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'\(Created by:\s*([^)]+)\)',  # (Created by: username)
-            r'Created by:\s*([^\n,;]+)',   # Created by: username
-            r'\[Created by:\s*([^\]]+)\]', # [Created by: username]
-            r'User:\s*([^\n,;]+)',         # User: username
-        ]
+        Process one VM update from WaitForUpdatesEx.
         
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        Args:
+            object_update: vmodl.query.PropertyCollector.ObjectUpdate
+            vm_names (dict): VM MoRef ID -> name, updated in place
+            emit (bool): Whether to report the VM's new snapshot records
+        """
+        vm = object_update.obj
+        vm_moref = vm._moId
         
-        return 'Unknown'
+        if object_update.kind == 'leave':
+            vm_names.pop(vm_moref, None)
+            if emit:
+                self.vm_snapshots_changed.emit(self.hostname, vm_moref, [])
+            return
+        
+        snapshot_changed = False
+        snapshot_info = None
+        for change in object_update.changeSet or []:
+            value = change.val if change.op == 'assign' else None
+            if change.name == 'name':
+                vm_names[vm_moref] = value
+            elif change.name == 'snapshot':
+                snapshot_changed = True
+                snapshot_info = value
+        
+        if emit and snapshot_changed:
+            records = []
+            if snapshot_info:
+                vm_name = vm_names.get(vm_moref, vm_moref)
+                records = self.build_snapshot_records(self.hostname, vm, vm_name, snapshot_info)
+            self.vm_snapshots_changed.emit(self.hostname, vm_moref, records)
+
+# Task properties watched by TaskMonitor; result and error arrive with the final state
+TASK_PROPERTIES = ['info.state', 'info.progress', 'info.result', 'info.error']
+
+class TaskMonitor:
+    """
+    Waits on many vCenter tasks of one connection through a single filter.
     
-    def extract_creator_from_description(self, description):
+    Watched tasks are kept in a ListView that one PropertyCollector filter
+    traverses, so the caller blocks in WaitForUpdatesEx until any task's state
+    or progress changes instead of polling every task's info. Tasks that
+    already finished when they are registered are reported by the initial
+    update. A monitor is driven from one thread and runs its callbacks there.
+    """
+
+    def __init__(self, si, max_wait_seconds=10):
+        self.si = si
+        self.max_wait_seconds = max_wait_seconds  # Upper bound for one wait() call
+        self.collector = None
+        self.view = None
+        self.version = ''
+        self.tasks = {}  # task MoRef ID -> (task, on_complete, on_progress)
+        self._pending_add = []
+        self._pending_remove = []
+
+    def watch(self, task, on_complete, on_progress=None):
+        """
+        Register a task. It is added to the server-side view on the next wait().
+        
+        Args:
+            task: vim.Task to watch
+            on_complete: Called as on_complete(task, state, result, error) once the
+                task succeeds or fails; error is the fault message or None
+            on_progress: Optional, called as on_progress(task, percent)
+        """
+        self.tasks[task._moId] = (task, on_complete, on_progress)
+        self._pending_add.append(task)
+
+    def open(self):
+        """Create the private collector, the task view and the filter"""
+        content = self.si.RetrieveContent()
+        self.view = content.viewManager.CreateListView(obj=[])
+        
+        # A private collector keeps the blocking wait separate from bulk
+        # retrievals made through the shared one
+        self.collector = content.propertyCollector.CreatePropertyCollector()
+        self.collector.CreateFilter(
+            build_container_filter_spec(self.view, vim.Task, TASK_PROPERTIES, vim.view.ListView),
+            partialUpdates=False
+        )
+
+    def wait(self):
+        """
+        Block until a watched task changes or max_wait_seconds pass.
+        
+        Returns:
+            int: Number of tasks that finished during this call
+        """
+        if self.collector is None:
+            self.open()
+        
+        # Register new tasks and drop finished ones in one round trip
+        finished = 0
+        if self._pending_add or self._pending_remove:
+            unresolved = self.view.ModifyListView(add=self._pending_add, remove=self._pending_remove)
+            self._pending_add, self._pending_remove = [], []
+            
+            # Tasks the server no longer knows (e.g. reattached after a long
+            # outage) would never report, so fail them right away
+            for task in unresolved or []:
+                entry = self.tasks.pop(task._moId, None)
+                if entry is not None:
+                    entry[1](task, vim.TaskInfo.State.error, None, "Task no longer exists on the server")
+                    finished += 1
+            if not self.tasks:
+                return finished
+        
+        options = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=self.max_wait_seconds)
+        update_set = self.collector.WaitForUpdatesEx(version=self.version, options=options)
+        if update_set is None:
+            return finished  # Timed out without changes
+        
+        self.version = update_set.version
+        for filter_update in update_set.filterSet or []:
+            for object_update in filter_update.objectSet or []:
+                finished += self.apply_object_update(object_update)
+        return finished
+
+    def run(self):
+        """Wait until every watched task has finished, including ones added by callbacks"""
+        while self.tasks:
+            self.wait()
+
+    def apply_object_update(self, object_update):
+        """
+        Dispatch callbacks for one task update.
+        
+        Args:
+            object_update: vmodl.query.PropertyCollector.ObjectUpdate for a task
+            
+        Returns:
+            int: 1 if the task finished, otherwise 0
+        """
+        entry = self.tasks.get(object_update.obj._moId)
+        if entry is None or object_update.kind == 'leave':
+            return 0
+        
+        task, on_complete, on_progress = entry
+        changes = {change.name: change.val for change in object_update.changeSet or []
+                   if change.op == 'assign'}
+        state = changes.get('info.state')
+        
+        if state in (vim.TaskInfo.State.success, vim.TaskInfo.State.error):
+            del self.tasks[task._moId]
+            self._pending_remove.append(task)
+            error = changes.get('info.error')
+            on_complete(task, state, changes.get('info.result'),
+                        (error.msg or str(error)) if error is not None else None)
+            return 1
+        
+        if on_progress is not None and changes.get('info.progress') is not None:
+            on_progress(task, changes['info.progress'])
+        return 0
+
+    def close(self):
+        """Destroy the server-side collector and view"""
+        for obj in (self.collector, self.view):
+            if obj is not None:
+                try:
+                    obj.Destroy()
+                except Exception:
+                    pass
+        self.collector = None
+        self.view = None
+
+class AdaptiveWindow:
+    """
+    Number of tasks allowed in flight, adapted to how the server copes.
+    
+    Additive increase, multiplicative decrease: the window grows by one after a
+    full window of tasks finished no slower than latency_factor times the best
+    latency seen, and is halved after a failure or a slow task.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=16, latency_factor=3.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.size = max(minimum, min(initial, maximum))
+        self.latency_factor = latency_factor
+        self.best_latency = None
+        self._good = 0  # Healthy completions since the last resize
+
+    def record(self, latency, success=True):
+        """
+        Adjust the window for one finished task.
+        
+        Args:
+            latency (float): Seconds from submission to completion
+            success (bool): Whether the task succeeded
+        """
+        if success and (self.best_latency is None or latency < self.best_latency):
+            self.best_latency = latency
+        
+        if not success or latency > self.best_latency * self.latency_factor:
+            self.size = max(self.minimum, self.size // 2)
+            self._good = 0
+            return
+        
+        self._good += 1
+        if self._good >= self.size:
+            self.size = min(self.maximum, self.size + 1)
+            self._good = 0
+
+class PlacementLimiter:
+    """
+    Counts tasks in flight per ESXi host and datastore against optional limits.
+    
+    Each VM maps to placement keys such as ('datastore', 'datastore-12'); a VM
+    has room only if every one of its keys is below that kind's limit.
+    """
+
+    def __init__(self, limits, placement=None):
+        self.limits = limits  # 'host' / 'datastore' -> max tasks in flight, or None for no limit
+        self.placement = placement or {}  # VM MoRef ID -> list of (kind, MoRef ID)
+        self.in_flight = {}  # (kind, MoRef ID) -> tasks running there
+
+    @classmethod
+    def lookup(cls, si, vms, limits):
+        """
+        Build a limiter, reading host and datastores for the VMs in one call.
+        
+        Nothing is retrieved when no limit is set.
+        
+        Args:
+            si: Connected ServiceInstance for the VMs' vCenter
+            vms (list): VirtualMachine managed objects
+            limits (dict): 'host' / 'datastore' -> limit or None
+            
+        Returns:
+            PlacementLimiter
+        """
+        if not any(limits.values()):
+            return cls(limits)
+        
+        placement = {}
+        properties = retrieve_object_properties(si, vms, vim.VirtualMachine, ['runtime.host', 'datastore'])
+        for vm_moref, props in properties.items():
+            keys = []
+            if limits.get('host') and props.get('runtime.host') is not None:
+                keys.append(('host', props['runtime.host']._moId))
+            if limits.get('datastore'):
+                keys.extend(('datastore', datastore._moId) for datastore in props.get('datastore') or [])
+            placement[vm_moref] = keys
+        return cls(limits, placement)
+
+    def has_room(self, vm_moref):
+        """Whether another task may start for this VM"""
+        return all(self.in_flight.get(key, 0) < self.limits[key[0]]
+                   for key in self.placement.get(vm_moref, ()))
+
+    def acquire(self, vm_moref):
+        """Count a task started for this VM"""
+        for key in self.placement.get(vm_moref, ()):
+            self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+    def release(self, vm_moref):
+        """Count a task finished for this VM"""
+        for key in self.placement.get(vm_moref, ()):
+            self.in_flight[key] -= 1
+
+# How long a VM name index is trusted before it is rebuilt
+VM_INDEX_TTL = 300
+
+class VMNameIndex:
+    """
+    Per-vCenter index of VM names to VirtualMachine MoRefs.
+    
+    Each index is built with one bulk 'name' retrieval and reused until it is
+    older than the TTL or invalidated, so resolving a list of servers costs
+    one inventory scan per vCenter instead of one per server.
+    """
+    def __init__(self, ttl=VM_INDEX_TTL):
+        self.ttl = ttl
+        self._indexes = {}  # hostname -> (built_at, {lower-cased name: vm})
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger('pySnap')
+
+    def get(self, hostname, si, refresh=False):
+        """
+        Get the name index of a vCenter, building it if missing or expired.
+        
+        Args:
+            hostname (str): vCenter hostname
+            si: ServiceInstance of the vCenter
+            refresh (bool): Rebuild even if a cached index is still valid
+            
+        Returns:
+            tuple: (index dict of lower-cased name -> vm, True if it was just built)
+        """
+        with self._lock:
+            entry = self._indexes.get(hostname)
+        if entry and not refresh and time.monotonic() - entry[0] < self.ttl:
+            return entry[1], False
+        
+        index = {}
+        for vm, props in retrieve_properties(si, vim.VirtualMachine, ['name']):
+            name = props.get('name')
+            if name:
+                # Like a linear scan, the first VM with a name wins
+                index.setdefault(name.lower(), vm)
+        
+        with self._lock:
+            self._indexes[hostname] = (time.monotonic(), index)
+        self.logger.info(f"Indexed {len(index)} VM names on {hostname}")
+        return index, True
+
+    def invalidate(self, hostname=None):
+        """Drop the index of one vCenter, or of all vCenters"""
+        with self._lock:
+            if hostname is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(hostname, None)
+
+    def resolve(self, vcenter_connections, names):
         """
-        Extract creator information from snapshot description.
+        Resolve a list of VM names against every connected vCenter in one pass.
         
-        VMware snapshots don't have a built-in createdBy property,
-        so we look for creator information in the description field.
+        Names are matched case-insensitively; a name found in several vCenters
+        resolves to the first one in connection order. If names are missing
+        from a cached index, that index is rebuilt once in case the VMs are new.
         
         Args:
-            description (str): The snapshot description
+            vcenter_connections (dict): hostname -> ServiceInstance
+            names (list): VM names to resolve
             
         Returns:
-            str: The username who created the snapshot, or 'Unknown'
+            tuple: ({hostname: [(vm, name), ...]}, [names not found])
         """
-        if not description:
-            return 'Unknown'
-        
-        import re
-        
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'Created by:\s*(\w+)',
-            r'\(Created by:\s*(\w+)\)',
-            r'User:\s*(\w+)',
-            r'By:\s*(\w+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return 'Unknown'
+        indexes = {}
+        stale_hosts = []
+        for hostname, si in vcenter_connections.items():
+            indexes[hostname], fresh = self.get(hostname, si)
+            if not fresh:
+                stale_hosts.append(hostname)
+        
+        found, missing = self._match(indexes, names)
+        if missing and stale_hosts:
+            for hostname in stale_hosts:
+                indexes[hostname], _ = self.get(hostname, vcenter_connections[hostname], refresh=True)
+            found, missing = self._match(indexes, names)
+        return found, missing
+
+    def _match(self, indexes, names):
+        found = {}
+        missing = []
+        for name in names:
+            key = name.lower()
+            for hostname, index in indexes.items():
+                vm = index.get(key)
+                if vm is not None:
+                    found.setdefault(hostname, []).append((vm, name))
+                    break
+            else:
+                missing.append(name)
+        return found, missing
 
 class AddVCenterDialog(QDialog):
     def __init__(self, saved_servers, config_manager, parent=None):
@@ -236,144 +1411,961 @@ class AddVCenterDialog(QDialog):
         self.server_combo.activated.connect(self.on_server_selected)
         layout.addWidget(self.server_combo, 0, 1)
         
-        # Connection details
-        layout.addWidget(QLabel("Hostname:"), 1, 0)
-        self.hostname = QLineEdit()
-        layout.addWidget(self.hostname, 1, 1)
+        # Connection details
+        layout.addWidget(QLabel("Hostname:"), 1, 0)
+        self.hostname = QLineEdit()
+        layout.addWidget(self.hostname, 1, 1)
+        
+        layout.addWidget(QLabel("Username:"), 2, 0)
+        self.username = QLineEdit()
+        layout.addWidget(self.username, 2, 1)
+        
+        layout.addWidget(QLabel("Password:"), 3, 0)
+        self.password = QLineEdit()
+        self.password.setEchoMode(QLineEdit.EchoMode.Password)
+        layout.addWidget(self.password, 3, 1)
+        
+        # Remember checkbox
+        self.save_check = QCheckBox("Remember server credentials (passwords stored securely in system keychain)")
+        self.save_check.setChecked(True)
+        layout.addWidget(self.save_check, 4, 0, 1, 2)
+        
+        # Add info label about security
+        info_text = ("Note: Passwords are stored securely in your system's keychain\n"
+                    "(macOS Keychain, Windows Credential Manager, or Linux Secret Service)")
+        info_label = QLabel(info_text)
+        info_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(info_label, 5, 0, 1, 2)
+        
+        # Buttons
+        button_box = QHBoxLayout()
+        connect_btn = QPushButton("Connect")
+        connect_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        
+        button_box.addWidget(connect_btn)
+        button_box.addWidget(cancel_btn)
+        layout.addLayout(button_box, 6, 0, 1, 2)
+
+    def on_server_selected(self, index):
+        """Auto-fill saved server details and password"""
+        hostname = self.server_combo.currentText()
+        if hostname and hostname in self.saved_servers:
+            username = self.saved_servers[hostname]
+            self.hostname.setText(hostname)
+            self.username.setText(username)
+            
+            # Try to get saved password
+            password = self.config_manager.get_password(hostname, username)
+            if password:
+                self.password.setText(password)
+            
+            self.password.setFocus()
+
+    def get_data(self):
+        return {
+            'hostname': self.hostname.text(),
+            'username': self.username.text(),
+            'password': self.password.text(),
+            'save': self.save_check.isChecked()
+        }
+
+    def closeEvent(self, event):
+        """Save window position when closing"""
+        settings = QSettings()
+        settings.setValue("AddVCenterDialogGeometry", self.saveGeometry())
+        super().closeEvent(event)
+
+# Default deletion limits; consolidations are storage heavy, so only a few run
+# against any one datastore at a time
+DELETE_MAX_PER_VCENTER = 8
+DELETE_MAX_PER_DATASTORE = 2
+
+class SnapshotDeleteWorker(QThread):
+    """
+    Worker thread for deleting snapshots.
+    
+    Deletions are queued per vCenter and started only while the vCenter and
+    every datastore (and optionally host) the VM lives on are below their
+    in-flight limits, so a large selection doesn't consolidate hundreds of
+    snapshots on the same few datastores at once.
+    """
+    progress = pyqtSignal(int, int, str)  # completed, total, message
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+    item_complete = pyqtSignal(str)  # snapshot ID
+
+    def __init__(self, items_to_delete, sessions, max_per_vcenter=DELETE_MAX_PER_VCENTER,
+                 per_datastore_limit=DELETE_MAX_PER_DATASTORE, per_host_limit=None, journal=None, job_id=None):
+        super().__init__()
+        self.items_to_delete = items_to_delete
+        self.sessions = sessions  # SessionRegistry of connected vCenters
+        self.journal = journal  # Optional JobJournal recording every task
+        self.job_id = job_id  # Set when resuming a journaled job
+        self.max_per_vcenter = max_per_vcenter
+        self.placement_limits = {'host': per_host_limit, 'datastore': per_datastore_limit}
+        self.total = len(items_to_delete)
+        self.queued = self.total
+        self.running = 0
+        self.completed = 0  # Finished tasks, successful or not
+        self.task_progress = {}  # task MoRef ID -> percent for running deletions
+        self.lock = threading.Lock()
+
+    def run(self):
+        if self.journal is not None and self.job_id is None:
+            self.job_id = self.journal.start_job('delete', [
+                (snapshot_id, {field: data.get(field) for field in
+                               ('vcenter', 'vm_moref', 'snapshot_moref', 'vm_name', 'name')})
+                for snapshot_id, data in self.items_to_delete
+            ])
+        
+        # Group by vCenter; each vCenter's queue is scheduled and watched on its own thread
+        items_by_vcenter = {}
+        for snapshot_id, data in self.items_to_delete:
+            items_by_vcenter.setdefault(data['vcenter'], []).append((snapshot_id, data))
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(items_by_vcenter))) as executor:
+            futures = {
+                executor.submit(self.delete_on_vcenter, hostname, items): hostname
+                for hostname, items in items_by_vcenter.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.error.emit(f"Error monitoring deletions on {futures[future]}: {str(e)}")
+        
+        # Items left open (e.g. a vCenter dropped) keep the job resumable
+        if self.journal is not None:
+            self.journal.finish_job(self.job_id)
+        
+        ProgressTracker.emit_progress(
+            self.progress, self.total, self.total,
+            "Complete", "All deleted"
+        )
+        self.finished.emit()
+
+    def delete_on_vcenter(self, hostname, items):
+        """
+        Run one vCenter's deletion queue on a connection leased for the
+        calling pool thread.
+        
+        Args:
+            hostname (str): vCenter hostname
+            items (list): (snapshot ID, record) tuples on that vCenter
+        """
+        with self.sessions.lease(hostname) as si:
+            items = [(snapshot_id, data) + self.rehydrate(si, data) for snapshot_id, data in items]
+            try:
+                limiter = PlacementLimiter.lookup(si, [vm for _, _, vm, _ in items], self.placement_limits)
+            except Exception as e:
+                # Without placement only the per-vCenter limit applies
+                logging.getLogger('pySnap').warning(f"Could not read VM placement on {hostname}: {str(e)}")
+                limiter = PlacementLimiter(self.placement_limits)
+            
+            pending = []
+            monitor = TaskMonitor(si)
+            for item in items:
+                snapshot_id, data, vm, _ = item
+                if data.get('task_moref'):
+                    # Reattach to a task submitted before the app stopped
+                    self.start_watching(monitor, limiter, snapshot_id, data, vm,
+                                        vim.Task(data['task_moref'], si._stub), reattached_si=si)
+                else:
+                    pending.append(item)
+            
+            try:
+                while pending or monitor.tasks:
+                    # Start queued deletions while the vCenter and their datastores have room
+                    index = 0
+                    while index < len(pending) and len(monitor.tasks) < self.max_per_vcenter:
+                        snapshot_id, data, vm, snapshot_ref = pending[index]
+                        if not limiter.has_room(vm._moId):
+                            index += 1
+                            continue
+                        
+                        del pending[index]
+                        try:
+                            task = snapshot_ref.RemoveSnapshot_Task(removeChildren=False)
+                        except Exception as e:
+                            self.error.emit(f"Error starting deletion of {data['name']}: {str(e)}")
+                            self.journal_update(snapshot_id, 'error')
+                            self.count_finished(started=False)
+                            continue
+                        
+                        self.journal_update(snapshot_id, 'running', task_moref=task._moId)
+                        self.start_watching(monitor, limiter, snapshot_id, data, vm, task)
+                    
+                    if not monitor.tasks:
+                        break  # Everything left failed to start
+                    
+                    self.emit_overall_progress()
+                    monitor.wait()
+            finally:
+                monitor.close()
+
+    def rehydrate(self, si, data):
+        """
+        Get live VM and snapshot references for a record.
+        
+        Records only carry MoRef IDs, so the references are built here, on
+        the leased connection, right before the deletion needs them.
+        
+        Returns:
+            tuple: (vim.VirtualMachine, vim.vm.Snapshot)
+        """
+        return (vim.VirtualMachine(data['vm_moref'], si._stub),
+                vim.vm.Snapshot(data['snapshot_moref'], si._stub))
+
+    def start_watching(self, monitor, limiter, snapshot_id, data, vm, task, reattached_si=None):
+        """
+        Count a deletion as running and hand its task to the monitor.
+        
+        reattached_si is the connection of a task resumed from the journal,
+        used to check the snapshot itself if the task can't be followed.
+        """
+        limiter.acquire(vm._moId)
+        with self.lock:
+            self.queued -= 1
+            self.running += 1
+        monitor.watch(task, partial(self.on_task_complete, limiter, snapshot_id, data, vm,
+                                    reattached_si=reattached_si),
+                      self.on_task_progress)
+
+    def journal_update(self, snapshot_id, state, **fields):
+        """Record an item's state change if a journal is kept"""
+        if self.journal is not None:
+            self.journal.update(self.job_id, snapshot_id, state, **fields)
+
+    def on_task_complete(self, limiter, snapshot_id, data, vm, task, state, result, error, reattached_si=None):
+        """Report a finished deletion task"""
+        limiter.release(vm._moId)
+        with self.lock:
+            self.task_progress.pop(task._moId, None)
+        self.count_finished(started=True)
+        
+        # A resumed task may have been purged from vCenter after finishing;
+        # the deletion went through if the snapshot is gone
+        if (state != vim.TaskInfo.State.success and reattached_si is not None
+                and not self.snapshot_exists(reattached_si, vm, data['snapshot_moref'])):
+            state = vim.TaskInfo.State.success
+        self.journal_update(snapshot_id, state)
+        
+        if state == vim.TaskInfo.State.success:
+            self.item_complete.emit(snapshot_id)
+        else:
+            self.error.emit(f"Failed to delete {data['name']}: {error}")
+        self.emit_overall_progress()
+
+    def snapshot_exists(self, si, vm, snapshot_moref):
+        """
+        Whether a VM still has a snapshot.
+        
+        Returns:
+            bool: True if the snapshot is in the VM's tree, or it can't be read
+        """
+        try:
+            properties = retrieve_object_properties(si, [vm], vim.VirtualMachine, ['snapshot'])
+        except Exception as e:
+            logging.getLogger('pySnap').warning(f"Could not read snapshots of {vm._moId}: {str(e)}")
+            return True
+        if vm._moId not in properties:
+            return False  # The VM itself is gone
+        snapshot_info = properties[vm._moId].get('snapshot')
+        root_snapshots = snapshot_info.rootSnapshotList if snapshot_info else []
+        return any(node.snapshot.snapshot._moId == snapshot_moref for node in walk_snapshot_tree(root_snapshots))
+
+    def count_finished(self, started):
+        """Move one deletion from running (or queued, if it never started) to done"""
+        with self.lock:
+            if started:
+                self.running -= 1
+            else:
+                self.queued -= 1
+            self.completed += 1
+
+    def on_task_progress(self, task, percent):
+        """Track a running deletion's progress"""
+        with self.lock:
+            self.task_progress[task._moId] = percent
+        self.emit_overall_progress()
+
+    def emit_overall_progress(self):
+        """Show queued, running and done counts with progress across all deletions"""
+        with self.lock:
+            queued, running, completed = self.queued, self.running, self.completed
+            overall_progress = (completed * 100 + sum(self.task_progress.values())) / self.total
+        ProgressTracker.emit_progress(
+            self.progress, completed, self.total,
+            "Deleting", f"{queued} queued, {running} running, {completed} done ({overall_progress:.0f}%)"
+        )
+
+class SnapshotStore:
+    """
+    Column-oriented storage for snapshot table rows.
+    
+    Each field is kept in its own list so sorting and filtering can work on
+    plain Python values, and rows cost a handful of list slots instead of a
+    widget item with per-cell brushes. Creation times are stored as epoch
+    seconds and only formatted when a cell is displayed.
+    """
+    FIELDS = ('id', 'vm_name', 'vcenter', 'name', 'created_ts', 'created_by', 'description',
+              'snapshot_type', 'in_chain', 'stale', 'checked', 'age', 'created_key', 'filter_key', 'record')
+
+    def __init__(self):
+        self.columns = {field: [] for field in self.FIELDS}
+        self.row_of = {}  # snapshot ID -> row
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def row_values(self, snapshot_id, data):
+        """
+        Build the stored values of one snapshot row.
+        
+        Args:
+            snapshot_id (str): Unique snapshot ID
+            data (dict): Snapshot record
+            
+        Returns:
+            dict: Field name -> value
+        """
+        created_ts = created_timestamp(data)
+        return {
+            'id': snapshot_id,
+            'vm_name': data['vm_name'],
+            'vcenter': data['vcenter'],
+            'name': data['name'],
+            'created_ts': created_ts,
+            'created_by': data.get('created_by', 'Unknown'),
+            'description': data.get('description', ''),
+            'snapshot_type': get_snapshot_type(data),
+            'in_chain': bool(data.get('has_children') or data.get('is_child')),
+            'stale': bool(data.get('stale')),
+            'checked': False,
+            'age': None,
+            'created_key': -1 if created_ts is None else created_ts,  # Unknown dates sort first
+            'filter_key': SnapshotFilter.build_key(data, created_ts),
+            'record': data,
+        }
+
+    def append(self, snapshot_id, data):
+        """Append a row and return its index"""
+        row = len(self)
+        for field, value in self.row_values(snapshot_id, data).items():
+            self.columns[field].append(value)
+        self.row_of[snapshot_id] = row
+        return row
+
+    def update(self, row, snapshot_id, data):
+        """Overwrite the values of an existing row"""
+        for field, value in self.row_values(snapshot_id, data).items():
+            self.columns[field][row] = value
+
+    def remove_rows(self, first, last):
+        """Remove the contiguous rows first..last and reindex the rows after them"""
+        ids = self.columns['id']
+        for snapshot_id in ids[first:last + 1]:
+            self.row_of.pop(snapshot_id, None)
+        for column in self.columns.values():
+            del column[first:last + 1]
+        for row in range(first, len(ids)):
+            self.row_of[ids[row]] = row
+
+    def remove_ids(self, snapshot_ids):
+        """Remove any set of rows in one pass"""
+        keep = [row for row, snapshot_id in enumerate(self.columns['id']) if snapshot_id not in snapshot_ids]
+        for field in self.FIELDS:
+            column = self.columns[field]
+            self.columns[field] = [column[row] for row in keep]
+        self.row_of = {snapshot_id: row for row, snapshot_id in enumerate(self.columns['id'])}
+
+class SnapshotTableModel(QAbstractTableModel):
+    """Table model over a SnapshotStore, one row per snapshot"""
+    checked_count_changed = pyqtSignal(int)
+
+    HEADERS = ["Select", "VM Name", "vCenter", "Snapshot Name", "Created", "Created By", "Description", "Snapshot Type"]
+    COLUMN_FIELDS = (None, 'vm_name', 'vcenter', 'name', 'created_ts', 'created_by', 'description', 'snapshot_type')
+    SORT_FIELDS = ('checked', 'vm_name', 'vcenter', 'name', 'created_key', 'created_by', 'description', 'snapshot_type')
+    CREATED_COLUMN = 4
+    ROW_STATE_ROLE = Qt.ItemDataRole.UserRole + 1  # 'chain', 'old' or None
+    MAX_REMOVE_RANGES = 64  # Above this a removal resets the model instead
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = SnapshotStore()
+        self.age_threshold = 3
+        self.day_type = "business days"
+        self.age_function = None  # (creation epoch seconds, day type) -> ages in days
+        self.ages_date = None  # Day the ages were last computed on
+        self._checked_count = 0
+        self._stale_font = None
+        self.layout_revision = 0  # Bumped when rows are removed and later rows shift
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0 and self.is_checkable(index.row()):
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def is_checkable(self, row):
+        """Chain snapshots and cached rows can't be selected for deletion"""
+        columns = self.store.columns
+        return not (columns['in_chain'][row] or columns['stale'][row])
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        columns = self.store.columns
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.CREATED_COLUMN:
+                created_ts = columns['created_ts'][row]
+                if created_ts is None:
+                    return columns['record'][row].get('created', '')
+                return format_created(created_ts)
+            field = self.COLUMN_FIELDS[column]
+            return columns[field][row] if field else None
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column != 0 or not self.is_checkable(row):
+                return None
+            return Qt.CheckState.Checked if columns['checked'][row] else Qt.CheckState.Unchecked
+        if role == self.ROW_STATE_ROLE:
+            return self.row_state(row)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.row_tooltip(row) if column == 0 else None
+        if role == Qt.ItemDataRole.FontRole:
+            if not columns['stale'][row]:
+                return None
+            if self._stale_font is None:
+                self._stale_font = QFont()
+                self._stale_font.setItalic(True)
+            return self._stale_font
+        if role == Qt.ItemDataRole.UserRole:
+            return columns['id'][row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0 or not self.is_checkable(index.row()):
+            return False
+        
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        column = self.store.columns['checked']
+        if column[index.row()] != checked:
+            column[index.row()] = checked
+            self._checked_count += 1 if checked else -1
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            self.checked_count_changed.emit(self._checked_count)
+        return True
+
+    def row_state(self, row):
+        """Get the highlighting state of a row; chain highlighting takes precedence"""
+        columns = self.store.columns
+        if columns['in_chain'][row]:
+            return 'chain'
+        age = columns['age'][row]
+        if age is not None and age > self.age_threshold:
+            return 'old'
+        return None
+
+    def row_tooltip(self, row):
+        """Build the checkbox column tooltip of a row"""
+        columns = self.store.columns
+        data = columns['record'][row]
+        tooltip = ""
+        
+        state = self.row_state(row)
+        if state == 'chain':
+            chain_status = []
+            if data['has_children']:
+                count = data.get('child_count')
+                chain_status.append(f"Has {count} child snapshot{'s' if count != 1 else ''}"
+                                    if count else "Has child snapshots")
+            if data['is_child']:
+                position = data.get('chain_position')
+                chain_status.append(f"Is snapshot {position} in its chain" if position else "Is a child snapshot")
+            
+            tooltip = "Cannot delete: " + " and ".join(chain_status)
+            tooltip += "\n\nChain snapshots must be deleted through vSphere Client because:"
+            tooltip += "\n• They have dependencies that require special handling"
+            tooltip += "\n• Improper deletion can corrupt VM data"
+            tooltip += "\n• VMware needs to consolidate disk changes properly"
+        elif state == 'old':
+            tooltip = (f"Snapshot is {columns['age'][row]} {self.day_type} old "
+                       f"(threshold: {self.age_threshold} {self.day_type})")
+        
+        if columns['stale'][row]:
+            fetched_at = data.get('fetched_at')
+            if fetched_at:
+                fetched_text = datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d %H:%M')
+                stale_text = f"Cached from {fetched_text} - refresh to update"
+            else:
+                stale_text = "Cached - refresh to update"
+            tooltip = f"{stale_text}\n\n{tooltip}" if tooltip else stale_text
+        
+        return tooltip or None
+
+    def upsert(self, items):
+        """
+        Insert new snapshot rows and refresh existing ones in place.
+        
+        Refreshed rows are reported with one dataChanged signal and new rows
+        with one insert, however many snapshots the batch holds.
+        
+        Args:
+            items (list): (snapshot ID, snapshot record) pairs
+        """
+        store = self.store
+        new_items = {}
+        updated_rows = []
+        checked_before = self._checked_count
+        
+        for snapshot_id, data in items:
+            row = store.row_of.get(snapshot_id)
+            if row is None:
+                new_items[snapshot_id] = data
+                continue
+            if store.columns['checked'][row]:
+                self._checked_count -= 1
+            store.update(row, snapshot_id, data)
+            updated_rows.append(row)
+        
+        if updated_rows:
+            self.compute_ages(updated_rows)
+            self.dataChanged.emit(
+                self.index(min(updated_rows), 0),
+                self.index(max(updated_rows), len(self.HEADERS) - 1)
+            )
+        
+        if new_items:
+            first = len(store)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_items) - 1)
+            for snapshot_id, data in new_items.items():
+                store.append(snapshot_id, data)
+            self.compute_ages(range(first, len(store)))
+            self.endInsertRows()
+        
+        if self._checked_count != checked_before:
+            self.checked_count_changed.emit(self._checked_count)
+
+    def remove_ids(self, snapshot_ids):
+        """
+        Remove the rows of the given snapshot IDs.
+        
+        Contiguous rows are removed together; a removal scattered over many
+        ranges resets the model once instead of signalling every range.
+        
+        Args:
+            snapshot_ids (iterable): Snapshot IDs to remove
+        """
+        store = self.store
+        rows = sorted({store.row_of[snapshot_id] for snapshot_id in snapshot_ids if snapshot_id in store.row_of})
+        if not rows:
+            return
+        
+        self.layout_revision += 1
+        checked_before = self._checked_count
+        self._checked_count -= sum(1 for row in rows if store.columns['checked'][row])
+        
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        
+        if len(ranges) > self.MAX_REMOVE_RANGES:
+            self.beginResetModel()
+            store.remove_ids({store.columns['id'][row] for row in rows})
+            self.endResetModel()
+        else:
+            # Remove from the bottom up so earlier ranges keep their row numbers
+            for first, last in reversed(ranges):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                store.remove_rows(first, last)
+                self.endRemoveRows()
+        
+        if self._checked_count != checked_before:
+            self.checked_count_changed.emit(self._checked_count)
+
+    def compute_ages(self, rows):
+        """Compute the ages of the given rows in one pass"""
+        if self.age_function is None:
+            return
+        created_ts = self.store.columns['created_ts']
+        ages = self.store.columns['age']
+        for row, age in zip(rows, self.age_function([created_ts[row] for row in rows], self.day_type)):
+            ages[row] = age
+
+    def set_age_policy(self, age_threshold, day_type, age_function):
+        """
+        Update the age highlighting settings.
+        
+        Ages are recomputed only when the day type or age function changes,
+        or the date has changed since they were computed; a new threshold
+        just repaints the highlighting.
+        
+        Args:
+            age_threshold (int): Age above which snapshots are highlighted
+            day_type (str): "business days" or "calendar days"
+            age_function (callable): (list of creation epoch seconds, day type) -> list of ages in days
+        """
+        recompute = (day_type != self.day_type or age_function != self.age_function
+                     or self.ages_date != date.today())
+        if not recompute and age_threshold == self.age_threshold:
+            return
+        
+        self.age_threshold = age_threshold
+        self.day_type = day_type
+        self.age_function = age_function
+        if recompute:
+            self.refresh_ages()
+        else:
+            self.repaint_ages()
+
+    def refresh_ages(self):
+        """Recompute every age against the current time and repaint the highlighting"""
+        if self.age_function is None:
+            return
+        self.store.columns['age'] = self.age_function(self.store.columns['created_ts'], self.day_type)
+        self.ages_date = date.today()
+        self.repaint_ages()
+
+    def repaint_ages(self):
+        """Report the highlighting and tooltips of every row as changed"""
+        if len(self.store):
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.store) - 1, len(self.HEADERS) - 1),
+                [self.ROW_STATE_ROLE, Qt.ItemDataRole.ToolTipRole]
+            )
+
+    def sort_keys(self, column):
+        """Get the per-row sort keys of a column; creation times sort as numbers"""
+        return self.store.columns[self.SORT_FIELDS[column]]
+
+    def record(self, row):
+        """Get the snapshot record of a row"""
+        return self.store.columns['record'][row]
+
+    def filter_key(self, row):
+        """Get the precomputed SnapshotFilter key of a row"""
+        return self.store.columns['filter_key'][row]
+
+    def filter_keys(self):
+        """Get an immutable copy of every row's filter key for evaluation off the UI thread"""
+        return tuple(self.store.columns['filter_key'])
+
+    def changed_rows(self, filter_keys):
+        """
+        Find rows whose filter key was replaced since a filter_keys() copy.
+        
+        Args:
+            filter_keys (tuple): Copy taken at the current layout revision
+            
+        Returns:
+            list: Rows refreshed since the copy was taken
+        """
+        current = self.store.columns['filter_key']
+        return [row for row, key in enumerate(filter_keys) if key is not current[row]]
+
+    def checked_ids(self):
+        """Get the IDs of all checked snapshots in row order"""
+        columns = self.store.columns
+        return [snapshot_id for snapshot_id, checked in zip(columns['id'], columns['checked']) if checked]
+
+class SnapshotProxyModel(QAbstractProxyModel):
+    """
+    Filtering and sorting proxy for SnapshotTableModel.
+    
+    QSortFilterProxyModel compares rows through data() calls. This proxy sorts
+    with the model's column lists as plain Python keys and only re-evaluates
+    the filter for rows the model reports as inserted or changed.
+    """
+    MAX_REMOVE_GROUPS = 64  # Above this a removal resets the proxy instead
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []        # proxy row -> source row
+        self._proxy_rows = []  # source row -> proxy row, -1 when filtered out
+        self._accepts = None
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._on_model_reset)
+        self.beginResetModel()
+        self._rebuild()
+        self.endResetModel()
+
+    def set_filter(self, accepts):
+        """
+        Set the row filter.
+        
+        Args:
+            accepts (callable): source row -> bool, or None to show every row
+        """
+        self._accepts = accepts
+        self.invalidate_filter()
+
+    def invalidate_filter(self):
+        """Re-evaluate the filter for every row"""
+        self.beginResetModel()
+        self._rebuild()
+        self.endResetModel()
+
+    def apply_visibility(self, visible):
+        """
+        Show exactly the rows set in a visibility bitmap.
+        
+        Only the rows whose visibility differs from the current state are
+        removed or inserted, so a filter change doesn't reset the view. Rows
+        past the end of the bitmap keep their current visibility.
         
-        layout.addWidget(QLabel("Username:"), 2, 0)
-        self.username = QLineEdit()
-        layout.addWidget(self.username, 2, 1)
+        Args:
+            visible (bytearray): One byte per source row, non-zero to show it
+        """
+        proxy_rows = self._proxy_rows
+        hidden, shown = [], []
+        for source_row, show in enumerate(visible):
+            proxy_row = proxy_rows[source_row]
+            if proxy_row >= 0 and not show:
+                hidden.append(proxy_row)
+            elif proxy_row < 0 and show:
+                shown.append(source_row)
+        
+        if hidden:
+            self._remove_proxy_rows(hidden)
+        if shown:
+            self._append_rows(shown)
+            self._relayout()
+
+    def accepts_row(self, source_row):
+        """Check if a source row passes the filter"""
+        return self._accepts is None or self._accepts(source_row)
+
+    def _rebuild(self):
+        """Recompute the visible rows and their order"""
+        source = self.sourceModel()
+        count = source.rowCount() if source is not None else 0
+        rows = [row for row in range(count) if self.accepts_row(row)]
+        self._rows = self._sorted(rows)
+        self._update_proxy_rows(count)
+
+    def _update_proxy_rows(self, source_count=None):
+        if source_count is None:
+            source_count = self.sourceModel().rowCount()
+        proxy_rows = [-1] * source_count
+        for proxy_row, source_row in enumerate(self._rows):
+            proxy_rows[source_row] = proxy_row
+        self._proxy_rows = proxy_rows
+
+    def _sorted(self, rows):
+        if self._sort_column < 0:
+            return rows
+        keys = self.sourceModel().sort_keys(self._sort_column)
+        return sorted(rows, key=keys.__getitem__, reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
+    def _relayout(self):
+        """Re-sort the visible rows, keeping persistent indexes on their rows"""
+        if self._sort_column < 0:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        source_rows = [self._rows[index.row()] for index in old_indexes]
         
-        layout.addWidget(QLabel("Password:"), 3, 0)
-        self.password = QLineEdit()
-        self.password.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(self.password, 3, 1)
+        self._rows = self._sorted(self._rows)
+        self._update_proxy_rows()
         
-        # Remember checkbox
-        self.save_check = QCheckBox("Remember server credentials (passwords stored securely in system keychain)")
-        self.save_check.setChecked(True)
-        layout.addWidget(self.save_check, 4, 0, 1, 2)
+        new_indexes = [self.index(self._proxy_rows[row], index.column())
+                       for row, index in zip(source_rows, old_indexes)]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _remove_proxy_rows(self, proxy_rows):
+        """Remove visible rows, grouped into contiguous ranges"""
+        groups = []
+        for proxy_row in sorted(proxy_rows, reverse=True):
+            if groups and groups[-1][0] == proxy_row + 1:
+                groups[-1][0] = proxy_row
+            else:
+                groups.append([proxy_row, proxy_row])
+        
+        if len(groups) > self.MAX_REMOVE_GROUPS:
+            self.beginResetModel()
+            removed = set(proxy_rows)
+            self._rows = [row for proxy_row, row in enumerate(self._rows) if proxy_row not in removed]
+            self._update_proxy_rows(len(self._proxy_rows))
+            self.endResetModel()
+            return
         
-        # Add info label about security
-        info_text = ("Note: Passwords are stored securely in your system's keychain\n"
-                    "(macOS Keychain, Windows Credential Manager, or Linux Secret Service)")
-        info_label = QLabel(info_text)
-        info_label.setStyleSheet("color: gray; font-size: 10px;")
-        layout.addWidget(info_label, 5, 0, 1, 2)
+        for first, last in groups:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for source_row in self._rows[first:last + 1]:
+                self._proxy_rows[source_row] = -1
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        self._update_proxy_rows(len(self._proxy_rows))
+
+    def _append_rows(self, source_rows):
+        """Show newly accepted rows at the end; callers sort them into place"""
+        if not source_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(source_rows) - 1)
+        self._rows.extend(source_rows)
+        for proxy_row, source_row in enumerate(source_rows, first):
+            self._proxy_rows[source_row] = proxy_row
+        self.endInsertRows()
+
+    def _on_rows_inserted(self, parent, first, last):
+        count = last - first + 1
+        if first < len(self._proxy_rows):
+            self._rows = [row + count if row >= first else row for row in self._rows]
+            self._update_proxy_rows()
+        else:
+            self._proxy_rows.extend([-1] * count)
+        self._append_rows([row for row in range(first, last + 1) if self.accepts_row(row)])
+        self._relayout()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        visible = [self._proxy_rows[row] for row in range(first, last + 1) if self._proxy_rows[row] >= 0]
+        if visible:
+            self._remove_proxy_rows(visible)
+
+    def _on_rows_removed(self, parent, first, last):
+        count = last - first + 1
+        self._rows = [row - count if row > last else row for row in self._rows]
+        self._update_proxy_rows()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        first, last = top_left.row(), bottom_right.row()
         
-        # Buttons
-        button_box = QHBoxLayout()
-        connect_btn = QPushButton("Connect")
-        connect_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
+        # Checkbox and highlighting changes don't affect filtering or sort order
+        if roles and Qt.ItemDataRole.DisplayRole not in roles and not (
+                self._sort_column == 0 and Qt.ItemDataRole.CheckStateRole in roles):
+            self._forward_data_changed(first, last, top_left.column(), bottom_right.column(), roles)
+            return
         
-        button_box.addWidget(connect_btn)
-        button_box.addWidget(cancel_btn)
-        layout.addLayout(button_box, 6, 0, 1, 2)
+        hidden, shown = [], []
+        for row in range(first, last + 1):
+            accepted = self.accepts_row(row)
+            visible = self._proxy_rows[row] >= 0
+            if visible and not accepted:
+                hidden.append(self._proxy_rows[row])
+            elif accepted and not visible:
+                shown.append(row)
+        
+        if hidden:
+            self._remove_proxy_rows(hidden)
+        if shown:
+            self._append_rows(shown)
+        self._forward_data_changed(first, last, top_left.column(), bottom_right.column(), roles)
+        self._relayout()
 
-    def on_server_selected(self, index):
-        """Auto-fill saved server details and password"""
-        hostname = self.server_combo.currentText()
-        if hostname and hostname in self.saved_servers:
-            username = self.saved_servers[hostname]
-            self.hostname.setText(hostname)
-            self.username.setText(username)
-            
-            # Try to get saved password
-            password = self.config_manager.get_password(hostname, username)
-            if password:
-                self.password.setText(password)
-            
-            self.password.setFocus()
+    def _forward_data_changed(self, first, last, first_column, last_column, roles):
+        proxy_rows = [self._proxy_rows[row] for row in range(first, last + 1) if self._proxy_rows[row] >= 0]
+        if proxy_rows:
+            self.dataChanged.emit(
+                self.index(min(proxy_rows), first_column),
+                self.index(max(proxy_rows), last_column),
+                roles
+            )
 
-    def get_data(self):
-        return {
-            'hostname': self.hostname.text(),
-            'username': self.username.text(),
-            'password': self.password.text(),
-            'save': self.save_check.isChecked()
-        }
+    def _on_model_reset(self):
+        self._rebuild()
+        self.endResetModel()
 
-    def closeEvent(self, event):
-        """Save window position when closing"""
-        settings = QSettings()
-        settings.setValue("AddVCenterDialogGeometry", self.saveGeometry())
-        super().closeEvent(event)
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._relayout()
 
-class SnapshotDeleteWorker(QThread):
-    """Worker thread for deleting snapshots"""
-    progress = pyqtSignal(int, int, str)  # completed, total, message
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-    item_complete = pyqtSignal(QTreeWidgetItem)
+    def source_row(self, proxy_row):
+        """Get the source row shown at a proxy row"""
+        return self._rows[proxy_row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        proxy_row = self._proxy_rows[source_index.row()]
+        if proxy_row < 0:
+            return QModelIndex()
+        return self.createIndex(proxy_row, source_index.column())
 
-    def __init__(self, items_to_delete):
+class SnapshotFilterWorker(QThread):
+    """Worker thread evaluating a compiled filter over a copy of the filter keys"""
+    filtered = pyqtSignal(object)  # bytearray, one byte per row
+
+    def __init__(self, snapshot_filter, filter_keys, layout_revision):
         super().__init__()
-        self.items_to_delete = items_to_delete
+        self.snapshot_filter = snapshot_filter
+        self.filter_keys = filter_keys
+        self.layout_revision = layout_revision  # Model layout the keys were copied at
 
     def run(self):
-        total = len(self.items_to_delete)
-        completed = 0
-        active_tasks = {}  # Store active deletion tasks
-        
-        # Start all deletion tasks
-        for item, data in self.items_to_delete:
-            try:
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Deleting", f"{data['vm_name']}"
-                )
-                
-                # Get the VM and snapshot objects
-                snapshot = data['snapshot']
-                
-                # Create deletion task
-                task = snapshot.snapshot.RemoveSnapshot_Task(removeChildren=False)
-                active_tasks[task] = (item, data)
-                
-            except Exception as e:
-                self.error.emit(f"Error starting deletion of {data['name']}: {str(e)}")
-        
-        # Monitor all tasks until completion
-        while active_tasks:
-            total_progress = 0
-            
-            for task in list(active_tasks.keys()):
-                item, data = active_tasks[task]
-                try:
-                    if task.info.state == vim.TaskInfo.State.success:
-                        self.item_complete.emit(item)
-                        completed += 1
-                        del active_tasks[task]
-                    elif task.info.state == vim.TaskInfo.State.error:
-                        self.error.emit(f"Failed to delete {data['name']}: {task.info.error.msg}")
-                        del active_tasks[task]
-                    else:
-                        # Task still in progress, add to total progress
-                        task_progress = task.info.progress or 0
-                        total_progress += task_progress
-                except Exception as e:
-                    self.error.emit(f"Error monitoring {data['name']}: {str(e)}")
-                    del active_tasks[task]
-            
-            # Calculate and show overall progress
-            if active_tasks:
-                overall_progress = (completed * 100 + total_progress) / total
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Deleting", f"{overall_progress:.0f}%"
-                )
-            
-            # Small delay before next check
-            time.sleep(0.5)
-        
-        ProgressTracker.emit_progress(
-            self.progress, total, total,
-            "Complete", "All deleted"
-        )
-        self.finished.emit()
+        self.filtered.emit(bytearray(map(self.snapshot_filter.matches_key, self.filter_keys)))
+
+class SnapshotRowDelegate(QStyledItemDelegate):
+    """Paints chain and age highlighting from the model's row state"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.row_colors = {
+            'chain': (QBrush(QColor(211, 211, 211)), QBrush(QColor(128, 128, 128))),  # Light gray, gray text
+            'old': (QBrush(QColor(255, 255, 200)), QBrush(QColor(139, 69, 19))),  # Light yellow, saddle brown text
+        }
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        colors = self.row_colors.get(index.data(SnapshotTableModel.ROW_STATE_ROLE))
+        if colors:
+            background, text = colors
+            option.backgroundBrush = background
+            option.palette.setBrush(QPalette.ColorRole.Text, text)
+
+# How often snapshot ages are recomputed, so highlighting follows the clock in long sessions
+AGE_REFRESH_INTERVAL_MS = 10 * 60 * 1000
 
 class SnapshotManagerWindow(QMainWindow):
     def __init__(self):
@@ -403,17 +2395,32 @@ class SnapshotManagerWindow(QMainWindow):
             QApplication.setWindowIcon(app_icon)
         
         # Initialize variables
-        self.vcenter_connections = {}
+        self.vcenter_connections = SessionRegistry()  # Worker threads lease their own stubs from it
+        self.running_operations = set()  # 'fetch', 'delete' and/or 'create'; they may overlap
+        self.attribution_worker = None
         self.snapshots = {}
+        self.live_workers = {}  # hostname -> LiveUpdateWorker
+        self.stopping_live_workers = set()  # Stopped workers kept alive until their thread exits
+        self.inventory_cache = InventoryCache()
+        
+        # Delete/create jobs are journaled so a crashed run can be finished later
+        self.job_journal = JobJournal()
+        self.job_journal.compact()
+        self.resumed_jobs = set()
+        self.business_calendar = BusinessDayCalendar(load_holidays())
+        self.vm_name_index = VMNameIndex()
         self.setup_logging()
         self.logger = logging.getLogger('pySnap')
         self.config_manager = ConfigManager()
         self.saved_servers = self.config_manager.load_servers()
         
-        # Add connection monitoring timer
-        self.connection_timer = QTimer(self)
-        self.connection_timer.timeout.connect(self.check_connections)
-        self.connection_timer.start(300000)  # Check every 5 minutes
+        # Health checks, keepalive and reconnects run in the background; the
+        # status label only reads the cached health
+        self.health_monitor = ConnectionHealthMonitor()
+        self.health_monitor.health_changed.connect(self.refresh_connection_label)
+        self.health_monitor.reconnected.connect(self.on_reconnected)
+        self.health_monitor.connection_lost.connect(self.on_connection_lost)
+        self.health_monitor.start()
         
         # Store credentials for reconnection
         self.active_credentials = {}  # Store credentials for active connections
@@ -455,11 +2462,39 @@ class SnapshotManagerWindow(QMainWindow):
         self.patch_filter_checkbox.stateChanged.connect(self.sync_patch_filter_to_panel)
         self.patch_filter_checkbox.stateChanged.connect(self.apply_filters)
         
+        # Opt-in live mode keeps rows current via WaitForUpdatesEx after a fetch
+        self.live_updates_checkbox = QCheckBox("Live updates")
+        self.live_updates_checkbox.setToolTip(
+            "After fetching, keep snapshots up to date as they are created or removed in vSphere"
+        )
+        self.live_updates_checkbox.setChecked(settings.value("LiveUpdatesEnabled", False, type=bool))
+        self.live_updates_checkbox.stateChanged.connect(self.on_live_updates_toggled)
+        
+        # Opt-in session reuse resumes saved sessions on startup instead of logging in again
+        self.reuse_sessions_checkbox = QCheckBox("Reuse sessions")
+        self.reuse_sessions_checkbox.setToolTip(
+            "Keep vCenter session IDs in the system keyring and resume them on startup"
+        )
+        self.reuse_sessions_checkbox.setChecked(settings.value("ReuseSessions", False, type=bool))
+        self.reuse_sessions_checkbox.stateChanged.connect(self.on_reuse_sessions_toggled)
+        
+        # Opt-in pass crediting "Unknown" snapshots from vCenter task history
+        self.attribute_creators_checkbox = QCheckBox("Creators from tasks")
+        self.attribute_creators_checkbox.setToolTip(
+            "After fetching, look up who created snapshots without a \"Created by:\" description "
+            "in the vCenter task history"
+        )
+        self.attribute_creators_checkbox.setChecked(settings.value("AttributeCreators", False, type=bool))
+        self.attribute_creators_checkbox.stateChanged.connect(self.on_attribute_creators_toggled)
+        
         conn_layout.addWidget(self.add_conn_btn)
         conn_layout.addWidget(self.auto_conn_btn)
         conn_layout.addWidget(self.clear_conn_btn)
         conn_layout.addWidget(self.conn_label)
         conn_layout.addStretch()
+        conn_layout.addWidget(self.reuse_sessions_checkbox)
+        conn_layout.addWidget(self.attribute_creators_checkbox)
+        conn_layout.addWidget(self.live_updates_checkbox)
         conn_layout.addWidget(self.patch_filter_checkbox)
         
         # Filter panel
@@ -477,16 +2512,38 @@ class SnapshotManagerWindow(QMainWindow):
         # Update the color legend label
         self.update_old_snapshots_label()
         
-        # Tree widget for snapshots
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Select", "VM Name", "vCenter", "Snapshot Name", "Created", "Created By", "Description", "Snapshot Type"])
+        # Snapshot table: column-oriented model, filtering/sorting proxy and a
+        # delegate painting chain/age highlighting, so only visible rows cost anything
+        self.snapshot_model = SnapshotTableModel(self)
+        self.snapshot_model.set_age_policy(
+            self.filter_panel.get_age_threshold(), self.filter_panel.get_day_type(), self.get_snapshot_ages
+        )
+        self.snapshot_model.checked_count_changed.connect(self.on_checked_count_changed)
+        self.age_refresh_timer = QTimer(self)
+        self.age_refresh_timer.timeout.connect(self.snapshot_model.refresh_ages)
+        self.age_refresh_timer.start(AGE_REFRESH_INTERVAL_MS)
+        self.snapshot_proxy = SnapshotProxyModel(self)
+        self.snapshot_proxy.setSourceModel(self.snapshot_model)
+        self.snapshot_filter = self.filter_panel.compile_filters(self.patch_filter_checkbox.isChecked())
+        self.snapshot_proxy.set_filter(self.snapshot_accepts)
+        self.filter_worker = None
+        self.filter_rerun_needed = False
+        
+        # A table view only lays out the rows on screen; a tree view walks every row on each change
+        self.tree = QTableView()
+        self.tree.setModel(self.snapshot_proxy)
+        self.tree.setItemDelegate(SnapshotRowDelegate(self.tree))
+        self.tree.setShowGrid(False)
+        self.tree.setWordWrap(False)
+        self.tree.verticalHeader().hide()
+        self.tree.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.tree.verticalHeader().setDefaultSectionSize(self.tree.fontMetrics().height() + 6)
+        self.tree.horizontalHeader().setStretchLastSection(True)
+        self.tree.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         self.tree.setSortingEnabled(True)
         
         # Disable row selection, only allow checkbox interaction
-        self.tree.setSelectionMode(QTreeWidget.SelectionMode.NoSelection)
-        
-        # Connect to item clicked for checkbox handling
-        self.tree.itemClicked.connect(self.on_item_clicked)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         
         # Set default sorting to Created column (index 4) in ascending order
         self.tree.sortByColumn(4, Qt.SortOrder.AscendingOrder)
@@ -496,7 +2553,7 @@ class SnapshotManagerWindow(QMainWindow):
         self.tree.customContextMenuRequested.connect(self.show_context_menu)
         
         # Connect double-click handler
-        self.tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.tree.doubleClicked.connect(self.on_item_double_clicked)
         
         # Button frame
         button_frame = QWidget()
@@ -631,84 +2688,19 @@ class SnapshotManagerWindow(QMainWindow):
 
         # After loading saved_servers
         self.check_auto_connect()
+        
+        # Warm start from the last fetched inventory
+        self.load_cached_snapshots()
 
         # Settings menu removed - auto-connect is now manual only
 
-    def get_snapshots(self):
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(script_dir, 'snapshots.json')
-            
-            if not os.path.exists(json_path):
-                messagebox.showerror("Error", "snapshots.json not found. Please run export_snapshots.ps1 first.")
-                return []
-                
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-                
-            # Ensure we always return a list
-            if not isinstance(data, list):
-                data = [data]
-            return data
-            
-        except json.JSONDecodeError as e:
-            messagebox.showerror("Error", f"Failed to parse JSON file:\n{e}")
-            return []
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to read snapshots:\n{e}")
-            return []
-
-    def refresh_snapshots(self):
-        self.status_var.set("Refreshing snapshots...")
-        self.root.update()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        snapshots = self.get_snapshots()
-        for snap in snapshots:
-            status = "Ineligible (Chain)" if snap['HasChildren'] or snap['IsChild'] else "Eligible"
-            
-            # Handle different datetime formats
-            try:
-                # Try parsing with timezone offset
-                created_date = datetime.datetime.strptime(
-                    snap['Created'].split('.')[0], 
-                    '%Y-%m-%dT%H:%M:%S'
-                ).strftime('%Y-%m-%d %H:%M')
-            except ValueError:
-                try:
-                    # Fallback to UTC format
-                    created_date = datetime.datetime.strptime(
-                        snap['Created'], 
-                        '%Y-%m-%dT%H:%M:%S.%fZ'
-                    ).strftime('%Y-%m-%d %H:%M')
-                except ValueError:
-                    # If all else fails, just show the raw date
-                    created_date = snap['Created']
-            
-            self.tree.insert("", Qt.ItemModelRole.End, values=(
-                snap['VMName'],
-                snap['vCenter'],
-                snap['Name'],
-                created_date,
-                f"{snap['SizeMB']:.2f}",
-                status
-            ))
-        
-        self.status_var.set(f"Found {len(snapshots)} snapshots")
-
     def delete_selected(self):
         """Delete selected snapshots"""
-        selected_items = []
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.checkState(0) == Qt.CheckState.Checked:
-                snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
-                if snapshot_id in self.snapshots:
-                    selected_items.append((item, self.snapshots[snapshot_id]))
-            iterator += 1
+        selected_items = [
+            (snapshot_id, self.snapshots[snapshot_id])
+            for snapshot_id in self.snapshot_model.checked_ids()
+            if snapshot_id in self.snapshots
+        ]
         
         if not selected_items:
             QMessageBox.warning(self, "Warning", "No snapshots selected")
@@ -716,7 +2708,7 @@ class SnapshotManagerWindow(QMainWindow):
         
         # Group snapshots by vCenter for better organization
         by_vcenter = {}
-        for item, data in selected_items:
+        for snapshot_id, data in selected_items:
             vcenter = data['vcenter']
             if vcenter not in by_vcenter:
                 by_vcenter[vcenter] = []
@@ -757,8 +2749,13 @@ class SnapshotManagerWindow(QMainWindow):
             for data in snapshots:
                 details += f"\n• VM: {data['vm_name']}"
                 details += f"\n  ├ Snapshot: {data['name']}"
-                details += f"\n  ├ Created: {data['created']}"
-                details += f"\n  └ Age: {self.get_business_days(datetime.strptime(data['created'], '%Y-%m-%d %H:%M'), datetime.now())} business days"
+                created_ts = created_timestamp(data)
+                details += f"\n  ├ Created: {format_created(created_ts) or data.get('created', '')}"
+                if created_ts is None:
+                    age_text = "unknown"
+                else:
+                    age_text = f"{self.get_business_days(datetime.fromtimestamp(created_ts), datetime.now())} business days"
+                details += f"\n  └ Age: {age_text}"
                 details += "\n"
         
         details += "\nWARNING: This action cannot be undone!"
@@ -806,30 +2803,14 @@ class SnapshotManagerWindow(QMainWindow):
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
 
-    def on_item_clicked(self, item, column):
-        """Handle tree item clicks"""
-        if column == 0:  # Only handle clicks in the checkbox column
-            # Let Qt handle the checkbox state toggle naturally
-            pass
-            
-            # Count checked items and update delete button
-            checked_count = 0
-            iterator = QTreeWidgetItemIterator(self.tree)
-            while iterator.value():
-                if iterator.value().checkState(0) == Qt.CheckState.Checked:
-                    checked_count += 1
-                iterator += 1
-            
-            # Update delete button text and enabled state
-            if checked_count > 0:
-                self.delete_button.setText(f"Delete Selected ({checked_count})")
-                self.delete_button.setEnabled(True)
-            else:
-                self.delete_button.setText("Delete Selected")
-                self.delete_button.setEnabled(False)
+    def on_checked_count_changed(self, checked_count):
+        """Update delete button text and enabled state when checkboxes change"""
+        if checked_count > 0:
+            self.delete_button.setText(f"Delete Selected ({checked_count})")
+            self.delete_button.setEnabled('delete' not in self.running_operations)
         else:
-            # Prevent selection when clicking other columns
-            self.tree.clearSelection()
+            self.delete_button.setText("Delete Selected")
+            self.delete_button.setEnabled(False)
 
     def add_vcenter(self):
         """Show dialog to add new vCenter connection"""
@@ -841,29 +2822,7 @@ class SnapshotManagerWindow(QMainWindow):
                 # Show connection status without progress bar
                 self.status_label.setText(f"Connecting to {data['hostname']}...")
                 
-                # Create SSL context that ignores verification
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                
-                # Disable SSL verification warnings
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                
-                # Set temporary socket timeout for this connection
-                old_timeout = socket.getdefaulttimeout()
-                socket.setdefaulttimeout(10.0)
-                
-                try:
-                    si = SmartConnect(
-                        host=data['hostname'],
-                        user=data['username'],
-                        pwd=data['password'],
-                        sslContext=context,
-                        disableSslCertValidation=True
-                    )
-                finally:
-                    # Restore original timeout
-                    socket.setdefaulttimeout(old_timeout)
+                si = connect_vcenter(data['hostname'], data['username'], data['password'])
                 
                 self.status_label.setText(f"Connected to {data['hostname']}, initializing...")
                 
@@ -873,6 +2832,7 @@ class SnapshotManagerWindow(QMainWindow):
                         'username': data['username'],
                         'password': data['password']
                     }
+                    self.health_monitor.track(data['hostname'], si, self.active_credentials[data['hostname']])
                     # Save credentials if requested
                     if data['save']:
                         self.status_label.setText("Saving credentials...")
@@ -884,11 +2844,13 @@ class SnapshotManagerWindow(QMainWindow):
                             data['username'],
                             data['password']
                         )
+                        self.save_session(data['hostname'], si)
                     
                     self.status_label.setText(f"Successfully connected to {data['hostname']}")
                     
                     # Update UI and reset status after a delay
                     self.update_connection_status()
+                    self.resume_jobs()
                     
                     # Reset status after a short delay
                     QTimer.singleShot(2000, lambda: self.status_label.setText("Ready"))
@@ -900,41 +2862,50 @@ class SnapshotManagerWindow(QMainWindow):
 
     def clear_connections(self):
         """Clear all vCenter connections"""
+        self.stop_live_updates()
         for hostname, si in self.vcenter_connections.items():
             try:
                 Disconnect(si)
             except:
                 pass
+            # Disconnect logged the session out, so it can't be resumed
+            if hostname in self.saved_servers:
+                self.config_manager.clear_session(hostname, self.saved_servers[hostname])
         self.vcenter_connections.clear()
         self.active_credentials.clear()  # Clear stored credentials
+        self.health_monitor.forget()
+        self.vm_name_index.invalidate()
         self.update_connection_status()
 
     def update_connection_status(self):
-        """Update the connection status label"""
+        """Update the connection status label and the buttons that need a connection"""
+        self.refresh_connection_label()
         if not self.vcenter_connections:
-            self.conn_label.setText("No active connections")
             self.clear_conn_btn.setEnabled(False)
             self.fetch_button.setEnabled(False)
             self.delete_button.setEnabled(False)
         else:
-            status_text = ""
-            for hostname in self.vcenter_connections:
-                try:
-                    # Test connection
-                    self.vcenter_connections[hostname].CurrentTime()
-                    status_text += f"🟢 {hostname}  "  # Green circle for success
-                except:
-                    status_text += f"🔴 {hostname}  "  # Red circle for failure
-            
-            self.conn_label.setText(f"Connected to: {status_text}")
             self.clear_conn_btn.setEnabled(True)
-            self.fetch_button.setEnabled(True)
+            self.fetch_button.setEnabled('fetch' not in self.running_operations)
+
+    def refresh_connection_label(self, *_):
+        """Show each connection's cached health; no server calls are made here"""
+        if not self.vcenter_connections:
+            self.conn_label.setText("No active connections")
+            return
+        
+        icons = {'ok': "🟢", 'reconnecting': "🟡", 'down': "🔴"}
+        status_text = ""
+        for hostname in self.vcenter_connections:
+            status_text += f"{icons.get(self.health_monitor.health(hostname), '🟢')} {hostname}  "
+        self.conn_label.setText(f"Connected to: {status_text}")
 
     def start_fetch(self):
         """Start fetching snapshots in background"""
-        self.tree.clear()
-        self.snapshots.clear()  # Clear snapshot data
+        # Keep current rows visible but stale; the fetch reconciles them per vCenter
+        self.mark_snapshots_stale()
         self.clear_filters_on_refresh()  # Clear filters
+        self.running_operations.add('fetch')
         self.fetch_button.setEnabled(False)
         self.delete_button.setText("Delete Selected")  # Reset delete button text
         
@@ -943,105 +2914,38 @@ class SnapshotManagerWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_label.setText("Fetching snapshots...")
         
-        self.fetch_worker = SnapshotFetchWorker(self.vcenter_connections)
+        # Track per-vCenter fetch state for the status line
+        self.fetch_status = {hostname: "waiting" for hostname in self.vcenter_connections}
+        self.fetch_errors = {}
+        
+        # Page size is configurable for very large or very slow vCenters
+        settings = QSettings()
+        page_size = settings.value("FetchPageSize", FETCH_PAGE_SIZE, type=int)
+        
+        self.fetch_worker = SnapshotFetchWorker(self.vcenter_connections, page_size=page_size)
         self.fetch_worker.progress.connect(self.update_progress)
-        self.fetch_worker.snapshot_found.connect(self.add_snapshot_to_tree)
+        self.fetch_worker.snapshots_found.connect(self.add_snapshots_to_tree)
+        self.fetch_worker.vcenter_progress.connect(self.on_vcenter_fetch_progress)
+        self.fetch_worker.vcenter_finished.connect(self.on_vcenter_fetch_finished)
+        self.fetch_worker.vcenter_error.connect(self.on_vcenter_fetch_error)
         self.fetch_worker.error.connect(self.on_fetch_error)
         self.fetch_worker.finished.connect(self.on_fetch_complete)
         self.fetch_worker.start()
 
-    def add_snapshot_to_tree(self, data):
-        """Add a snapshot to the tree widget"""
-        item = QTreeWidgetItem(self.tree)
-        
-        # Check if snapshot is part of a chain
-        is_in_chain = data['has_children'] or data['is_child']
-        
-        if is_in_chain:
-            # Disable checkbox and add warning style
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEnabled)  # Don't add ItemIsUserCheckable
-            warning_color = QColor(211, 211, 211)  # Light gray
-            warning_text = QColor(128, 128, 128)  # Gray text
-            
-            for column in range(8):
-                item.setBackground(column, QBrush(warning_color))
-                item.setForeground(column, QBrush(warning_text))
-            
-            # Add warning tooltip
-            chain_status = []
-            if data['has_children']:
-                chain_status.append("Has child snapshots")
-            if data['is_child']:
-                chain_status.append("Is a child snapshot")
-            
-            warning_text = "Cannot delete: " + " and ".join(chain_status)
-            warning_text += "\n\nChain snapshots must be deleted through vSphere Client because:"
-            warning_text += "\n• They have dependencies that require special handling"
-            warning_text += "\n• Improper deletion can corrupt VM data"
-            warning_text += "\n• VMware needs to consolidate disk changes properly"
-            item.setToolTip(0, warning_text)
-        else:
-            # Normal snapshot handling
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            item.setCheckState(0, Qt.CheckState.Unchecked)
-        
-        # Set text for other columns
-        item.setText(1, data['vm_name'])
-        item.setText(2, data['vcenter'])
-        item.setText(3, data['name'])
-        item.setText(4, data['created'])
-        item.setText(5, data.get('created_by', 'Unknown'))  # Add created by column
-        item.setText(6, data.get('description', ''))  # Add description column
-        
-        # Add chain status column
-        if is_in_chain:
-            if data['has_children'] and data['is_child']:
-                chain_status = "Part of Chain (Middle)"
-            elif data['has_children']:
-                chain_status = "Has Child Snapshots (Delete Manually)"
-            else:  # is_child
-                chain_status = "Child Snapshot"
-        else:
-            chain_status = "Independent Snapshot"  # Changed from "Safe to Delete"
-        item.setText(7, chain_status)
-        
-        # Only apply age highlighting if NOT part of a chain (chain highlighting takes precedence)
-        if not is_in_chain:
-            # Check if snapshot is older than the configured threshold
-            created_date = datetime.strptime(data['created'], '%Y-%m-%d %H:%M')
-            current_date = datetime.now()
-            
-            # Get the age threshold and day type from the filter panel
-            age_threshold = self.filter_panel.get_age_threshold()
-            day_type = self.filter_panel.get_day_type()
-            
-            # Calculate days between dates based on selected type
-            if day_type == "business days":
-                days_old = self.get_business_days(created_date, current_date)
-            else:  # calendar days
-                days_old = self.get_calendar_days(created_date, current_date)
-            
-            if days_old > age_threshold:
-                # Highlight old snapshots with yellow colors
-                background_color = QColor(255, 255, 200)  # Light yellow
-                text_color = QColor(139, 69, 19)  # Saddle brown (dark brown)
-                
-                for column in range(8):
-                    item.setBackground(column, QBrush(background_color))
-                    item.setForeground(column, QBrush(text_color))
-                
-                # Add tooltip with age information
-                age_text = f"Snapshot is {days_old} {day_type} old (threshold: {age_threshold} {day_type})"
-                item.setToolTip(0, age_text)
-        
-        # Generate a unique ID for the snapshot
-        snapshot_id = f"{data['vcenter']}_{data['vm_name']}_{data['name']}"
-        
-        # Store the ID in the item's data
-        item.setData(0, Qt.ItemDataRole.UserRole, snapshot_id)
+    def add_snapshots_to_tree(self, records):
+        """
+        Add a batch of snapshots to the snapshot table.
         
-        # Store snapshot data using the ID
-        self.snapshots[snapshot_id] = data
+        Rows whose ID is already shown are refreshed in place. The model reports
+        the whole batch at once, and the counter and filter dropdowns are
+        refreshed once per batch instead of per row.
+        """
+        items = []
+        for data in records:
+            snapshot_id = self.get_snapshot_id(data)
+            self.snapshots[snapshot_id] = data
+            items.append((snapshot_id, data))
+        self.snapshot_model.upsert(items)
         
         # Update counter
         self.update_snapshot_counter()
@@ -1049,40 +2953,291 @@ class SnapshotManagerWindow(QMainWindow):
         # Update filter dropdown options
         self.filter_panel.update_dropdown_options(self.snapshots)
 
+    def add_snapshot_to_tree(self, data):
+        """Add a single snapshot to the snapshot table"""
+        self.add_snapshots_to_tree([data])
+
+    def get_snapshot_id(self, data):
+        """
+        Build the unique ID used to key a snapshot in the tree and cache.
+        
+        Snapshots are keyed by vCenter and MoRef ID, so two snapshots with the
+        same name on one VM are separate rows.
+        """
+        return make_snapshot_id(data['vcenter'], data['snapshot_moref'])
+
+    def load_cached_snapshots(self):
+        """Show the last fetched inventory from the local cache at startup"""
+        cached = self.inventory_cache.load()
+        if not cached:
+            return
+        
+        self.add_snapshots_to_tree(list(cached.values()))
+        self.status_label.setText(f"Loaded {len(cached)} cached snapshots - refresh to update")
+        self.logger.info(f"Loaded {len(cached)} snapshots from inventory cache")
+
+    def mark_snapshots_stale(self):
+        """Mark all live rows as stale until a fetch reconciles them"""
+        stale_records = []
+        for data in self.snapshots.values():
+            if data.get('stale'):
+                continue
+            stale_records.append(data.replace(stale=True))
+        if stale_records:
+            self.add_snapshots_to_tree(stale_records)
+        
+        self.delete_button.setText("Delete Selected")
+        self.delete_button.setEnabled(False)
+
+    def remove_stale_snapshots(self, vcenter):
+        """Remove rows of a vCenter that were not confirmed by its latest fetch"""
+        self.remove_snapshot_rows([
+            snapshot_id for snapshot_id, data in self.snapshots.items()
+            if data['vcenter'] == vcenter and data.get('stale')
+        ])
+        self.update_snapshot_counter()
+
+    def remove_snapshot_row(self, snapshot_id):
+        """Remove a snapshot row from the table and the snapshot data"""
+        self.remove_snapshot_rows([snapshot_id])
+
+    def remove_snapshot_rows(self, snapshot_ids):
+        """Remove several snapshot rows from the table and the snapshot data at once"""
+        for snapshot_id in snapshot_ids:
+            self.snapshots.pop(snapshot_id, None)
+        self.snapshot_model.remove_ids(snapshot_ids)
+
     def get_business_days(self, start_date, end_date):
         """Calculate number of business days between two dates"""
-        current = start_date
-        business_days = 0
-        
-        while current <= end_date:
-            # Monday = 0, Sunday = 6
-            if current.weekday() < 5:  # Monday to Friday
-                business_days += 1
-            current += timedelta(days=1)
-            
-        return business_days
+        return self.business_calendar.business_days(start_date, end_date)
     
     def get_calendar_days(self, start_date, end_date):
         """Calculate number of calendar days between two dates"""
         return (end_date - start_date).days
 
+    def get_snapshot_ages(self, created_timestamps, day_type):
+        """
+        Calculate the ages of many snapshots in one pass.
+        
+        Args:
+            created_timestamps (list): Creation times in epoch seconds, None where unknown
+            day_type (str): "business days" or "calendar days"
+            
+        Returns:
+            list: Ages in the given day type, None where the date is unknown
+        """
+        current_date = datetime.now()
+        created_dates = [None if created_ts is None else datetime.fromtimestamp(created_ts)
+                         for created_ts in created_timestamps]
+        if day_type == "business days":
+            return self.business_calendar.business_days_since(created_dates, current_date)
+        return calendar_days_since(created_dates, current_date)
+
+    def on_vcenter_fetch_progress(self, hostname, processed_vms):
+        """Update per-vCenter fetch progress"""
+        self.fetch_status[hostname] = f"{processed_vms} VMs"
+        self.update_fetch_status()
+
+    def on_vcenter_fetch_finished(self, hostname, snapshot_count):
+        """Handle a single vCenter finishing its fetch"""
+        self.fetch_status[hostname] = f"done ({snapshot_count})"
+        self.logger.info(f"Fetched {snapshot_count} snapshots from {hostname}")
+        
+        # Drop rows that no longer exist and persist the fresh inventory
+        self.remove_stale_snapshots(hostname)
+        self.inventory_cache.save_vcenter(hostname, {
+            snapshot_id: data for snapshot_id, data in self.snapshots.items()
+            if data['vcenter'] == hostname
+        })
+        self.update_fetch_status()
+
+    def on_vcenter_fetch_error(self, hostname, error_msg):
+        """Handle a single vCenter failing without aborting the others"""
+        self.fetch_status[hostname] = "failed"
+        self.fetch_errors[hostname] = error_msg
+        self.logger.error(f"Failed to fetch snapshots from {hostname}: {error_msg}")
+        self.update_fetch_status()
+
+    def update_fetch_status(self):
+        """Show the fetch state of every vCenter in the status label"""
+        status_text = ", ".join(f"{hostname}: {state}" for hostname, state in self.fetch_status.items())
+        self.status_label.setText(f"Fetching snapshots... {status_text}")
+
     def on_fetch_error(self, error_msg):
         """Handle fetch errors"""
         QMessageBox.warning(self, "Error", f"Failed to fetch snapshots: {error_msg}")
+        self.finish_operation('fetch')
+        self.fetch_button.setEnabled(True)
+
+    def on_fetch_complete(self):
+        """Handle fetch completion"""
+        self.finish_operation('fetch')
         self.fetch_button.setEnabled(True)
+        
+        # Update filter dropdown options with new data
+        self.filter_panel.update_dropdown_options(self.snapshots)
+        
+        # Report vCenters that failed while the others completed
+        if self.fetch_errors:
+            details = "\n".join(f"{hostname}: {msg}" for hostname, msg in self.fetch_errors.items())
+            QMessageBox.warning(self, "Error", f"Failed to fetch snapshots from some vCenters:\n{details}")
+        
+        if self.live_updates_checkbox.isChecked():
+            self.start_live_updates()
+        
+        if self.attribute_creators_checkbox.isChecked():
+            self.start_creator_attribution()
+
+    def on_attribute_creators_toggled(self):
+        """Save the creator attribution preference and run it on the rows already fetched"""
+        settings = QSettings()
+        settings.setValue("AttributeCreators", self.attribute_creators_checkbox.isChecked())
+        
+        if self.attribute_creators_checkbox.isChecked():
+            self.start_creator_attribution()
+
+    def start_creator_attribution(self):
+        """Credit snapshots with an unknown creator from the task history of their vCenter"""
+        if self.attribution_worker is not None and self.attribution_worker.isRunning():
+            return
+        
+        records_by_vcenter = {}
+        for snapshot_id, data in self.snapshots.items():
+            if (data.get('created_by') == 'Unknown' and data.get('created_ts') is not None
+                    and data['vcenter'] in self.vcenter_connections):
+                records_by_vcenter.setdefault(data['vcenter'], []).append(
+                    (snapshot_id, data['vm_moref'], data['created_ts'])
+                )
+        if not records_by_vcenter:
+            return
+        
+        self.attribution_worker = CreatorAttributionWorker(
+            self.vcenter_connections, records_by_vcenter, self.inventory_cache
+        )
+        self.attribution_worker.creators_found.connect(self.apply_creators)
+        self.attribution_worker.error.connect(self.logger.warning)
+        self.attribution_worker.start()
+
+    def apply_creators(self, hostname, matches):
+        """Show the creators found in a vCenter's task history"""
+        updated = {}
+        for snapshot_id, user in matches:
+            data = self.snapshots.get(snapshot_id)
+            # Skip rows that changed since the pass started
+            if data is not None and data.get('created_by') == 'Unknown':
+                updated[snapshot_id] = data.replace(created_by=user)
+        if not updated:
+            return
+        
+        self.add_snapshots_to_tree(list(updated.values()))
+        self.inventory_cache.add_snapshots(hostname, updated)
+        self.apply_filters()
+        self.logger.info(f"Attributed {len(updated)} snapshots on {hostname} from task history")
+
+    def on_live_updates_toggled(self):
+        """Start or stop live updates when the checkbox changes"""
+        settings = QSettings()
+        settings.setValue("LiveUpdatesEnabled", self.live_updates_checkbox.isChecked())
+        
+        if self.live_updates_checkbox.isChecked():
+            # Subscriptions only report changes, so they need a fetched baseline
+            if any(not data.get('stale') for data in self.snapshots.values()):
+                self.start_live_updates()
+        else:
+            self.stop_live_updates()
+
+    def on_reuse_sessions_toggled(self):
+        """Save the session reuse preference, forgetting saved sessions when it is turned off"""
+        settings = QSettings()
+        settings.setValue("ReuseSessions", self.reuse_sessions_checkbox.isChecked())
+        
+        if self.reuse_sessions_checkbox.isChecked():
+            for hostname, si in self.vcenter_connections.items():
+                self.save_session(hostname, si)
+        else:
+            for hostname, username in self.saved_servers.items():
+                self.config_manager.clear_session(hostname, username)
+
+    def save_session(self, hostname, si):
+        """Keep a saved vCenter's session ID in the keyring when session reuse is on"""
+        if not self.reuse_sessions_checkbox.isChecked() or hostname not in self.saved_servers:
+            return
+        try:
+            session_id = si._stub.GetSessionId()
+        except Exception as e:
+            self.logger.warning(f"Could not read session for {hostname}: {str(e)}")
+            return
+        if session_id:
+            self.config_manager.save_session(hostname, self.saved_servers[hostname], session_id)
+
+    def start_live_updates(self):
+        """Subscribe to snapshot changes on every connected vCenter"""
+        for hostname in self.vcenter_connections:
+            if hostname in self.live_workers:
+                continue
+            # A long-lived subscription gets its own stub instead of a pooled lease
+            worker = LiveUpdateWorker(hostname, self.vcenter_connections.open_session(hostname))
+            worker.vm_snapshots_changed.connect(self.apply_live_update)
+            worker.error.connect(self.on_live_update_error)
+            worker.finished.connect(partial(self.on_live_worker_finished, worker))
+            self.live_workers[hostname] = worker
+            worker.start()
+            self.logger.info(f"Live updates started for {hostname}")
+
+    def stop_live_updates(self, hostname=None):
+        """
+        Stop live update subscriptions.
+        
+        Workers are asked to stop without waiting for them; each is kept
+        referenced until its thread has exited, so a wait still blocked on
+        the server never leaves a running QThread to be garbage-collected.
+        
+        Args:
+            hostname (str): Only stop this vCenter's subscription (all if None)
+        """
+        hostnames = [hostname] if hostname else list(self.live_workers)
+        for name in hostnames:
+            worker = self.live_workers.pop(name, None)
+            if worker is not None:
+                self.stopping_live_workers.add(worker)
+                worker.stop()
 
-    def on_fetch_complete(self):
-        """Handle fetch completion"""
-        self.reset_progress()
-        self.fetch_button.setEnabled(True)
-        self.delete_button.setEnabled(True)
+    def on_live_worker_finished(self, worker):
+        """Release a live update worker once its thread has exited"""
+        self.stopping_live_workers.discard(worker)
+        if self.live_workers.get(worker.hostname) is worker:
+            del self.live_workers[worker.hostname]
+        worker.deleteLater()
+
+    def apply_live_update(self, hostname, vm_moref, records):
+        """Replace the rows of a single VM with its current snapshots"""
+        new_ids = {self.get_snapshot_id(data) for data in records}
         
-        # Update filter dropdown options with new data
-        self.filter_panel.update_dropdown_options(self.snapshots)
+        removed_ids = [
+            snapshot_id for snapshot_id, data in self.snapshots.items()
+            if data['vcenter'] == hostname and data.get('vm_moref') == vm_moref and snapshot_id not in new_ids
+        ]
+        self.remove_snapshot_rows(removed_ids)
+        for snapshot_id in removed_ids:
+            self.inventory_cache.remove_snapshot(hostname, snapshot_id)
+        
+        self.add_snapshots_to_tree(records)
+        for data in records:
+            self.inventory_cache.add_snapshot(hostname, self.get_snapshot_id(data), data)
+        
+        self.update_snapshot_counter()
 
-    def start_delete(self, selected_items):
-        """Start deletion process"""
-        self.fetch_button.setEnabled(False)
+    def on_live_update_error(self, hostname, error_msg):
+        """Drop a failed subscription; it restarts with the next fetch"""
+        self.logger.warning(f"Live updates stopped for {hostname}: {error_msg}")
+        worker = self.live_workers.pop(hostname, None)
+        if worker is not None:
+            self.stopping_live_workers.add(worker)  # Still exiting; released when finished
+
+    def start_delete(self, selected_items, job_id=None):
+        """Start deletion process, or resume a journaled one"""
+        # Fetches and creates keep running; only one deletion runs at a time
+        self.running_operations.add('delete')
         self.delete_button.setEnabled(False)
         
         # Show initial progress
@@ -1090,19 +3245,27 @@ class SnapshotManagerWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_label.setText("Starting snapshot deletion...")
         
-        self.delete_worker = SnapshotDeleteWorker(selected_items)
+        # In-flight limits are configurable for sites with faster or slower storage
+        settings = QSettings()
+        self.delete_worker = SnapshotDeleteWorker(
+            selected_items,
+            self.vcenter_connections,
+            max_per_vcenter=settings.value("DeleteMaxPerVCenter", DELETE_MAX_PER_VCENTER, type=int),
+            per_datastore_limit=settings.value("DeleteMaxPerDatastore", DELETE_MAX_PER_DATASTORE, type=int),
+            journal=self.job_journal,
+            job_id=job_id
+        )
         self.delete_worker.progress.connect(self.update_progress)
         self.delete_worker.error.connect(lambda msg: QMessageBox.warning(self, "Error", msg))
         self.delete_worker.item_complete.connect(self.remove_deleted_item)
         self.delete_worker.finished.connect(self.on_delete_complete)
         self.delete_worker.start()
 
-    def remove_deleted_item(self, item):
-        """Remove a successfully deleted item from the tree"""
-        snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
+    def remove_deleted_item(self, snapshot_id):
+        """Remove a successfully deleted snapshot from the table"""
         if snapshot_id in self.snapshots:
-            del self.snapshots[snapshot_id]
-        self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+            self.inventory_cache.remove_snapshot(self.snapshots[snapshot_id]['vcenter'], snapshot_id)
+        self.remove_snapshot_row(snapshot_id)
         self.update_snapshot_counter()
         
         # Reset delete button text after deletion
@@ -1110,91 +3273,84 @@ class SnapshotManagerWindow(QMainWindow):
 
     def on_delete_complete(self):
         """Handle deletion completion"""
-        self.reset_progress()
-        self.fetch_button.setEnabled(True)
-        self.delete_button.setEnabled(True)
+        self.finish_operation('delete')
+        self.delete_button.setEnabled(bool(self.snapshot_model.checked_ids()))
+        self.resume_jobs()
 
-    def check_connections(self):
-        """Check all connections and reconnect if needed"""
-        reconnect_needed = []
+    def resume_jobs(self):
+        """
+        Finish a delete or create job left unfinished by a previous run.
         
-        for hostname, si in list(self.vcenter_connections.items()):
-            try:
-                # Test connection by making a simple API call
-                si.CurrentTime()
-            except Exception as e:
-                self.logger.warning(f"Connection to {hostname} lost: {str(e)}")
-                
-                # Add to reconnection list if we have credentials
-                if hostname in self.active_credentials:
-                    reconnect_needed.append(hostname)
-                else:
-                    # No credentials available, remove the connection
-                    self.vcenter_connections.pop(hostname, None)
+        Tasks that were running are reattached by MoRef and queued items are
+        started, without fetching the inventory. Jobs run one at a time; the
+        next one resumes when this one completes. Each job is resumed at most
+        once per session, and only once all of its vCenters are connected.
+        
+        Returns:
+            bool: True if a job was resumed
+        """
+        if self.running_operations & {'delete', 'create'}:
+            return False  # A job is already running
         
-        # If reconnections needed, show status without progress
-        if reconnect_needed:
-            total = len(reconnect_needed)
-            completed = 0
+        for job in self.job_journal.unfinished():
+            vcenters = {item['vcenter'] for item in job['items'].values()}
+            if job['job'] in self.resumed_jobs or not vcenters <= set(self.vcenter_connections):
+                continue
             
-            for hostname in reconnect_needed:
-                completed += 1
-                self.status_label.setText(f"Reconnecting to {hostname}... ({completed}/{total})")
-                
-                try:
-                    creds = self.active_credentials[hostname]
-                    context = ssl.create_default_context()
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    
-                    new_si = SmartConnect(
-                        host=hostname,
-                        user=creds['username'],
-                        pwd=creds['password'],
-                        sslContext=context,
-                        disableSslCertValidation=True
-                    )
-                    
-                    if new_si:
-                        self.vcenter_connections[hostname] = new_si
-                        self.logger.info(f"Successfully reconnected to {hostname}")
-                    else:
-                        self.logger.error(f"Failed to reconnect to {hostname}")
-                        # Remove failed connection
-                        self.vcenter_connections.pop(hostname, None)
-                        self.active_credentials.pop(hostname, None)
-                        
-                except Exception as reconnect_error:
-                    self.logger.error(f"Failed to reconnect to {hostname}: {str(reconnect_error)}")
-                    # Remove failed connection
-                    self.vcenter_connections.pop(hostname, None)
-                    self.active_credentials.pop(hostname, None)
+            self.resumed_jobs.add(job['job'])
+            self.job_journal.resume_job(job)
+            self.logger.info(f"Resuming {job['kind']} job {job['job']} ({len(job['items'])} items)")
             
-            # Reset status when done
-            self.status_label.setText("Ready")
-        
-        # Update UI based on current connections
+            if job['kind'] == 'delete':
+                self.start_delete(list(job['items'].items()), job_id=job['job'])
+            else:
+                self.start_create_snapshots([item['server'] for item in job['items'].values()],
+                                            job.get('description', ''),
+                                            job.get('memory', False), job=job)
+            return True
+        return False
+
+    def on_reconnected(self, hostname, si):
+        """Swap in a connection the health monitor re-established"""
+        if hostname not in self.vcenter_connections:
+            return  # Cleared while reconnecting
+        self.vcenter_connections[hostname] = si
+        self.vm_name_index.invalidate(hostname)
+        self.save_session(hostname, si)
+        
+        # Resubscribe on the new session
+        if hostname in self.live_workers:
+            self.stop_live_updates(hostname)
+            self.start_live_updates()
+        self.refresh_connection_label()
+        self.resume_jobs()
+
+    def on_connection_lost(self, hostname):
+        """Drop a connection that can't be re-established"""
+        self.vcenter_connections.pop(hostname, None)
+        self.active_credentials.pop(hostname, None)
         self.update_connection_status()
 
     def show_context_menu(self, position):
-        """Show context menu for tree widget"""
-        item = self.tree.itemAt(position)
-        if not item:
+        """Show context menu for the snapshot table"""
+        index = self.tree.indexAt(position)
+        if not index.isValid():
             return
             
         menu = QMenu(self)
         
         # Get the column that was clicked
-        column = self.tree.header().logicalIndexAt(position.x())
-        cell_text = item.text(column)
+        column = index.column()
+        cell_text = index.data() or ""
         
         # Create actions for copying
-        copy_action = menu.addAction(f"Copy '{self.tree.headerItem().text(column)}'")
+        header_text = self.snapshot_proxy.headerData(column, Qt.Orientation.Horizontal)
+        copy_action = menu.addAction(f"Copy '{header_text}'")
         copy_action.triggered.connect(lambda: self.copy_to_clipboard(cell_text))
         
         # Add action to copy VM name regardless of which column was clicked
         if column != 1:  # If not already on VM Name column
-            vm_name = item.text(1)
+            vm_name = index.sibling(index.row(), 1).data()
             copy_vm_action = menu.addAction("Copy VM Name")
             copy_vm_action.triggered.connect(lambda: self.copy_to_clipboard(vm_name))
         
@@ -1229,10 +3385,10 @@ class SnapshotManagerWindow(QMainWindow):
         # Fallback to system username if no vCenter credentials available
         return getpass.getuser()
 
-    def on_item_double_clicked(self, item, column):
+    def on_item_double_clicked(self, index):
         """Handle double-click to copy cell content"""
-        if column != 0:  # Don't handle checkbox column
-            text = item.text(column)
+        if index.column() != 0:  # Don't handle checkbox column
+            text = index.data() or ""
             QApplication.clipboard().setText(text)
             self.status_label.setText(f"Copied to clipboard: {text}")
             
@@ -1262,20 +3418,24 @@ class SnapshotManagerWindow(QMainWindow):
             
             self.start_create_snapshots(data['servers'], data['description'], data['memory'])
 
-    def start_create_snapshots(self, servers, description, memory=False):
-        """Start snapshot creation process"""
-        self.fetch_button.setEnabled(False)
-        self.delete_button.setEnabled(False)
+    def start_create_snapshots(self, servers, description, memory=False, job=None):
+        """Start snapshot creation process, or resume a journaled one"""
+        # Fetches and deletions keep running; only one creation job runs at a time
+        self.running_operations.add('create')
+        self.create_button.setEnabled(False)
         
         # Get the vCenter username for creator tracking
-        vcenter_username = self.get_current_vcenter_username()
+        vcenter_username = job['username'] if job else self.get_current_vcenter_username()
         
         self.create_worker = SnapshotCreateWorker(
             self.vcenter_connections, 
             servers, 
             description,
             memory,
-            vcenter_username
+            vcenter_username,
+            vm_index=self.vm_name_index,
+            journal=self.job_journal,
+            job=job
         )
         self.create_worker.progress.connect(
             lambda completed, total, msg: self.update_progress(completed, total, msg)
@@ -1295,8 +3455,11 @@ class SnapshotManagerWindow(QMainWindow):
             snapshot_data (dict): Dictionary containing snapshot details
         """
         # If we received a dict with full snapshot details, add it to the tree
-        if isinstance(snapshot_data, dict) and 'vm_name' in snapshot_data and 'snapshot' in snapshot_data:
+        if isinstance(snapshot_data, SnapshotRecord):
             self.add_snapshot_to_tree(snapshot_data)
+            self.inventory_cache.add_snapshot(
+                snapshot_data['vcenter'], self.get_snapshot_id(snapshot_data), snapshot_data
+            )
             self.logger.info(f"Added new snapshot for {snapshot_data['vm_name']} to tree")
         # For backward compatibility with older versions
         elif isinstance(snapshot_data, dict) and 'vm_name' in snapshot_data:
@@ -1312,15 +3475,25 @@ class SnapshotManagerWindow(QMainWindow):
         as the snapshots have already been added to the tree via the 
         handle_created_snapshot method, implementing an efficient caching strategy.
         """
-        self.reset_progress()
-        self.fetch_button.setEnabled(True)
-        self.delete_button.setEnabled(True)
+        self.finish_operation('create')
+        self.create_button.setEnabled(True)
         # No need to call start_fetch() as we've already added the snapshots to the tree
+        self.resume_jobs()
 
     def closeEvent(self, event):
         """Save window position when closing"""
         settings = QSettings()
         settings.setValue("WindowGeometry", self.saveGeometry())
+        self.stop_live_updates()
+        for worker in list(self.stopping_live_workers):
+            worker.wait()  # stop() cancelled the pending WaitForUpdatesEx
+        self.health_monitor.stop()
+        self.health_monitor.wait()
+        if self.filter_worker is not None:
+            self.filter_worker.wait()
+        if self.attribution_worker is not None:
+            self.attribution_worker.stop()
+            self.attribution_worker.wait()
         super().closeEvent(event)
 
     def update_progress(self, value, total, operation):
@@ -1346,6 +3519,18 @@ class SnapshotManagerWindow(QMainWindow):
             self.progress_bar.hide()
             self.status_label.setText(operation)
 
+    def finish_operation(self, operation):
+        """
+        Mark an operation finished, resetting the shared progress display once
+        no other operation is still running.
+        
+        Args:
+            operation (str): 'fetch', 'delete' or 'create'
+        """
+        self.running_operations.discard(operation)
+        if not self.running_operations:
+            self.reset_progress()
+
     def reset_progress(self):
         """
         Reset progress bar and status label to default state.
@@ -1382,7 +3567,8 @@ class SnapshotManagerWindow(QMainWindow):
             self.status_label.setText("Ready")
             return
             
-        self.auto_connect_worker = AutoConnectWorker(self.saved_servers, self.config_manager)
+        self.auto_connect_worker = AutoConnectWorker(self.saved_servers, self.config_manager,
+                                                     reuse_sessions=self.reuse_sessions_checkbox.isChecked())
         self.auto_connect_worker.progress.connect(self.update_auto_connect_status)
         self.auto_connect_worker.connection_made.connect(self.handle_auto_connection)
         self.auto_connect_worker.finished.connect(self.on_auto_connect_finished)
@@ -1397,6 +3583,7 @@ class SnapshotManagerWindow(QMainWindow):
         """Handle successful auto-connection"""
         self.vcenter_connections[hostname] = si
         self.active_credentials[hostname] = credentials
+        self.health_monitor.track(hostname, si, credentials)
         self.logger.info(f"Auto-connected to {hostname}")
     
     def on_auto_connect_finished(self):
@@ -1405,6 +3592,14 @@ class SnapshotManagerWindow(QMainWindow):
         # Re-enable auto-connect button
         self.auto_conn_btn.setEnabled(True)
         self.auto_conn_btn.setText("Auto-Connect")
+        
+        # Finish interrupted jobs; the fetch below runs alongside them
+        self.resume_jobs()
+        
+        # Reconcile cached rows in the background once connections are up
+        has_stale = any(data.get('stale') for data in self.snapshots.values())
+        if has_stale and self.vcenter_connections and 'fetch' not in self.running_operations:
+            self.start_fetch()
     
     def on_auto_connect_error(self, error_msg):
         """Handle auto-connect errors"""
@@ -1418,101 +3613,77 @@ class SnapshotManagerWindow(QMainWindow):
     
     def apply_filters(self):
         """
-        Apply current filters to the snapshot tree.
+        Apply current filters to the snapshot table.
         This method is called whenever any filter changes.
         """
-        # Check if tree exists (it might not during initialization)
-        if not hasattr(self, 'tree') or self.tree is None:
+        # Check if the table exists (it might not during initialization)
+        if not hasattr(self, 'snapshot_proxy'):
             return
-            
-        root = self.tree.invisibleRootItem()
-        visible_count = 0
-        age_threshold = self.filter_panel.get_age_threshold()
-        patching_only = self.patch_filter_checkbox.isChecked()
-        
-        for i in range(root.childCount()):
-            item = root.child(i)
-            snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
-            
-            if snapshot_id in self.snapshots:
-                snapshot_data = self.snapshots[snapshot_id]
-                
-                # Check if item matches filter panel filters
-                should_show = self.filter_panel.matches_filters(snapshot_data)
-                
-                # Apply patching filter if enabled
-                if should_show and patching_only:
-                    snapshot_name = snapshot_data.get('name', '').lower()
-                    should_show = 'patch' in snapshot_name
-                
-                item.setHidden(not should_show)
-                if should_show:
-                    visible_count += 1
-                
-                # Re-apply age-based highlighting when threshold changes
-                self.update_age_highlighting(item, snapshot_data, age_threshold)
+        
+        # Re-apply age-based highlighting when threshold or day type changes, or a new day has begun
+        self.snapshot_model.set_age_policy(
+            self.filter_panel.get_age_threshold(), self.filter_panel.get_day_type(), self.get_snapshot_ages
+        )
+        
+        # Rows added from now on are filtered with the new filter as they arrive;
+        # existing rows are re-evaluated in the background
+        self.snapshot_filter = self.filter_panel.compile_filters(self.patch_filter_checkbox.isChecked())
+        self.start_filter_worker()
+    
+    def start_filter_worker(self):
+        """Evaluate the current filter for all rows on a worker thread"""
+        if self.filter_worker is not None and self.filter_worker.isRunning():
+            # Re-run once the current pass is done; its result is already outdated
+            self.filter_rerun_needed = True
+            return
+        
+        self.filter_rerun_needed = False
+        self.filter_worker = SnapshotFilterWorker(
+            self.snapshot_filter, self.snapshot_model.filter_keys(), self.snapshot_model.layout_revision
+        )
+        self.filter_worker.filtered.connect(self.on_filter_result)
+        self.filter_worker.start()
+    
+    def on_filter_result(self, visible):
+        """Apply a finished filter pass, or start another if it is outdated"""
+        worker = self.filter_worker
+        worker.wait()
+        
+        if (self.filter_rerun_needed or worker.snapshot_filter is not self.snapshot_filter
+                or worker.layout_revision != self.snapshot_model.layout_revision):
+            self.start_filter_worker()
+            return
+        
+        # Rows added or refreshed meanwhile were already filtered as they arrived
+        for row in self.snapshot_model.changed_rows(worker.filter_keys):
+            visible[row] = self.snapshot_accepts(row)
+        self.snapshot_proxy.apply_visibility(visible)
         
         # Update counter to show filtered results
-        total_count = self.tree.topLevelItemCount()
-        if visible_count == total_count:
-            self.counter_label.setText(f"Snapshots: {total_count}")
-        else:
-            self.counter_label.setText(f"Snapshots: {visible_count} of {total_count} shown")
+        self.update_snapshot_counter()
     
-    def update_age_highlighting(self, item, snapshot_data, age_threshold):
+    def snapshot_accepts(self, row):
         """
-        Update age-based highlighting for a tree item.
+        Check if a snapshot table row passes the current filters.
         
         Args:
-            item: QTreeWidgetItem to update
-            snapshot_data: Dictionary containing snapshot information
-            age_threshold: Age threshold in business days
-        """
-        try:
-            created_date = datetime.strptime(snapshot_data['created'], '%Y-%m-%d %H:%M')
-            current_date = datetime.now()
-            
-            # Get day type from filter panel  
-            day_type = self.filter_panel.get_day_type()
-            
-            # Calculate days based on selected type
-            if day_type == "business days":
-                days_old = self.get_business_days(created_date, current_date)
-            else:  # calendar days
-                days_old = self.get_calendar_days(created_date, current_date)
+            row (int): Row in the snapshot model
             
-            # Check if snapshot is part of a chain (already has different highlighting)
-            is_in_chain = snapshot_data.get('has_children', False) or snapshot_data.get('is_child', False)
-            
-            if days_old > age_threshold and not is_in_chain:
-                # Apply age highlighting
-                background_color = QColor(255, 255, 200)  # Light yellow
-                text_color = QColor(139, 69, 19)  # Saddle brown
-                
-                for column in range(8):
-                    item.setBackground(column, QBrush(background_color))
-                    item.setForeground(column, QBrush(text_color))
-                
-                age_text = f"Snapshot is {days_old} {day_type} old (threshold: {age_threshold} {day_type})"
-                item.setToolTip(0, age_text)
-            elif not is_in_chain:
-                # Remove age highlighting (but preserve chain highlighting if applicable)
-                for column in range(8):
-                    item.setBackground(column, QBrush())  # Clear background
-                    item.setForeground(column, QBrush())  # Clear foreground
-                
-                # Clear age-related tooltip
-                item.setToolTip(0, "")
-                
-        except (ValueError, KeyError):
-            # If date parsing fails, don't apply highlighting
-            pass
+        Returns:
+            bool: True if the row should be shown
+        """
+        return self.snapshot_filter.matches_key(self.snapshot_model.filter_key(row))
     
     def update_snapshot_counter(self):
         """
         Update the snapshot counter label.
         """
-        self.counter_label.setText(f"Snapshots: {self.tree.topLevelItemCount()}")
+        total_count = self.snapshot_model.rowCount()
+        visible_count = self.snapshot_proxy.rowCount()
+        if visible_count == total_count:
+            self.counter_label.setText(f"Snapshots: {total_count}")
+        else:
+            self.counter_label.setText(f"Snapshots: {visible_count} of {total_count} shown")
     
     def clear_filters_on_refresh(self):
         """
@@ -1593,57 +3764,620 @@ class SnapshotManagerWindow(QMainWindow):
             "<p><i>Tip: Independent snapshots (not grayed out) can be safely deleted using pySnap.</i></p>"
         )
 
-class ConfigManager:
-    def __init__(self):
-        self.config_file = os.path.join(os.path.expanduser("~"), ".vmware_snapshot_viewer.json")
-        self.keyring_service = "vmware_snapshot_manager"
-    
-    def save_servers(self, servers):
-        """Save server configurations (without passwords)"""
+class ConfigManager:
+    def __init__(self):
+        self.config_file = os.path.join(os.path.expanduser("~"), ".vmware_snapshot_viewer.json")
+        self.keyring_service = "vmware_snapshot_manager"
+    
+    def save_servers(self, servers):
+        """Save server configurations (without passwords)"""
+        try:
+            config = {
+                'servers': [{
+                    'hostname': server,
+                    'username': username
+                } for server, username in servers.items()]
+            }
+            with open(self.config_file, 'w') as f:
+                json.dump(config, f, indent=4)
+        except Exception as e:
+            print(f"Failed to save config: {e}")
+    
+    def save_password(self, hostname, username, password):
+        """Save password securely in system keyring"""
+        try:
+            key = f"{hostname}:{username}"
+            keyring.set_password(self.keyring_service, key, password)
+            return True
+        except Exception as e:
+            print(f"Failed to save password: {e}")
+            return False
+    
+    def get_password(self, hostname, username):
+        """Get password from system keyring"""
+        try:
+            key = f"{hostname}:{username}"
+            return keyring.get_password(self.keyring_service, key)
+        except Exception as e:
+            print(f"Failed to get password: {e}")
+            return None
+
+    def save_session(self, hostname, username, session_id):
+        """Save a vCenter session ID in the system keyring so it can be resumed"""
+        try:
+            keyring.set_password(self.keyring_service, f"{hostname}:{username}:session", session_id)
+            return True
+        except Exception as e:
+            print(f"Failed to save session: {e}")
+            return False
+
+    def get_session(self, hostname, username):
+        """Get a saved vCenter session ID from the system keyring"""
+        try:
+            return keyring.get_password(self.keyring_service, f"{hostname}:{username}:session")
+        except Exception as e:
+            print(f"Failed to get session: {e}")
+            return None
+
+    def clear_session(self, hostname, username):
+        """Forget a saved vCenter session ID"""
+        try:
+            if keyring.get_password(self.keyring_service, f"{hostname}:{username}:session") is not None:
+                keyring.delete_password(self.keyring_service, f"{hostname}:{username}:session")
+        except Exception as e:
+            print(f"Failed to clear session: {e}")
+
+    def load_servers(self):
+        """Load saved server configurations"""
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    config = json.load(f)
+                    return {
+                        server['hostname']: server['username']
+                        for server in config.get('servers', [])
+                    }
+        except Exception as e:
+            print(f"Failed to load config: {e}")
+        return {}
+
+# Creator attribution from vCenter task events
+CREATE_SNAPSHOT_TASK = 'VirtualMachine.createSnapshot'
+EVENT_PAGE_SIZE = 1000  # Events per ReadNextEvents call (the server maximum)
+EVENT_WINDOW = 86400  # Seconds of history read per event collector
+ATTRIBUTION_WINDOW = 900  # Longest expected gap between a task being queued and the snapshot's createTime
+ATTRIBUTION_SKEW = 5  # Clock slack between event and snapshot timestamps
+ATTRIBUTION_MAX_AGE = 90 * 86400  # vCenter purges older events, so history isn't read further back
+
+def read_snapshot_task_events(si, begin, end, page_size=EVENT_PAGE_SIZE):
+    """
+    Read the snapshot creation tasks started in a time window.
+    
+    One EventHistoryCollector covers the window and is read oldest first in
+    large ReadNextEvents pages, without full messages. Only TaskEvents are
+    collected; create-snapshot tasks are picked out here because events can't
+    be filtered by task type on the server.
+    
+    Args:
+        si: Connected ServiceInstance
+        begin (float): Window start as a Unix timestamp
+        end (float): Window end as a Unix timestamp
+        page_size (int): Events per ReadNextEvents call
+        
+    Returns:
+        list: (VM MoRef ID, event time, user) tuples
+    """
+    content = si.RetrieveContent()
+    spec = vim.event.EventFilterSpec(
+        eventTypeId=['TaskEvent'],
+        disableFullMessage=True,
+        time=vim.event.EventFilterSpec.ByTime(
+            beginTime=datetime.fromtimestamp(begin, timezone.utc),
+            endTime=datetime.fromtimestamp(end, timezone.utc)
+        ),
+        entity=vim.event.EventFilterSpec.ByEntity(entity=content.rootFolder, recursion='all')
+    )
+    collector = content.eventManager.CreateCollectorForEvents(spec)
+    events = []
+    try:
+        collector.RewindCollector()
+        while True:
+            page = collector.ReadNextEvents(maxCount=page_size)
+            if not page:
+                break
+            for event in page:
+                info = getattr(event, 'info', None)
+                if info is None or info.descriptionId != CREATE_SNAPSHOT_TASK or event.vm is None:
+                    continue
+                user = event.userName or getattr(info.reason, 'userName', None)
+                if user:
+                    events.append((event.vm.vm._moId, vmware_timestamp(event.createdTime), user))
+    finally:
+        try:
+            collector.DestroyCollector()
+        except Exception:
+            pass
+    return events
+
+def match_creators(records, events):
+    """
+    Join snapshots to the create-snapshot task that made them.
+    
+    A snapshot is credited to the latest task on its VM queued at most
+    ATTRIBUTION_WINDOW seconds before its createTime.
+    
+    Args:
+        records (list): (snapshot ID, VM MoRef ID, createTime timestamp) tuples
+        events (list): (VM MoRef ID, event time, user) tuples
+        
+    Returns:
+        list: (snapshot ID, user) tuples for the snapshots that matched
+    """
+    by_vm = {}
+    for vm_moref, event_time, user in sorted(events, key=lambda event: event[1]):
+        times, users = by_vm.setdefault(vm_moref, ([], []))
+        times.append(event_time)
+        users.append(user)
+    
+    matches = []
+    for snapshot_id, vm_moref, created_ts in records:
+        times, users = by_vm.get(vm_moref, ((), ()))
+        index = bisect.bisect_right(times, created_ts + ATTRIBUTION_SKEW) - 1
+        if index >= 0 and created_ts - times[index] <= ATTRIBUTION_WINDOW:
+            matches.append((snapshot_id, users[index]))
+    return matches
+
+class CreatorAttributionWorker(QThread):
+    """
+    Worker thread that credits "Unknown" snapshots to the user whose
+    create-snapshot task made them.
+    
+    Task events are read in bulk per vCenter and cached in the inventory
+    database along with the span of history already read, so later passes
+    only read events newer than the last one (or older than any read yet).
+    """
+    creators_found = pyqtSignal(str, list)  # hostname, [(snapshot ID, user)]
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, sessions, records_by_vcenter, cache):
+        """
+        Args:
+            sessions: SessionRegistry of connected vCenters
+            records_by_vcenter (dict): hostname -> [(snapshot ID, VM MoRef ID, createTime timestamp)]
+            cache (InventoryCache): Where events and scanned spans are kept
+        """
+        super().__init__()
+        self.sessions = sessions
+        self.records_by_vcenter = records_by_vcenter
+        self.cache = cache
+        self._stop_requested = False
+
+    def stop(self):
+        """Ask the worker to stop after the event window being read; read windows stay cached"""
+        self._stop_requested = True
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=max(1, len(self.records_by_vcenter))) as executor:
+            futures = {
+                executor.submit(self.attribute_vcenter, hostname, records): hostname
+                for hostname, records in self.records_by_vcenter.items()
+            }
+            for future in as_completed(futures):
+                hostname = futures[future]
+                try:
+                    matches = future.result()
+                    if matches and not self._stop_requested:
+                        self.creators_found.emit(hostname, matches)
+                except Exception as e:
+                    self.error.emit(f"Creator attribution failed on {hostname}: {str(e)}")
+        self.finished.emit()
+
+    def attribute_vcenter(self, hostname, records):
+        """
+        Read the event history a vCenter's snapshots need and match them.
+        
+        Runs on a pool thread with a connection leased for it.
+        
+        Returns:
+            list: (snapshot ID, user) tuples
+        """
+        with self.sessions.lease(hostname) as si:
+            now = vmware_timestamp(si.CurrentTime())
+            keep_from = now - ATTRIBUTION_MAX_AGE
+            needed_from = max(min(created_ts for _, _, created_ts in records) - ATTRIBUTION_WINDOW, keep_from)
+            
+            scanned = self.cache.creator_scan_range(hostname)
+            if scanned is None:
+                self.read_events(si, hostname, needed_from, now, backward=False, keep_from=keep_from)
+            else:
+                # Older history first, walking back from the scanned span, then anything new
+                scanned_from, scanned_until = scanned
+                if needed_from < scanned_from:
+                    self.read_events(si, hostname, needed_from, scanned_from, backward=True, keep_from=keep_from)
+                self.read_events(si, hostname, scanned_until, now, backward=False, keep_from=keep_from)
+        
+        return match_creators(records, self.cache.load_creator_events(hostname))
+
+    def read_events(self, si, hostname, begin, end, backward, keep_from=None):
+        """
+        Read a span of event history one EVENT_WINDOW at a time.
+        
+        Every window is cached as soon as it is read, and windows are walked
+        away from the span already scanned, so an interrupted pass (or stop())
+        never leaves a gap behind. Cached events before keep_from are pruned.
+        """
+        windows = []
+        start = begin
+        while start < end:
+            windows.append((start, min(start + EVENT_WINDOW, end)))
+            start += EVENT_WINDOW
+        if backward:
+            windows.reverse()
+        
+        for window_begin, window_end in windows:
+            if self._stop_requested:
+                return
+            events = read_snapshot_task_events(si, window_begin, window_end)
+            self.cache.save_creator_events(hostname, events, window_begin, window_end, keep_from)
+
+class InventoryCache:
+    """
+    Single-file SQLite cache of the last fetched snapshot records per vCenter.
+    
+    Only primitive display fields are stored, so cached rows can be shown at
+    startup before any vCenter connection exists.
+    """
+    FIELDS = ('vm_name', 'vm_moref', 'name', 'snapshot_moref', 'created',
+              'created_by', 'description', 'has_children', 'is_child', 'created_ts')
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or os.path.join(os.path.expanduser("~"), ".pysnap_inventory.db")
+        self.logger = logging.getLogger('pySnap')
+        self._initialized = False
+
+    def _connect(self):
+        """Open the database, creating the schema on first use"""
+        conn = sqlite3.connect(self.db_file)
+        if not self._initialized:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS snapshots ("
+                    "vcenter TEXT NOT NULL, snapshot_id TEXT NOT NULL, "
+                    "vm_name TEXT, vm_moref TEXT, name TEXT, snapshot_moref TEXT, "
+                    "created TEXT, created_by TEXT, description TEXT, "
+                    "has_children INTEGER, is_child INTEGER, created_ts INTEGER, "
+                    "PRIMARY KEY (vcenter, snapshot_id))"
+                )
+                # Caches written before creation times were stored as epochs
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(snapshots)")}
+                if 'created_ts' not in columns:
+                    conn.execute("ALTER TABLE snapshots ADD COLUMN created_ts INTEGER")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS fetches ("
+                    "vcenter TEXT PRIMARY KEY, fetched_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS creator_events ("
+                    "vcenter TEXT NOT NULL, vm_moref TEXT NOT NULL, event_time REAL NOT NULL, "
+                    "user TEXT, PRIMARY KEY (vcenter, vm_moref, event_time))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS creator_scans ("
+                    "vcenter TEXT PRIMARY KEY, scanned_from REAL NOT NULL, scanned_until REAL NOT NULL)"
+                )
+            self._initialized = True
+        return conn
+
+    def _row(self, vcenter, snapshot_id, data):
+        return (vcenter, snapshot_id) + tuple(
+            int(bool(data.get(field))) if field in ('has_children', 'is_child')
+            else created_timestamp(data) if field == 'created_ts'
+            else data.get(field, '')
+            for field in self.FIELDS
+        )
+
+    def save_vcenter(self, vcenter, snapshots, fetched_at=None):
+        """
+        Replace all cached records of a vCenter with a fresh fetch result.
+        
+        Args:
+            vcenter (str): vCenter hostname
+            snapshots (dict): Snapshot records keyed by snapshot ID
+            fetched_at (float): Fetch time as a Unix timestamp (defaults to now)
+        """
+        placeholders = ", ".join("?" * (len(self.FIELDS) + 2))
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM snapshots WHERE vcenter = ?", (vcenter,))
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO snapshots VALUES ({placeholders})",
+                    [self._row(vcenter, snapshot_id, data) for snapshot_id, data in snapshots.items()]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO fetches VALUES (?, ?)",
+                    (vcenter, fetched_at or time.time())
+                )
+            conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save inventory cache for {vcenter}: {e}")
+
+    def add_snapshot(self, vcenter, snapshot_id, data):
+        """Add or update a single cached record"""
+        self.add_snapshots(vcenter, {snapshot_id: data})
+
+    def add_snapshots(self, vcenter, snapshots):
+        """Add or update several cached records of one vCenter in one transaction"""
+        placeholders = ", ".join("?" * (len(self.FIELDS) + 2))
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO snapshots VALUES ({placeholders})",
+                    [self._row(vcenter, snapshot_id, data) for snapshot_id, data in snapshots.items()]
+                )
+            conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to update inventory cache: {e}")
+
+    def creator_scan_range(self, vcenter):
+        """
+        Get the span of event history already read for creator attribution.
+        
+        Returns:
+            tuple: (scanned_from, scanned_until) Unix timestamps, or None
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT scanned_from, scanned_until FROM creator_scans WHERE vcenter = ?", (vcenter,)
+            ).fetchone()
+            conn.close()
+            return row
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to read creator scan range for {vcenter}: {e}")
+            return None
+
+    def save_creator_events(self, vcenter, events, begin, end, keep_from=None):
+        """
+        Store snapshot creation events read for one time window and widen the
+        scanned span to cover it. Windows must touch the span already scanned.
+        
+        Events older than ATTRIBUTION_MAX_AGE are never matched again, so
+        events before keep_from are pruned and the scanned span is trimmed
+        to match.
+        
+        Args:
+            vcenter (str): vCenter hostname
+            events (list): (VM MoRef ID, event time, user) tuples
+            begin (float): Window start as a Unix timestamp
+            end (float): Window end as a Unix timestamp
+            keep_from (float): Oldest event time worth keeping (no pruning if None)
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO creator_events VALUES (?, ?, ?, ?)",
+                    [(vcenter,) + tuple(event) for event in events]
+                )
+                conn.execute(
+                    "INSERT INTO creator_scans VALUES (?, ?, ?) ON CONFLICT(vcenter) DO UPDATE SET "
+                    "scanned_from = MIN(scanned_from, excluded.scanned_from), "
+                    "scanned_until = MAX(scanned_until, excluded.scanned_until)",
+                    (vcenter, begin, end)
+                )
+                if keep_from is not None:
+                    conn.execute("DELETE FROM creator_events WHERE vcenter = ? AND event_time < ?",
+                                 (vcenter, keep_from))
+                    conn.execute(
+                        "UPDATE creator_scans SET scanned_from = MAX(scanned_from, ?) WHERE vcenter = ?",
+                        (keep_from, vcenter)
+                    )
+            conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save creator events for {vcenter}: {e}")
+
+    def load_creator_events(self, vcenter):
+        """
+        Load the cached snapshot creation events of a vCenter.
+        
+        Returns:
+            list: (VM MoRef ID, event time, user) tuples
+        """
+        try:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT vm_moref, event_time, user FROM creator_events WHERE vcenter = ?", (vcenter,)
+            ).fetchall()
+            conn.close()
+            return rows
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to load creator events for {vcenter}: {e}")
+            return []
+
+    def remove_snapshot(self, vcenter, snapshot_id):
+        """Remove a single cached record"""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM snapshots WHERE vcenter = ? AND snapshot_id = ?",
+                    (vcenter, snapshot_id)
+                )
+            conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to update inventory cache: {e}")
+
+    def load(self):
+        """
+        Load all cached records.
+        
+        Returns:
+            dict: SnapshotRecords keyed by snapshot ID. Each record is marked
+                  stale and carries the 'fetched_at' timestamp of its vCenter.
+        """
+        records = {}
         try:
-            config = {
-                'servers': [{
-                    'hostname': server,
-                    'username': username
-                } for server, username in servers.items()]
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT s.snapshot_id, s.vcenter, " + ", ".join(f"s.{f}" for f in self.FIELDS) +
+                ", f.fetched_at FROM snapshots s LEFT JOIN fetches f ON s.vcenter = f.vcenter"
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to load inventory cache: {e}")
+            return records
+        
+        for row in rows:
+            data = dict(zip(self.FIELDS, row[2:-1]))
+            data['has_children'] = bool(data['has_children'])
+            data['is_child'] = bool(data['is_child'])
+            # Records format 'created' from created_ts; older rows only have the text
+            created = data.pop('created')
+            if data['created_ts'] is None:
+                data['created_ts'] = created_timestamp({'created': created})
+            records[row[0]] = SnapshotRecord(vcenter=row[1], fetched_at=row[-1], stale=True, **data)
+        return records
+
+class JobJournal:
+    """
+    Append-only JSON-lines journal of delete and create jobs.
     
-    def save_password(self, hostname, username, password):
-        """Save password securely in system keyring"""
+    Each job item is written when it is queued, when its task is submitted
+    (with the task MoRef) and when the task finishes. After a crash the
+    unfinished jobs can be replayed: running tasks are reattached by MoRef and
+    queued items are started, without fetching the inventory again.
+    """
+    FINAL_STATES = ('success', 'error')
+
+    def __init__(self, journal_file=None):
+        self.journal_file = journal_file or os.path.join(os.path.expanduser("~"), ".pysnap_jobs.jsonl")
+        self.logger = logging.getLogger('pySnap')
+        self.lock = threading.Lock()  # Workers write from several pool threads
+        self.open_items = {}  # job ID -> item keys not yet in a final state
+
+    def _append(self, entries):
+        """Write entries and flush them to disk before returning"""
         try:
-            key = f"{hostname}:{username}"
-            keyring.set_password(self.keyring_service, key, password)
-            return True
-        except Exception as e:
-            print(f"Failed to save password: {e}")
+            with self.lock, open(self.journal_file, 'a', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            self.logger.warning(f"Failed to write job journal: {e}")
+
+    def start_job(self, kind, items, **details):
+        """
+        Record a new job and all of its queued items.
+        
+        Args:
+            kind (str): 'delete' or 'create'
+            items (list): (item key, dict) tuples; each dict holds at least
+                vcenter, vm_moref and snapshot_moref (None for creates)
+            **details: Job-wide values needed to resume it, e.g. the description
+            
+        Returns:
+            str: Job ID
+        """
+        job_id = f"{kind}-{time.time_ns()}"
+        self.open_items[job_id] = {key for key, _ in items}
+        entries = [{'job': job_id, 'event': 'start', 'kind': kind, 'time': time.time(), **details}]
+        entries.extend(
+            {'job': job_id, 'event': 'item', 'key': key, 'state': 'queued', 'task_moref': None, **fields}
+            for key, fields in items
+        )
+        self._append(entries)
+        return job_id
+
+    def update(self, job_id, key, state, **fields):
+        """
+        Record a state change of one item.
+        
+        Args:
+            job_id (str): Job the item belongs to
+            key (str): Item key given to start_job
+            state (str): 'running', 'success' or 'error'
+            **fields: Values learned with this change, e.g. task_moref
+        """
+        if state in self.FINAL_STATES:
+            with self.lock:
+                self.open_items.get(job_id, set()).discard(key)
+        self._append([{'job': job_id, 'event': 'item', 'key': key, 'state': state, **fields}])
+
+    def resume_job(self, job):
+        """Track the open items of a job returned by unfinished()"""
+        self.open_items[job['job']] = set(job['items'])
+
+    def finish_job(self, job_id):
+        """
+        Mark a job as done once every item reached a final state.
+        
+        Returns:
+            bool: False if items are still open, so the job stays resumable
+        """
+        if self.open_items.get(job_id):
             return False
-    
-    def get_password(self, hostname, username):
-        """Get password from system keyring"""
+        self.open_items.pop(job_id, None)
+        self._append([{'job': job_id, 'event': 'finish'}])
+        return True
+
+    def _read(self):
+        """Read all entries, skipping a line cut short by a crash"""
+        entries = []
         try:
-            key = f"{hostname}:{username}"
-            return keyring.get_password(self.keyring_service, key)
-        except Exception as e:
-            print(f"Failed to get password: {e}")
-            return None
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to read job journal: {e}")
+        return entries
 
-    def load_servers(self):
-        """Load saved server configurations"""
+    def unfinished(self):
+        """
+        Replay the journal into the jobs that never finished.
+        
+        Returns:
+            list: Job dicts (the start entry's fields plus 'items', a dict of
+                  item key -> merged item fields) with only the items that
+                  have not reached a final state
+        """
+        jobs = {}
+        for entry in self._read():
+            job_id = entry.get('job')
+            if entry.get('event') == 'start':
+                jobs[job_id] = dict(entry, items={})
+            elif entry.get('event') == 'finish':
+                jobs.pop(job_id, None)
+            elif entry.get('event') == 'item' and job_id in jobs:
+                item = jobs[job_id]['items'].setdefault(entry['key'], {})
+                item.update({name: value for name, value in entry.items() if name not in ('job', 'event')})
+        
+        for job in jobs.values():
+            job['items'] = {key: item for key, item in job['items'].items()
+                            if item.get('state') not in self.FINAL_STATES}
+        return [job for job in jobs.values() if job['items']]
+
+    def compact(self):
+        """Rewrite the journal keeping only the entries of unfinished jobs"""
+        unfinished = {job['job'] for job in self.unfinished()}
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return {
-                        server['hostname']: server['username']
-                        for server in config.get('servers', [])
-                    }
-        except Exception as e:
-            print(f"Failed to load config: {e}")
-        return {}
+            with self.lock:
+                entries = [entry for entry in self._read() if entry.get('job') in unfinished]
+                temp_file = self.journal_file + ".tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry) + "\n")
+                os.replace(temp_file, self.journal_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to compact job journal: {e}")
 
 class CreateSnapshotsDialog(QDialog):
     def __init__(self, parent=None):
@@ -1764,94 +4498,307 @@ class CleanTextEdit(QTextEdit):
             super().insertFromMimeData(source)
 
 class AutoConnectWorker(QThread):
-    """Worker thread for auto-connecting to saved vCenters"""
+    """
+    Worker thread for auto-connecting to saved vCenters.
+    
+    All saved servers are connected at once in a bounded pool, each with its
+    own timeout, and every connection is reported as soon as it is up, so
+    unreachable servers no longer hold up the reachable ones.
+    """
     progress = pyqtSignal(str)  # status message
     connection_made = pyqtSignal(str, object, dict)  # hostname, service_instance, credentials
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, saved_servers, config_manager):
+    def __init__(self, saved_servers, config_manager, max_workers=AUTO_CONNECT_WORKERS, timeout=CONNECT_TIMEOUT,
+                 reuse_sessions=False):
         super().__init__()
         self.saved_servers = saved_servers
         self.config_manager = config_manager
+        self.max_workers = max_workers
+        self.timeout = timeout  # Per-connection timeout in seconds
+        self.reuse_sessions = reuse_sessions  # Resume sessions saved in the keyring before logging in
 
     def run(self):
         try:
-            # Set socket timeout for all connections in this thread
-            socket.setdefaulttimeout(10.0)  # Increased to 10 seconds
-            
-            servers = list(self.saved_servers.items())
-            total = len(servers)
-            connected = 0
-            
-            for hostname, username in servers:
+            # Keyring access stays on this thread; only the logins run in the pool
+            servers = []
+            for hostname, username in self.saved_servers.items():
                 password = self.config_manager.get_password(hostname, username)
                 if password:
-                    try:
-                        connected += 1
-                        self.progress.emit(f"Auto-connecting to {hostname}... ({connected}/{total})")
-                        
-                        # Create SSL context that ignores verification
-                        context = ssl.create_default_context()
-                        context.check_hostname = False
-                        context.verify_mode = ssl.CERT_NONE
-                        
-                        # Disable SSL verification warnings
-                        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                        
-                        si = SmartConnect(
-                            host=hostname,
-                            user=username,
-                            pwd=password,
-                            sslContext=context,
-                            disableSslCertValidation=True
-                        )
-                        
+                    session_id = self.config_manager.get_session(hostname, username) if self.reuse_sessions else None
+                    servers.append((hostname, username, password, session_id))
+            total = len(servers)
+            done = 0
+            
+            if servers:
+                self.progress.emit(f"Auto-connecting to {total} vCenters...")
+                with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, total))) as executor:
+                    futures = {
+                        executor.submit(self.connect, *server): server
+                        for server in servers
+                    }
+                    for future in as_completed(futures):
+                        hostname, username, password, session_id = futures[future]
+                        done += 1
+                        self.progress.emit(f"Auto-connecting... {hostname} done ({done}/{total})")
+                        si = future.result()
                         if si:
+                            if self.reuse_sessions and si._stub.GetSessionId() != session_id:
+                                self.config_manager.save_session(hostname, username, si._stub.GetSessionId())
                             credentials = {'username': username, 'password': password}
                             self.connection_made.emit(hostname, si, credentials)
-                        else:
-                            self.error.emit(f"Failed to connect to {hostname}: No service instance returned")
-                    except socket.timeout:
-                        self.error.emit(f"Connection to {hostname} timed out after 10 seconds")
-                        # Continue with next server
-                    except socket.gaierror as e:
-                        self.error.emit(f"Cannot resolve hostname {hostname}: {str(e)}")
-                        # Continue with next server
-                    except ConnectionRefusedError as e:
-                        self.error.emit(f"Connection refused by {hostname}: {str(e)}")
-                        # Continue with next server
-                    except Exception as e:
-                        # Log but don't crash - continue with next server
-                        self.error.emit(f"Failed to auto-connect to {hostname}: {type(e).__name__}: {str(e)}")
-                        # Continue with next server
             
             self.finished.emit()
         except Exception as e:
             self.error.emit(f"Auto-connect error: {str(e)}")
+
+    def connect(self, hostname, username, password, session_id=None):
+        """
+        Connect to one saved vCenter on a pool thread.
+        
+        A saved session is resumed if it is still valid; otherwise a full
+        login is made. Failures are reported through the error signal and
+        never raised, so one bad server doesn't affect the others.
+        
+        Returns:
+            vim.ServiceInstance or None
+        """
+        if session_id:
+            try:
+                si = resume_vcenter_session(hostname, session_id, self.timeout)
+                if si:
+                    return si
+            except Exception as e:
+                logging.getLogger('pySnap').info(f"Saved session for {hostname} not usable: {str(e)}")
+        
+        try:
+            si = connect_vcenter(hostname, username, password, self.timeout)
+            if not si:
+                self.error.emit(f"Failed to connect to {hostname}: No service instance returned")
+            return si
+        except socket.timeout:
+            self.error.emit(f"Connection to {hostname} timed out after {self.timeout} seconds")
+        except socket.gaierror as e:
+            self.error.emit(f"Cannot resolve hostname {hostname}: {str(e)}")
+        except ConnectionRefusedError as e:
+            self.error.emit(f"Connection refused by {hostname}: {str(e)}")
+        except Exception as e:
+            # Log but don't crash - the other servers carry on
+            self.error.emit(f"Failed to auto-connect to {hostname}: {type(e).__name__}: {str(e)}")
+        return None
+
+# Seconds between health checks of a working connection. Each check is also the
+# keepalive that stops vCenter from expiring an idle session (30 minutes by default).
+HEALTH_CHECK_INTERVAL = 120
+
+# Seconds a health check's keepalive call or reconnect may take
+HEALTH_CHECK_TIMEOUT = CONNECT_TIMEOUT
+
+# Reconnect attempts back off exponentially from the first to the last delay
+RECONNECT_BACKOFF_MIN = 15
+RECONNECT_BACKOFF_MAX = 900
+
+class ConnectionHealthMonitor(QThread):
+    """
+    Background health checks, keepalive and reconnects for vCenter connections.
+    
+    Every tracked connection is checked with a cheap read of its current
+    session on a schedule, off the GUI thread, and the result is cached per host so the
+    window can show connection state without making any call itself. A lost
+    connection is logged back in with its credentials, backing off
+    exponentially between failed attempts.
+    
+    Each check runs on its own daemon thread with a bounded timeout and is
+    never joined, so a hung vCenter holds up neither the other vCenters'
+    checks nor stopping the monitor.
+    """
+    health_changed = pyqtSignal(str, str)  # hostname, 'ok' / 'reconnecting' / 'down'
+    reconnected = pyqtSignal(str, object)  # hostname, new service_instance
+    connection_lost = pyqtSignal(str)  # hostname that can't be reconnected (no credentials)
+
+    def __init__(self, interval=HEALTH_CHECK_INTERVAL, backoff_min=RECONNECT_BACKOFF_MIN,
+                 backoff_max=RECONNECT_BACKOFF_MAX, max_workers=AUTO_CONNECT_WORKERS,
+                 timeout=HEALTH_CHECK_TIMEOUT, clone=clone_service_instance):
+        super().__init__()
+        self.interval = interval
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.max_workers = max_workers  # Checks running at the same time
+        self.timeout = timeout
+        self.clone = clone  # Builds the probe connection, with the check timeout, on a tracked session
+        self.logger = logging.getLogger('pySnap')
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.hosts = {}  # hostname -> dict(si, credentials, state, failures, next_check)
+        self.in_flight = set()  # Hostnames being checked
+        self._stop_requested = False
+
+    def track(self, hostname, si, credentials=None):
+        """Start monitoring a connection that was just made (assumed healthy)"""
+        with self.lock:
+            self.hosts[hostname] = {
+                'si': si, 'credentials': credentials, 'state': 'ok',
+                'failures': 0, 'next_check': time.monotonic() + self.interval
+            }
+
+    def forget(self, hostname=None):
+        """Stop monitoring one connection, or all of them"""
+        with self.lock:
+            if hostname is None:
+                self.hosts.clear()
+            else:
+                self.hosts.pop(hostname, None)
+
+    def health(self, hostname):
+        """
+        Cached health of a connection; never makes a server call.
+        
+        Returns:
+            str: 'ok', 'reconnecting', 'down' or 'unknown' if not tracked
+        """
+        with self.lock:
+            host = self.hosts.get(hostname)
+            return host['state'] if host else 'unknown'
+
+    def check_now(self):
+        """Check every connection right away"""
+        with self.lock:
+            for host in self.hosts.values():
+                host['next_check'] = 0
+        self.wakeup.set()
+
+    def stop(self):
+        """Ask the monitor to stop; it exits without waiting for checks in progress"""
+        self._stop_requested = True
+        self.wakeup.set()
+
+    def run(self):
+        while not self._stop_requested:
+            now = time.monotonic()
+            with self.lock:
+                due = [hostname for hostname, host in self.hosts.items()
+                       if host['next_check'] <= now and hostname not in self.in_flight]
+                due = due[:max(0, self.max_workers - len(self.in_flight))]
+                self.in_flight.update(due)
+                if len(self.in_flight) < self.max_workers:
+                    next_check = min((host['next_check'] for hostname, host in self.hosts.items()
+                                      if hostname not in self.in_flight), default=now + self.interval)
+                else:
+                    next_check = now + self.interval  # A finishing check wakes the loop
+            
+            # Hosts are checked in parallel so one slow vCenter doesn't delay the rest
+            for hostname in due:
+                threading.Thread(target=self.run_check, args=(hostname,), daemon=True).start()
+            
+            self.wakeup.wait(max(0.0, next_check - now))
+            self.wakeup.clear()
+
+    def run_check(self, hostname):
+        """Check one host on its own thread and let the loop schedule it again"""
+        try:
+            self.check_host(hostname)
+        except Exception as e:
+            self.logger.error(f"Health check of {hostname} failed: {str(e)}")
         finally:
-            # Reset socket timeout to default
-            socket.setdefaulttimeout(None)
+            with self.lock:
+                self.in_flight.discard(hostname)
+            self.wakeup.set()
+
+    def check_host(self, hostname):
+        """
+        Check one connection and reconnect it if it is gone. Runs on a pool thread.
+        
+        Args:
+            hostname (str): vCenter hostname
+        """
+        with self.lock:
+            host = self.hosts.get(hostname)
+            if host is None:
+                return
+            si, credentials, failures = host['si'], host['credentials'], host['failures']
+        
+        # A healthy session only needs the keepalive call. Reading the current
+        # session both keeps it alive and shows whether it has expired; calls
+        # like CurrentTime() still succeed on an expired session. The call goes
+        # through a probe connection on the same session with the check timeout.
+        if failures == 0:
+            try:
+                probe = self.clone(si, timeout=self.timeout)
+                if probe.RetrieveContent().sessionManager.currentSession is not None:
+                    self.update_host(hostname, si, 'ok', 0)
+                    return
+                self.logger.warning(f"Session on {hostname} has expired")
+            except Exception as e:
+                self.logger.warning(f"Connection to {hostname} lost: {str(e)}")
+        
+        if not credentials:
+            # No credentials available, the connection can't be restored
+            self.forget(hostname)
+            self.connection_lost.emit(hostname)
+            return
+        
+        self.update_host(hostname, si, 'reconnecting', failures)
+        try:
+            new_si = connect_vcenter(hostname, credentials['username'], credentials['password'], self.timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to reconnect to {hostname}: {str(e)}")
+            new_si = None
+        
+        if new_si:
+            self.logger.info(f"Successfully reconnected to {hostname}")
+            self.update_host(hostname, new_si, 'ok', 0)
+            self.reconnected.emit(hostname, new_si)
+        else:
+            self.update_host(hostname, si, 'down', failures + 1)
+
+    def update_host(self, hostname, si, state, failures):
+        """Cache a check result and schedule the next check"""
+        if failures:
+            delay = min(self.backoff_max, self.backoff_min * 2 ** (failures - 1))
+        else:
+            delay = self.interval
+        
+        with self.lock:
+            host = self.hosts.get(hostname)
+            if host is None:
+                return  # Forgotten while the check ran
+            changed = host['state'] != state
+            host.update(si=si, state=state, failures=failures, next_check=time.monotonic() + delay)
+        if changed:
+            self.health_changed.emit(hostname, state)
 
-class SnapshotCreateWorker(QThread):
+class SnapshotCreateWorker(QThread, SnapshotRecordBuilder):
     progress = pyqtSignal(int, int, str)  # completed, total, message
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    snapshot_created = pyqtSignal(dict)  # Changed from str to dict to include snapshot details for caching
+    snapshot_created = pyqtSignal(object)  # SnapshotRecord, or {'vm_name': ...} if the snapshot wasn't found
 
-    def __init__(self, vcenter_connections, servers, description, memory=False, vcenter_username=None):
+    def __init__(self, sessions, servers, description, memory=False, vcenter_username=None,
+                 vm_index=None, window_size=4, max_window_size=16, per_host_limit=None,
+                 per_datastore_limit=None, journal=None, job=None):
         super().__init__()
-        self.vcenter_connections = vcenter_connections
+        self.sessions = sessions  # SessionRegistry of connected vCenters
+        self.vm_index = vm_index or VMNameIndex()  # Shared with the window to reuse its cached indexes
         self.servers = servers
         self.description = description
         self.memory = memory
         self.vcenter_username = vcenter_username or getpass.getuser()  # Fallback to system user
-        self.batch_size = 5  # Process 5 servers per vCenter at a time
+        self.window_size = window_size  # Initial creates in flight per vCenter
+        self.max_window_size = max_window_size
+        # Optional caps on creates in flight per ESXi host / datastore
+        self.placement_limits = {'host': per_host_limit, 'datastore': per_datastore_limit}
+        self.completed = 0  # Finished servers, successful or not
+        self.succeeded = 0
+        self.failed = []
+        self.lock = threading.Lock()
+        self.journal = journal  # Optional JobJournal recording every task
+        self.job = job  # Unfinished journal job to resume instead of resolving servers
+        self.job_id = job['job'] if job else None
 
     def run(self):
         total = len(self.servers)
-        completed = 0
-        failed = []
+        failed = self.failed
         
         # Show initial progress
         ProgressTracker.emit_progress(
@@ -1859,28 +4806,29 @@ class SnapshotCreateWorker(QThread):
             "Locating", "VMs"
         )
         
-        # Group servers by vCenter
-        servers_by_vcenter = {}
-        for i, server in enumerate(self.servers, 1):
-            # Update progress during VM discovery
-            ProgressTracker.emit_progress(
-                self.progress, i-1, total,
-                "Finding", f"{server}"
-            )
+        if self.job:
+            servers_by_vcenter = self.resume_servers()
+        else:
+            # Group servers by vCenter, resolving all names against one index per vCenter
+            try:
+                with self.sessions.lease_all() as connections:
+                    servers_by_vcenter, not_found = self.vm_index.resolve(connections, self.servers)
+            except Exception as e:
+                self.error.emit(f"Error locating VMs: {str(e)}")
+                self.finished.emit()
+                return
+            for server in not_found:
+                self.item_failed(f"Server not found: {server}")
+            servers_by_vcenter = self.drop_duplicate_vms(servers_by_vcenter)
             
-            # Find which vCenter the VM belongs to
-            found = False
-            for si in self.vcenter_connections.values():
-                vm = self.find_vm_in_vcenter(si, server)
-                if vm:
-                    vcenter = si._stub.host
-                    if vcenter not in servers_by_vcenter:
-                        servers_by_vcenter[vcenter] = []
-                    servers_by_vcenter[vcenter].append((vm, server))
-                    found = True
-                    break
-            if not found:
-                failed.append(f"Server not found: {server}")
+            if self.journal is not None and servers_by_vcenter:
+                self.job_id = self.journal.start_job(
+                    'create',
+                    [(self.item_key(vcenter, vm), {'vcenter': vcenter, 'vm_moref': vm._moId, 'server': server,
+                                                   'snapshot_moref': None})
+                     for vcenter, server_list in servers_by_vcenter.items() for vm, server in server_list],
+                    description=self.description, memory=self.memory, username=self.vcenter_username
+                )
 
         if not servers_by_vcenter:
             self.error.emit("No VMs were found in any connected vCenter")
@@ -1894,169 +4842,249 @@ class SnapshotCreateWorker(QThread):
             "Creating", f"Found {found_count}"
         )
 
-        # Process each vCenter's servers in batches
-        active_tasks = {}  # {task: (server_name, vcenter_name)}
+        # Every vCenter runs its own sliding window, so one slow site doesn't
+        # hold up the others
+        with ThreadPoolExecutor(max_workers=len(servers_by_vcenter)) as executor:
+            futures = {
+                executor.submit(self.create_on_vcenter, vcenter, server_list): vcenter
+                for vcenter, server_list in servers_by_vcenter.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(f"Error monitoring snapshots on {futures[future]}: {str(e)}")
         
-        for vcenter, server_list in servers_by_vcenter.items():
-            ProgressTracker.emit_progress(
-                self.progress, completed, total,
-                "Creating", f"{vcenter}"
-            )
-            
-            for i in range(0, len(server_list), self.batch_size):
-                batch = server_list[i:i + self.batch_size]
-                batch_servers = [s[1] for s in batch]
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Batch", f"{len(batch_servers)} VMs"
-                )
-                
-                # Start snapshot creation for batch
-                for vm, server in batch:
-                    try:
-                        # Add creator information to description using vCenter username
-                        description_with_creator = f"{self.description} (Created by: {self.vcenter_username})"
-                        
-                        task = vm.CreateSnapshot_Task(
-                            name=f"Monthly OS Patching",
-                            description=description_with_creator,
-                            memory=self.memory,
-                            quiesce=False
-                        )
-                        active_tasks[task] = (server, vcenter)
-                    except Exception as e:
-                        failed.append(f"Error creating snapshot for {server}: {str(e)}")
-
-                # Monitor tasks
-                while active_tasks:
-                    for task in list(active_tasks.keys()):
-                        server, vcenter = active_tasks[task]
-                        try:
-                            if task.info.state == vim.TaskInfo.State.success:
-                                completed += 1
-                                # Get the snapshot we just created
-                                snapshot_obj = None
-                                if vm.snapshot:
-                                    # Find the snapshot that was just created
-                                    for snapshot in self.get_snapshots(vm.snapshot.rootSnapshotList):
-                                        if snapshot.name == "Monthly OS Patching" and format_vmware_time(snapshot.createTime)[:10] == datetime.now().strftime('%Y-%m-%d'):
-                                            snapshot_obj = snapshot
-                                            break
-                                
-                                if snapshot_obj:
-                                    # Get creator information from description
-                                    # VMware snapshots don't have a built-in createdBy property
-                                    created_by = self.extract_creator_from_description(snapshot_obj.description)
-                                    
-                                    # Emit snapshot details in the same format as SnapshotFetchWorker
-                                    # This enables caching by directly adding to the tree without refetching
-                                    self.snapshot_created.emit({
-                                        'vm_name': vm.name,
-                                        'vcenter': vcenter,
-                                        'name': snapshot_obj.name,
-                                        'created': format_vmware_time(snapshot_obj.createTime),
-                                        'created_by': created_by,
-                                        'description': snapshot_obj.description or '',
-                                        'snapshot': snapshot_obj,
-                                        'vm': vm,
-                                        'has_children': bool(snapshot_obj.childSnapshotList),
-                                        'is_child': hasattr(snapshot_obj, 'parent') and snapshot_obj.parent is not None
-                                    })
-                                else:
-                                    # If we can't find the snapshot object, just emit the server name
-                                    # This ensures backward compatibility
-                                    self.snapshot_created.emit({'vm_name': server})
-                                
-                                ProgressTracker.emit_progress(
-                                    self.progress, completed, total,
-                                    "Created", f"{(completed/total)*100:.1f}%"
-                                )
-                                del active_tasks[task]
-                            elif task.info.state == vim.TaskInfo.State.error:
-                                failed.append(f"Failed: {server}: {task.info.error.msg}")
-                                del active_tasks[task]
-                            else:
-                                # Show individual task progress
-                                task_progress = task.info.progress or 0
-                                active_count = len(active_tasks)
-                                ProgressTracker.emit_progress(
-                                    self.progress, completed, total,
-                                    "Working", f"{server} ({task_progress}%)"
-                                )
-                        except Exception as e:
-                            failed.append(f"Error monitoring {server}: {str(e)}")
-                            del active_tasks[task]
-                    time.sleep(0.5)
+        # Items left open (e.g. a vCenter dropped) keep the job resumable
+        if self.journal is not None and self.job_id:
+            self.journal.finish_job(self.job_id)
 
         # Final status
         if failed:
             self.error.emit("\n".join(failed))
+        failed_count = self.completed - self.succeeded
         ProgressTracker.emit_progress(
-            self.progress, completed, total,
-            "Complete", f"{completed} done" + (f", {len(failed)} failed" if failed else "")
+            self.progress, self.completed, total,
+            "Complete", f"{self.succeeded} created" + (f", {failed_count} failed" if failed_count else "")
         )
         self.finished.emit()
 
-    def find_vm_in_vcenter(self, si, name):
-        """Find VM by name in a specific vCenter"""
-        content = si.RetrieveContent()
-        container = content.viewManager.CreateContainerView(
-            content.rootFolder, [vim.VirtualMachine], True
-        )
-        for vm in container.view:
-            if vm.name.lower() == name.lower():
-                return vm
-        container.Destroy()
-        return None
-
-    def find_vm(self, name):
-        """Find VM by name across all connected vCenters"""
-        for si in self.vcenter_connections.values():
-            vm = self.find_vm_in_vcenter(si, name)
-            if vm:
-                return vm
-        return None
+    def create_on_vcenter(self, vcenter, server_list):
+        """
+        Create snapshots on one vCenter through a sliding window.
         
-    def get_snapshots(self, snapshots):
-        """Helper method to traverse snapshot tree"""
-        result = []
-        for snapshot in snapshots:
-            result.append(snapshot)
-            result.extend(self.get_snapshots(snapshot.childSnapshotList))
-        return result
-    
-    def extract_creator_from_description(self, description):
+        A new create is submitted as soon as one finishes, instead of draining
+        fixed batches, and the window is resized from observed task latency
+        and failures. Runs on a pool thread with a connection leased for it.
+        
+        Args:
+            vcenter (str): vCenter hostname
+            server_list (list): (VM, server name) tuples on that vCenter
         """
-        Extract creator information from snapshot description.
+        with self.sessions.lease(vcenter) as si:
+            window = AdaptiveWindow(self.window_size, maximum=self.max_window_size)
+            # Resolved VMs are bound to whichever stub built the name index
+            server_list = [(vim.VirtualMachine(vm._moId, si._stub), server) for vm, server in server_list]
+            limiter = PlacementLimiter.lookup(si, [vm for vm, _ in server_list], self.placement_limits)
+            pending = list(server_list)
+            monitor = TaskMonitor(si)
+            
+            # Add creator information to description using vCenter username
+            description_with_creator = f"{self.description} (Created by: {self.vcenter_username})"
+            
+            created = []  # (VM, server name, new snapshot MoRef) finished in the current wave
+            
+            def finished(vm, server, started, task, state, result, error):
+                window.record(time.monotonic() - started, state == vim.TaskInfo.State.success)
+                limiter.release(vm._moId)
+                if state == vim.TaskInfo.State.success:
+                    self.journal_update(vcenter, vm, state, snapshot_moref=result._moId if result is not None else None)
+                    created.append((vm, server, result))
+                else:
+                    self.journal_update(vcenter, vm, state)
+                    self.item_failed(f"Failed: {server}: {error}")
+            
+            # Reattach to tasks submitted before the app stopped
+            for vm, server in list(pending):
+                task_moref = self.job['items'][self.item_key(vcenter, vm)].get('task_moref') if self.job else None
+                if task_moref:
+                    pending.remove((vm, server))
+                    limiter.acquire(vm._moId)
+                    monitor.watch(vim.Task(task_moref, si._stub), partial(finished, vm, server, time.monotonic()),
+                                  partial(self.on_task_progress, server))
+            
+            try:
+                while pending or monitor.tasks:
+                    # Top the window up with VMs whose host/datastore has room
+                    index = 0
+                    while index < len(pending) and len(monitor.tasks) < window.size:
+                        vm, server = pending[index]
+                        if not limiter.has_room(vm._moId):
+                            index += 1
+                            continue
+                        
+                        del pending[index]
+                        try:
+                            task = vm.CreateSnapshot_Task(
+                                name=f"Monthly OS Patching",
+                                description=description_with_creator,
+                                memory=self.memory,
+                                quiesce=False
+                            )
+                        except Exception as e:
+                            window.record(0, success=False)
+                            self.journal_update(vcenter, vm, 'error')
+                            self.item_failed(f"Error creating snapshot for {server}: {str(e)}")
+                            continue
+                        
+                        self.journal_update(vcenter, vm, 'running', task_moref=task._moId)
+                        limiter.acquire(vm._moId)
+                        monitor.watch(task, partial(finished, vm, server, time.monotonic()),
+                                      partial(self.on_task_progress, server))
+                    
+                    if not monitor.tasks:
+                        break  # Everything left failed to submit
+                    
+                    ProgressTracker.emit_progress(
+                        self.progress, self.completed, len(self.servers),
+                        "Creating", f"{vcenter}: {len(monitor.tasks)} running, window {window.size}"
+                    )
+                    monitor.wait()
+                    
+                    # Report everything that finished in this wave with one lookup
+                    if created:
+                        self.report_created(si, vcenter, created)
+                        created.clear()
+            finally:
+                monitor.close()
+
+    def resume_servers(self):
+        """
+        Rebuild the per-vCenter server list of a resumed journal job.
         
-        VMware snapshots don't have a built-in createdBy property,
-        so we look for creator information in the description field.
+        Returns:
+            dict: vCenter hostname -> list of (VM, server name) tuples
+        """
+        servers_by_vcenter = {}
+        for item in self.job['items'].values():
+            server = item['server']
+            if item['vcenter'] not in self.sessions:
+                self.item_failed(f"Not connected to {item['vcenter']}: {server}")
+                continue
+            # Bound to a connection in create_on_vcenter
+            vm = vim.VirtualMachine(item['vm_moref'])
+            servers_by_vcenter.setdefault(item['vcenter'], []).append((vm, server))
+        return servers_by_vcenter
+
+    def item_failed(self, message):
+        """Record a server whose snapshot failed; it counts as finished for progress"""
+        with self.lock:
+            self.completed += 1
+        self.failed.append(message)
+
+    @staticmethod
+    def item_key(vcenter, vm):
+        """Journal key of a VM's create; server names can repeat, VMs can't"""
+        return f"{vcenter}:{vm._moId}"
+
+    def drop_duplicate_vms(self, servers_by_vcenter):
+        """
+        Keep one create per VM when several server names resolved to it.
         
         Args:
-            description (str): The snapshot description
+            servers_by_vcenter (dict): vCenter hostname -> list of (VM, server name) tuples
             
         Returns:
-            str: The username who created the snapshot, or 'Unknown'
+            dict: The same mapping with repeated VMs left out
+        """
+        unique = {}
+        for vcenter, server_list in servers_by_vcenter.items():
+            seen = set()
+            for vm, server in server_list:
+                if vm._moId in seen:
+                    self.item_failed(f"Skipped duplicate server: {server}")
+                    continue
+                seen.add(vm._moId)
+                unique.setdefault(vcenter, []).append((vm, server))
+        return unique
+
+    def journal_update(self, vcenter, vm, state, **fields):
+        """Record an item's state change if a journal is kept"""
+        if self.journal is not None and self.job_id:
+            self.journal.update(self.job_id, self.item_key(vcenter, vm), state, **fields)
+
+    def report_created(self, si, vcenter, created):
         """
-        if not description:
-            return 'Unknown'
+        Emit records for the snapshots created in one completion wave.
         
-        import re
+        Each task's result is the new snapshot's MoRef. Name, description and
+        creation time only exist in the VM's snapshot tree, so the trees of just
+        the VMs in this wave are read in one batched call and the new node is
+        picked out by MoRef.
         
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'Created by:\s*(\w+)',
-            r'\(Created by:\s*(\w+)\)',
-            r'User:\s*(\w+)',
-            r'By:\s*(\w+)'
-        ]
+        Args:
+            si: Connected ServiceInstance for the vCenter
+            vcenter (str): vCenter hostname
+            created (list): (VM, server name, snapshot MoRef) tuples
+        """
+        total = len(self.servers)
+        with self.lock:
+            self.completed += len(created)
+            self.succeeded += len(created)
+            completed = self.completed
         
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        try:
+            properties = retrieve_object_properties(
+                si, [vm for vm, _, _ in created], vim.VirtualMachine, SNAPSHOT_VM_PROPERTIES
+            )
+        except Exception as e:
+            properties = {}
+            self.failed.append(f"Error reading new snapshots on {vcenter}: {str(e)}")
         
-        return 'Unknown'
+        for vm, server, snapshot_ref in created:
+            props = properties.get(vm._moId, {})
+            node = self.find_snapshot(props.get('snapshot'), snapshot_ref)
+            
+            if node:
+                # Emit snapshot details in the same format as SnapshotFetchWorker
+                # This enables caching by directly adding to the tree without refetching
+                self.snapshot_created.emit(
+                    self.build_snapshot_record(vcenter, vm, props.get('name', server), node)
+                )
+            else:
+                # If we can't find the snapshot object, just emit the server name
+                # This ensures backward compatibility
+                self.snapshot_created.emit({'vm_name': server})
+        
+        ProgressTracker.emit_progress(
+            self.progress, completed, total,
+            "Created", f"{(completed/total)*100:.1f}%"
+        )
+
+    def find_snapshot(self, snapshot_info, snapshot_ref):
+        """
+        Find the tree node for a snapshot MoRef.
+        
+        Args:
+            snapshot_info: vim.vm.SnapshotInfo of the VM, or None
+            snapshot_ref: vim.vm.Snapshot returned by the create task, or None
+            
+        Returns:
+            SnapshotNode or None
+        """
+        if not snapshot_info or snapshot_ref is None:
+            return None
+        for node in walk_snapshot_tree(snapshot_info.rootSnapshotList):
+            if node.snapshot.snapshot._moId == snapshot_ref._moId:
+                return node
+        return None
+
+    def on_task_progress(self, server, task, percent):
+        """Show a running creation task's progress"""
+        ProgressTracker.emit_progress(
+            self.progress, self.completed, len(self.servers),
+            "Working", f"{server} ({percent}%)"
+        )
 
 
 def handle_exception(exc_type, exc_value, exc_traceback):